@@ -1,6 +1,10 @@
+import asyncio
 from langchain_core.prompts import ChatPromptTemplate
-from ..tools.hf import make_chat
-from ..tools.repo_context import summarize_repo
+from ..tools.hf import make_chat, cache_prompt
+from ..tools.repo_context import repo_fingerprint, summarize_repo_cached
+from ..tools.llm_cache import cached_invoke
+from ..tools.file_operations import write_files_batch
+from ..state import log
 
 
 architect_prompt = ChatPromptTemplate.from_messages([
@@ -16,20 +20,15 @@ Return RAW Markdown, no backticks.
 ])
 
 
-def _write_artifact(repo_path: str, rel: str, content: str):
-    import os
-    path = os.path.join(repo_path, rel)
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)    
-
-def architect_node(state):
+async def architect_node(state):
     chat = make_chat("architecture")  # Use architecture-optimized config
-    repo = summarize_repo(state["repo_path"])[:4000]
-    out = chat.invoke(architect_prompt.format_messages(prd=state["prd"], repo=repo)).content
-    state["rfc"] = out
-    state["logs"].append("Architect: RFC produced")
-    # Persist artifacts
-    _write_artifact(state["repo_path"], ".agent/PRD.md", state["prd"])
-    _write_artifact(state["repo_path"], ".agent/RFC.md", state["rfc"])
-    return state
+    fingerprint = repo_fingerprint(state["repo_path"])
+    repo = summarize_repo_cached(state["repo_path"], 4000, fingerprint)
+    messages = architect_prompt.format_messages(prd=state["prd"], repo=repo)
+    # System block is static; the repo summary is only worth a breakpoint once it is large
+    out = (await asyncio.to_thread(cached_invoke, chat, cache_prompt(messages, "architecture", human_min_tokens=1024))).content
+    update = {"rfc": out, "logs": []}
+    log(update, "Architect: RFC produced")
+    # Persist artifacts (one .agent directory creation for both)
+    write_files_batch(state["repo_path"], [(".agent/PRD.md", state["prd"]), (".agent/RFC.md", out)])
+    return update
@@ -1,23 +1,25 @@
-from langchain_core.prompts import ChatPromptTemplate
+import asyncio
+import re
 from ..tools.git_tools import ensure_branch
-from ..tools.hf import make_chat_for_language
-from ..tools.file_operations import analyze_project_structure, read_file_content, write_file_content
+from ..tools.hf import make_chat_for_language, select_best_model_for_language, cache_prompt, cache_usage
+from ..tools.fast_prompt import SplitPrompt
+from ..tools.llm_cache import stream_response
+from ..tools import fast_json
+from ..tools.json_extract import ArrayItemScanner, extract_first_json
+from ..tools.file_operations import analyze_project_structure, invalidate_project_analysis, read_file_content, write_file_content, write_files_batch
 from ..tools.dependency_manager import setup_project_dependencies
 from ..tools.language_detector import detect_language_from_request
+from ..state import log
 
 
-dev_prompt = ChatPromptTemplate.from_messages([
-    ("system", """
-    You are a Senior Developer. Generate code based on the RFC and project analysis.
-    
-    Project Analysis: {project_analysis}
-    RFC: {rfc}
-    Tasks: {tasks}
+dev_prompt = SplitPrompt(
+    """
+    You are a Senior Developer. Generate code based on the RFC and project analysis provided by the user.
     
     Based on the analysis, generate the necessary code files for the detected language and framework.
     
     CRITICAL: You must return ONLY valid JSON. Do not include any markdown, explanations, or formatting.
-    Start your response with {{ and end with }}.
+    Start your response with { and end with }.
     
     IMPORTANT: When writing file content, escape special characters properly:
     - Use \\n for newlines
@@ -32,15 +34,15 @@ dev_prompt = ChatPromptTemplate.from_messages([
     - Module name in go.mod should be simple (e.g., "myapp", "go-server")
     
     Use this exact format:
-    {{
+    {
         "files": [
-            {{
+            {
                 "path": "relative/path/to/file.ext",
                 "content": "// Full file content here\\ncode..."
-            }}
+            }
         ],
         "summary": "Brief summary of changes made"
-    }}
+    }
     
     Guidelines by language:
     - Python: Use proper imports, type hints, docstrings, and follow PEP 8
@@ -51,120 +53,162 @@ dev_prompt = ChatPromptTemplate.from_messages([
     - Rust: Use proper modules, error handling with Result types, and Rust idioms
     
     Always include appropriate tests and documentation files.
-    """),
-    ("human", "Generate the code files needed for: {request}. Language context: {language}. Remember: Return ONLY valid JSON, no markdown or explanations.")
-])
+    """,
+    # Session-stable fields first, the per-turn request last
+    "Analysis: {project_analysis}\nRFC: {rfc}\nTasks: {tasks}\nLanguage: {language}\nRequest: {request}\n\nGenerate the code files needed for the request. Remember: Return ONLY valid JSON, no markdown or explanations.",
+)
 
 
-def dev_node(state):
+async def dev_node(state):
     repo = state["repo_path"]
+    # Only this node's changes are returned; the graph merges them into the state
+    update = {"logs": []}
     if not state.get("branch"):
-        state["branch"] = ensure_branch(repo, "feat/auto-agent")
+        update["branch"] = ensure_branch(repo, "feat/auto-agent")
     
     # Track development attempts to prevent infinite loops
     dev_attempts = state.get("dev_attempts", 0) + 1
-    state["dev_attempts"] = dev_attempts
+    update["dev_attempts"] = dev_attempts
     
-    state["logs"].append(f"Dev: Starting development (attempt {dev_attempts})")
+    log(update, "Dev: Starting development (attempt %d)", dev_attempts)
     
+    project_analysis = None
     try:
         # Analyze the project structure
         project_analysis = analyze_project_structure(repo)
-        state["logs"].append(f"Dev: Analyzed project - Type: {project_analysis['project_type']}, Language: {project_analysis['primary_language']}")
+        log(update, "Dev: Analyzed project - Type: %s, Language: %s", project_analysis['project_type'], project_analysis['primary_language'])
         
         # Detect language from request if not detected from project
         detected_language = project_analysis.get("primary_language", "unknown")
         if detected_language == "unknown":
             detected_language = detect_language_from_request(state["request"]) or "python"
             project_analysis["primary_language"] = detected_language
-            state["logs"].append(f"Dev: Detected language from request: {detected_language}")
+            log(update, "Dev: Detected language from request: %s", detected_language)
         
         # Use LLM to generate code - select best model for the language
-        chat = make_chat_for_language(detected_language, "coding")
-        state["logs"].append(f"Dev: Using model for {detected_language} coding")
+        model_config = select_best_model_for_language(detected_language, "coding")
+        chat = make_chat_for_language(detected_language, "coding", model_config=model_config)
+        log(update, "Dev: Using model for %s coding", detected_language)
         
         msg = dev_prompt.format_messages(
-            project_analysis=str(project_analysis),
+            # Canonical JSON so dict ordering never changes the prompt prefix
+            project_analysis=fast_json.dumps(project_analysis, sort_keys=True),
             rfc=state.get("rfc", ""),
-            tasks=str(state.get("tasks", [])),
+            tasks=fast_json.dumps(state.get("tasks", []), sort_keys=True),
             request=state["request"],
             language=detected_language
         )
         
-        raw_response = chat.invoke(msg).content
-        state["logs"].append(f"Dev: LLM response received ({len(raw_response)} chars)")
+        # Write each file as soon as its object is complete in the stream
+        scanner = ArrayItemScanner()
+        streamed = {}
+        streamed_items = []
+        
+        def write_streamed(text):
+            for item in scanner.feed(text):
+                file_path = item.get("path")
+                if not isinstance(file_path, str) or "content" not in item:
+                    continue
+                streamed_items.append(item)
+                content = _normalize_content(update, file_path, item["content"])
+                streamed[file_path] = write_file_content(repo, file_path, content)
+        
+        response = await asyncio.to_thread(stream_response, chat, cache_prompt(msg, model_config), on_chunk=write_streamed)
+        raw_response = response.content
+        log(update, "Dev: LLM response received (%d chars)", len(raw_response))
+        usage = cache_usage(response)
+        if usage:
+            log(update, "Dev: Prompt cache %s", usage)
         
         # Parse the JSON response
-        import json
-        try:
-            data = json.loads(raw_response)
-        except json.JSONDecodeError as e:
-            state["logs"].append(f"Dev: JSON decode error: {e}")
-            # Try to extract JSON from response
-            start = raw_response.find("{")
-            end = raw_response.rfind("}") + 1
-            if start != -1 and end > start:
-                try:
-                    data = json.loads(raw_response[start:end])
-                    state["logs"].append("Dev: Successfully extracted JSON from response")
-                except json.JSONDecodeError as e2:
-                    state["logs"].append(f"Dev: Failed to parse extracted JSON: {e2}")
-                    state["logs"].append(f"Dev: Raw response (first 500 chars): {raw_response[:500]}")
-                    data = _generate_fallback_code(state, project_analysis)
-            else:
-                state["logs"].append("Dev: No JSON found in response, using fallback")
-                state["logs"].append(f"Dev: Raw response (first 500 chars): {raw_response[:500]}")
-                data = _generate_fallback_code(state, project_analysis)
+        data = extract_first_json(raw_response)
+        if data is None and streamed_items:
+            log(update, "Dev: Response JSON incomplete, keeping %d streamed files", len(streamed_items))
+            data = {"files": streamed_items}
+        elif data is None:
+            log(update, "Dev: No JSON found in response, using fallback")
+            log(update, "Dev: Raw response (first 500 chars): %.500s", raw_response)
+            data = _generate_fallback_code(state, project_analysis)
         
         # Write the generated files
         files_written = 0
+        ordered = []
+        pending = []
         for file_info in data.get("files", []):
             file_path = file_info["path"]
-            content = file_info["content"]
-            
-            # Handle case where LLM returns content as dict instead of string
-            if isinstance(content, dict):
-                if file_path.endswith(".json"):
-                    # For JSON files, convert dict to JSON string
-                    import json
-                    content = json.dumps(content, indent=2)
-                else:
-                    # For other files, this is likely malformed - try to extract string
-                    state["logs"].append(f"Dev: Warning - content for {file_path} is dict, attempting to fix")
-                    if isinstance(content, dict) and len(content) == 1:
-                        content = list(content.values())[0]
-                    else:
-                        content = str(content)
-            
-            if write_file_content(repo, file_path, content):
+            ordered.append(file_path)
+            if file_path not in streamed:
+                pending.append((file_path, _normalize_content(update, file_path, file_info["content"])))
+        
+        results = dict(streamed)
+        results.update(zip((file_path for file_path, _ in pending), write_files_batch(repo, pending)))
+        for file_path in ordered:
+            if results[file_path]:
                 files_written += 1
-                state["logs"].append(f"Dev: Created/updated {file_path}")
+                log(update, "Dev: Created/updated %s", file_path)
             else:
-                state["logs"].append(f"Dev: Failed to write {file_path}")
+                log(update, "Dev: Failed to write %s", file_path)
         
         summary = data.get("summary", "Code generation completed")
-        state["logs"].append(f"Dev: {summary} ({files_written} files)")
+        log(update, "Dev: %s (%d files)", summary, files_written)
         
         # Set up project dependencies
         if files_written > 0:
-            dep_code, dep_out = setup_project_dependencies(repo, project_analysis)
+            invalidate_project_analysis(repo)
+            update["project_analysis"] = None
+            update["last_test_fingerprint"] = ""
+            dep_code, dep_out = await asyncio.to_thread(setup_project_dependencies, repo, project_analysis)
             if dep_code == 0:
-                state["logs"].append("Dev: Dependencies installed successfully")
+                log(update, "Dev: Dependencies installed successfully")
             else:
-                state["logs"].append(f"Dev: Dependency setup failed: {dep_out[:200]}...")
+                log(update, "Dev: Dependency setup failed: %.200s...", dep_out)
         
     except Exception as e:
         import traceback
-        state["logs"].append(f"Dev: Error during development: {e}")
-        state["logs"].append(f"Dev: Traceback: {traceback.format_exc()}")
+        log(update, "Dev: Error during development: %s", e)
+        log(update, "Dev: Traceback: %s", traceback.format_exc())
         # Generate fallback code
-        project_analysis = analyze_project_structure(repo)
+        if project_analysis is None:
+            project_analysis = analyze_project_structure(repo)
         fallback_data = _generate_fallback_code(state, project_analysis)
         for file_info in fallback_data.get("files", []):
             if write_file_content(repo, file_info["path"], file_info["content"]):
-                state["logs"].append(f"Dev: Created fallback {file_info['path']}")
+                log(update, "Dev: Created fallback %s", file_info['path'])
+        invalidate_project_analysis(repo)
+        update["project_analysis"] = None
+        update["last_test_fingerprint"] = ""
     
-    return state
+    return update
+
+
+# Fallback project categories in priority order, with the request keywords that select them
+_FALLBACK_CATEGORIES = (
+    ("react", ("react", "dashboard", "frontend", "ui", "web app", "webapp")),
+    ("api", ("api", "rest", "endpoint", "health", "server")),
+    ("game", ("game", "tic-tac-toe", "tictactoe")),
+    ("web", ("web", "website")),
+)
+_CATEGORY_RANK = {category: rank for rank, (category, _) in enumerate(_FALLBACK_CATEGORIES)}
+_KW_TO_CATEGORY = {}
+for _category, _keywords in _FALLBACK_CATEGORIES:
+    for _keyword in _keywords:
+        _KW_TO_CATEGORY.setdefault(_keyword, _category)
+# Keywords must start a word ("ui" should not match inside "build"); longest first
+_KW_RE = re.compile(r"\b(" + "|".join(re.escape(k) for k in sorted(_KW_TO_CATEGORY, key=len, reverse=True)) + ")")
+
+
+def _normalize_content(state, file_path, content):
+    """Coerce file content the LLM returned as a dict into a string"""
+    if isinstance(content, dict):
+        if file_path.endswith(".json"):
+            # For JSON files, convert dict to JSON string
+            return fast_json.dumps(content, indent=True)
+        # For other files, this is likely malformed - try to extract string
+        log(state, "Dev: Warning - content for %s is dict, attempting to fix", file_path)
+        if len(content) == 1:
+            return list(content.values())[0]
+        return str(content)
+    return content
 
 
 def _generate_fallback_code(state, project_analysis):
@@ -173,15 +217,17 @@ def _generate_fallback_code(state, project_analysis):
     language = project_analysis.get("primary_language", "python")
     
     # Import template generator
-    from ..tools.project_templates import get_template_files
+    from ..tools.project_templates import iter_template_files
     
-    # Determine project type from request
-    if any(keyword in request for keyword in ["react", "dashboard", "frontend", "ui", "web app", "webapp"]):
+    # Determine project type from request: one scan, highest-priority category wins
+    matched = {_KW_TO_CATEGORY[keyword] for keyword in _KW_RE.findall(request)}
+    category = min(matched, key=_CATEGORY_RANK.__getitem__, default=None)
+    if category == "react":
         if language in ["javascript", "typescript"]:
             project_type = "react"
         else:
             project_type = "basic"
-    elif any(keyword in request for keyword in ["api", "rest", "endpoint", "health", "server"]):
+    elif category == "api":
         if language == "python" and ("fastapi" in request or "fast" in request):
             project_type = "fastapi"
         elif language in ["javascript", "typescript"] and ("express" in request or "node" in request):
@@ -192,24 +238,16 @@ def _generate_fallback_code(state, project_analysis):
             project_type = "spring"
         else:
             project_type = "api"
-    elif any(keyword in request for keyword in ["game", "tic-tac-toe", "tictactoe"]):
+    elif category == "game":
         project_type = "game"
-    elif any(keyword in request for keyword in ["web", "website", "frontend"]):
+    elif category == "web":
         project_type = "web"
     else:
         project_type = "basic"
     
     try:
-        # Get template files from existing system
-        template_files = get_template_files(language, project_type)
-        
-        # Convert to the expected format
-        files = []
-        for path, content in template_files.items():
-            files.append({
-                "path": path,
-                "content": content
-            })
+        # Get template files from existing system, in the expected format
+        files = [template._asdict() for template in iter_template_files(language, project_type)]
         
         return {
             "files": files,
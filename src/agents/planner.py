@@ -1,8 +1,11 @@
-import json
+import asyncio
 from pydantic import BaseModel, Field
 from typing import List
-from langchain_core.prompts import ChatPromptTemplate
 from ..tools.hf import make_chat
+from ..tools.fast_prompt import SplitPrompt
+from ..tools.llm_cache import cached_invoke
+from ..tools.json_extract import extract_first_json
+from ..state import log
 
 
 class Task(BaseModel):
@@ -27,66 +30,45 @@ class PlannerOut(BaseModel):
     tasks: List[Task]
 
 
-planner_prompt = ChatPromptTemplate.from_messages([
-    ("system", """
+planner_prompt = SplitPrompt(
+    """
     You are the Planner.
     - Convert the user request into a concise PRD (markdown) and 3–6 atomic tasks.
     - Prefer small, independent tasks.
     - Output ONLY valid JSON with this exact format:
-    {{
+    {
       "prd_md": "# PRD\\n\\n## Goal\\n...markdown content...",
       "tasks": [
-        {{"id": "task1", "title": "Task description"}},
-        {{"id": "task2", "title": "Another task description"}}
+        {"id": "task1", "title": "Task description"},
+        {"id": "task2", "title": "Another task description"}
       ]
-    }}
-    """),
-    ("human", "{request}")
-])
+    }
+    """,
+    "{request}",
+)
 
 
-def planner_node(state):
+async def planner_node(state):
     chat = make_chat("planning")  # Use larger model for complex planning
     msg = planner_prompt.format_messages(request=state["request"])
-    raw = chat.invoke(msg).content
+    raw = (await asyncio.to_thread(cached_invoke, chat, msg, stream=True)).content
+    update = {"logs": []}
     
     # Log the raw response for debugging
-    state["logs"].append(f"Planner raw response: {raw[:200]}...")
+    log(update, "Planner raw response: %.200s...", raw)
     
-    try:
-        data = json.loads(raw)
-    except Exception as e:
-        state["logs"].append(f"JSON parse error: {e}")
-        # light repair attempt: extract JSON block
-        start = raw.find("{")
-        end = raw.rfind("}") + 1
-        if start == -1 or end == 0:
-            # No JSON found, create a fallback response
-            state["logs"].append("No JSON found, creating fallback response")
-            data = {
-                "prd_md": f"# PRD\n\nRequest: {state['request']}\n\n## Goal\nImplement the requested feature.\n\n## Acceptance Criteria\n- Feature implemented\n- Tests pass\n- Code follows standards",
-                "tasks": [
-                    {"id": "task1", "title": "Implement feature"},
-                    {"id": "task2", "title": "Add tests"},
-                    {"id": "task3", "title": "Update documentation"}
-                ]
-            }
-        else:
-            try:
-                extracted = raw[start:end]
-                state["logs"].append(f"Extracted JSON: {extracted[:200]}...")
-                data = json.loads(extracted)
-            except Exception as e2:
-                state["logs"].append(f"Extracted JSON parse error: {e2}")
-                # Final fallback
-                data = {
-                    "prd_md": f"# PRD\n\nRequest: {state['request']}\n\n## Goal\nImplement the requested feature.\n\n## Acceptance Criteria\n- Feature implemented\n- Tests pass\n- Code follows standards",
-                    "tasks": [
-                        {"id": "task1", "title": "Implement feature"},
-                        {"id": "task2", "title": "Add tests"},
-                        {"id": "task3", "title": "Update documentation"}
-                    ]
-                }
+    data = extract_first_json(raw)
+    if data is None:
+        # No JSON found, create a fallback response
+        log(update, "No JSON found, creating fallback response")
+        data = {
+            "prd_md": f"# PRD\n\nRequest: {state['request']}\n\n## Goal\nImplement the requested feature.\n\n## Acceptance Criteria\n- Feature implemented\n- Tests pass\n- Code follows standards",
+            "tasks": [
+                {"id": "task1", "title": "Implement feature"},
+                {"id": "task2", "title": "Add tests"},
+                {"id": "task3", "title": "Update documentation"}
+            ]
+        }
     
     # Convert tasks to the expected format
     if 'tasks' in data:
@@ -101,7 +83,7 @@ def planner_node(state):
         data['tasks'] = converted_tasks
     
     out = PlannerOut(**data)
-    state["prd"] = out.prd_md
-    state["tasks"] = [t.dict() for t in out.tasks]
-    state["logs"].append("Planner: PRD+tasks created")
-    return state
+    update["prd"] = out.prd_md
+    update["tasks"] = [t.dict() for t in out.tasks]
+    log(update, "Planner: PRD+tasks created")
+    return update
@@ -1,5 +1,3 @@
-def pr_node(state):
+async def pr_node(state):
     # TODO: integrate GitHub/GitLab API to open a PR and capture URL
-    state["pr_url"] = "(stub)"
-    state["logs"].append("PR: (stub) create PR")
-    return state
+    return {"pr_url": "(stub)", "logs": ["PR: (stub) create PR"]}
@@ -1,7 +1,8 @@
-import json
 from pydantic import BaseModel, Field
-from langchain_core.prompts import ChatPromptTemplate
 from ..tools.hf import make_chat
+from ..tools.fast_prompt import SplitPrompt
+from ..tools.llm_cache import cached_invoke
+from ..tools.json_extract import extract_first_json
 
 
 class RouteOut(BaseModel):
@@ -9,8 +10,8 @@ class RouteOut(BaseModel):
 	args: dict = Field(default_factory=dict)
 
 
-router_prompt = ChatPromptTemplate.from_messages([
-	("system", """
+router_prompt = SplitPrompt(
+	"""
 You are a strict router for a software-dev multi-agent system.
 Choose an intent from {plan, design, dev, tests, security, pr, status, help}.
 - plan: refine requirements and produce/patch PRD & tasks
@@ -22,9 +23,45 @@ Choose an intent from {plan, design, dev, tests, security, pr, status, help}.
 - status: summarize current state
 - help: explain available commands
 Respond ONLY as JSON: {"intent":"...","args":{...}}
-"""),
-	("human", "User: {text}\nState summary: {state_summary}")
-])
+
+Examples:
+User: build a REST API for a todo list with users and auth
+{"intent":"plan","args":{}}
+User: add acceptance criteria about pagination to the requirements
+{"intent":"plan","args":{}}
+User: how should we split the backend into modules?
+{"intent":"design","args":{}}
+User: write an RFC for moving storage to postgres
+{"intent":"design","args":{}}
+User: implement the login endpoint
+{"intent":"dev","args":{}}
+User: fix the failing test in test_api.py
+{"intent":"dev","args":{"file":"test_api.py"}}
+User: rename the Task model to Todo everywhere
+{"intent":"dev","args":{}}
+User: run the tests
+{"intent":"tests","args":{}}
+User: does the linter pass now?
+{"intent":"tests","args":{}}
+User: check our dependencies for known vulnerabilities
+{"intent":"security","args":{}}
+User: scan the repo for leaked secrets
+{"intent":"security","args":{}}
+User: open a pull request for this branch
+{"intent":"pr","args":{}}
+User: update the PR description with the latest changes
+{"intent":"pr","args":{}}
+User: where are we? what's passing?
+{"intent":"status","args":{}}
+User: what branch am I on?
+{"intent":"status","args":{}}
+User: what can you do?
+{"intent":"help","args":{}}
+User: asdf
+{"intent":"help","args":{}}
+""",
+	"User: {text}\nState summary: {state_summary}",
+)
 
 
 def summarize_state(state: dict) -> str:
@@ -40,12 +77,9 @@ INTENTS = {"plan","design","dev","tests","security","pr","status","help"}
 def route(text: str, state: dict) -> RouteOut:
 	chat = make_chat()
 	msg = router_prompt.format_messages(text=text, state_summary=summarize_state(state))
-	raw = chat.invoke(msg).content
-	try:
-		data = json.loads(raw)
-	except Exception:
-		start, end = raw.find("{"), raw.rfind("}") + 1
-		data = json.loads(raw[start:end])
+	# Not marked for prompt caching: the ~400-token system block is under the 1024-token minimum
+	raw = cached_invoke(chat, msg).content
+	data = extract_first_json(raw) or {"intent": "help"}
 	out = RouteOut(**data)
 	if out.intent not in INTENTS:
 		out.intent = "help"
@@ -1,8 +1,29 @@
+import asyncio
+import os
+from ..tools.file_operations import fingerprint_files
 from ..tools.runners import run_pip_audit
 
 
-def security_node(state):
-    code, out = run_pip_audit(state["repo_path"])
-    state["sec_ok"] = (code == 0)
-    state["logs"].append(f"pip-audit: exit={code}\n" + out[:1000])
-    return state
+# pip-audit only looks at the pinned requirements, so only they can change its verdict
+AUDIT_MANIFESTS = ["requirements.txt"]
+
+
+async def security_node(state):
+    # Runs in parallel with tests, so only this node's keys are returned
+    repo_path = state["repo_path"]
+    # Without requirements.txt pip-audit checks the installed environment, which can change on its own
+    pinned = all(os.path.isfile(os.path.join(repo_path, name)) for name in AUDIT_MANIFESTS)
+    fingerprint = fingerprint_files(repo_path, AUDIT_MANIFESTS) if pinned else ""
+    if fingerprint and state.get("last_audit_fingerprint") == fingerprint:
+        # Dev retries rarely touch dependencies: keep the previous passing verdict
+        return {
+            "sec_ok": True,
+            "logs": ["pip-audit: requirements unchanged, reusing previous passing result"],
+        }
+    code, out = await asyncio.to_thread(run_pip_audit, repo_path)
+    return {
+        "sec_ok": code == 0,
+        # Only a pass is reused: a failure (or a flaky network error) is always re-checked
+        "last_audit_fingerprint": fingerprint if code == 0 else "",
+        "logs": [f"pip-audit: exit={code}\n" + out[:1000]],
+    }
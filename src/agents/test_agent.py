@@ -1,20 +1,34 @@
-from ..tools.code_runner import run_project_tests, run_project_linting
+from ..tools.code_runner import run_checks_parallel
+from ..tools.check_cache import tree_hash
 from ..tools.file_operations import analyze_project_structure
+from ..state import log
 
 
-def tests_node(state):
-    # Analyze project to determine language and structure
-    project_analysis = analyze_project_structure(state["repo_path"])
+async def tests_node(state):
+    # Runs in parallel with security, so only this node's keys are returned
+    update = {"logs": []}
+    
+    # Analyze project to determine language and structure (reused until dev writes files)
+    project_analysis = state.get("project_analysis") or analyze_project_structure(state["repo_path"])
+    update["project_analysis"] = project_analysis
     language = project_analysis.get("primary_language", "unknown")
     
-    # Run language-appropriate linter
-    code, out = run_project_linting(state["repo_path"], project_analysis)
-    state["lint_ok"] = (code == 0)
-    state["logs"].append(f"Linter ({language}): exit={code}\n" + out[:1000])
-
-    # Run language-appropriate tests
-    code, out = run_project_tests(state["repo_path"], project_analysis)
-    state["tests_ok"] = (code == 0)
-    state["logs"].append(f"Tests ({language}): exit={code}\n" + out[:1000])
+    # Skip the run when nothing changed since the last passing one. Hash a fresh walk,
+    # not the analysis' file lists, which miss files created since it was made.
+    fingerprint = tree_hash(state["repo_path"])
+    if fingerprint == state.get("last_test_fingerprint") and state.get("lint_ok") and state.get("tests_ok"):
+        log(update, "Tests (%s): no changes since last passing run (cached)", language)
+        return update
+    
+    # Lint and tests are independent subprocesses, so run them side by side
+    results = await run_checks_parallel(state["repo_path"], project_analysis, ("lint", "tests"))
+    lint_code, lint_out = results["lint"]
+    tests_code, tests_out = results["tests"]
+    
+    update["lint_ok"] = (lint_code == 0)
+    log(update, "Linter (%s): exit=%d\n%.1000s", language, lint_code, lint_out)
+    update["tests_ok"] = (tests_code == 0)
+    log(update, "Tests (%s): exit=%d\n%.1000s", language, tests_code, tests_out)
+    update["last_test_fingerprint"] = fingerprint
     
-    return state
+    return update
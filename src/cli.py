@@ -1,7 +1,9 @@
 import argparse
+import asyncio
 from dotenv import load_dotenv
 from .session import Session
 from .graph import build_graph
+from .state import apply_update
 from .agents.router import route
 from .agents import planner, architect, dev as dev_agent, tests_agent, security as sec_agent, pr_agent
 
@@ -17,6 +19,7 @@ ACTIONS = {
 "security": sec_agent.security_node,
 "pr": pr_agent.pr_node,
 }
+_VALID = frozenset(ACTIONS) | {"status", "help"}
 
 
 HELP_TEXT = (
@@ -52,30 +55,26 @@ while True:
 	# Slash command override
 	if user.startswith("/"):
 		forced = user[1:].split()[0]
-		intent = forced if forced in ACTIONS or forced in {"status", "help"} else "help"
+		intent = forced if forced in _VALID else "help"
 		args = {}
 	else:
 		r = route(user, state)
 		intent, args = r.intent, r.args
 
-	if intent == "status":
-		print(f"status> branch={state.get('branch') or '-'} lint_ok={state.get('lint_ok')} tests_ok={state.get('tests_ok')} sec_ok={state.get('sec_ok')} pr_url={state.get('pr_url') or '-'}")
-		continue
-	if intent == "help":
-		print(HELP_TEXT)
-		continue
-
-	fn = ACTIONS.get(intent)
-	if not fn:
-		print("(no action)")
-		continue
-
-	try:
-		state = fn(state)
-		sess.update(state)
-		print(f"ok> {intent} done. Logs tail: {state['logs'][-1][:160] if state['logs'] else ''}")
-	except Exception as e:
-		print("error>", e)
+	match intent:
+		case "status":
+			print(f"status> branch={state.get('branch') or '-'} lint_ok={state.get('lint_ok')} tests_ok={state.get('tests_ok')} sec_ok={state.get('sec_ok')} pr_url={state.get('pr_url') or '-'}")
+		case "help":
+			print(HELP_TEXT)
+		case _ if intent in ACTIONS:
+			try:
+				state = apply_update(state, asyncio.run(ACTIONS[intent](state)))
+				sess.update(state)
+				print(f"ok> {intent} done. Logs tail: {state['logs'][-1][:160] if state['logs'] else ''}")
+			except Exception as e:
+				print("error>", e)
+		case _:
+			print("(no action)")
 
 if __name__ == "__main__":
 	main()
@@ -1,4 +1,7 @@
+import functools
+from itertools import product
 from langgraph.graph import StateGraph, END
+from langgraph.types import Send
 from .state import BuildState
 from .agents.planner import planner_node
 from .agents.architect import architect_node
@@ -8,7 +11,40 @@ from .agents.security import security_node
 from .agents.pr_agent import pr_node
 
 
+# Retries before the graph gives up on dev and moves on to pr
+MAX_DEV_ATTEMPTS = 3
+
+
+def _gate_target(tests_ok, lint_ok, sec_ok, out_of_attempts):
+    if out_of_attempts:
+        return "pr"
+    return "pr" if tests_ok and lint_ok and sec_ok else "dev"
+
+
+# Every gate outcome precomputed: (tests_ok, lint_ok, sec_ok, out_of_attempts) -> next node
+_GATE_ROUTES = {flags: _gate_target(*flags) for flags in product((False, True), repeat=4)}
+
+
+def _gate_key(state):
+    return (bool(state.tests_ok), bool(state.lint_ok), bool(state.sec_ok), state.dev_attempts >= MAX_DEV_ATTEMPTS)
+
+
+def gate_node(state):
+    """Join point after the parallel checks"""
+    tests_ok, lint_ok, sec_ok, out_of_attempts = _gate_key(state)
+    # Prevent infinite loops by limiting retries
+    if out_of_attempts and not (tests_ok and lint_ok and sec_ok):
+        return {"logs": ["Max dev attempts reached, proceeding to PR"]}
+    return {"logs": []}
+
+
+def gate_next(state):
+    return _GATE_ROUTES[_gate_key(state)]
+
+
+@functools.lru_cache(maxsize=1)
 def build_graph():
+    """Build and compile the agent graph (compiled once per process and reused)"""
     graph = StateGraph(BuildState)
 
     graph.add_node("plan", planner_node)
@@ -16,34 +52,20 @@ def build_graph():
     graph.add_node("dev", dev_node)
     graph.add_node("tests", tests_node)
     graph.add_node("security", security_node)
+    graph.add_node("gate", gate_node)
     graph.add_node("pr", pr_node)
 
     graph.set_entry_point("plan")
     graph.add_edge("plan", "design")
     graph.add_edge("design", "dev")
 
-    def dev_to_tests(state):
-        return "tests"
-
-    def tests_next(state):
-        # Prevent infinite loops by limiting retries
-        dev_attempts = state.get("dev_attempts", 0)
-        if dev_attempts >= 3:
-            state["logs"].append("Max dev attempts reached, proceeding to security")
-            return "security"
-        return "security" if (state.get("tests_ok") and state.get("lint_ok")) else "dev"
-
-    def sec_next(state):
-        # Prevent infinite loops by limiting retries
-        dev_attempts = state.get("dev_attempts", 0)
-        if dev_attempts >= 3:
-            state["logs"].append("Max dev attempts reached, proceeding to PR")
-            return "pr"
-        return "pr" if state.get("sec_ok") else "dev"
-
-    graph.add_conditional_edges("dev", dev_to_tests, {"tests": "tests"})
-    graph.add_conditional_edges("tests", tests_next, {"dev": "dev", "security": "security"})
-    graph.add_conditional_edges("security", sec_next, {"dev": "dev", "pr": "pr"})
+    def fan_out_checks(state):
+        # tests and security are independent checks of the same tree
+        return [Send("tests", state), Send("security", state)]
+
+    graph.add_conditional_edges("dev", fan_out_checks, ["tests", "security"])
+    graph.add_edge(["tests", "security"], "gate")
+    graph.add_conditional_edges("gate", gate_next, {"dev": "dev", "pr": "pr"})
     graph.add_edge("pr", END)
 
     return graph.compile()
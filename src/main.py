@@ -1,38 +1,43 @@
-import argparse, json
+import argparse, asyncio, json
 from dotenv import load_dotenv
 from .graph import build_graph
+from .state import BuildState
 
 
 load_dotenv()
 
 
 parser = argparse.ArgumentParser()
-parser.add_argument("--request", required=True)
+parser.add_argument("--request")
 parser.add_argument("--repo-path", required=True)
+parser.add_argument("--batch", help="JSONL file of {\"request\": ..., \"repo_path\": ...} lines to run with one compiled graph")
 args = parser.parse_args()
+if not args.request and not args.batch:
+	parser.error("one of --request or --batch is required")
 
 
-initial = {
-"request": args.request,
-"repo_path": args.repo_path,
-"prd": "",
-"rfc": "",
-"tasks": [],
-"branch": "",
-"lint_ok": False,
-"tests_ok": False,
-"sec_ok": False,
-"pr_url": "",
-"dev_attempts": 0,
-"logs": [],
-}
+def initial_state(request, repo_path):
+	return BuildState(request=request, repo_path=repo_path)
 
 
-app = build_graph()
-final = app.invoke(initial)
+def report(final):
+	print("=== DONE ===")
+	print("PRD written to .agent/PRD.md, RFC to .agent/RFC.md")
+	print("PR URL:", final.get("pr_url"))
+	print("\n-- Logs --\n" + "\n".join(map(str, final.get("logs", []))))
 
 
-print("=== DONE ===")
-print("PRD written to .agent/PRD.md, RFC to .agent/RFC.md")
-print("PR URL:", final.get("pr_url"))
-print("\n-- Logs --\n" + "\n".join(final.get("logs", [])))
+async def run():
+	app = build_graph()
+	if args.batch:
+		# Every request reuses the same compiled graph
+		with open(args.batch, "r", encoding="utf-8") as f:
+			for line in f:
+				if line.strip():
+					item = json.loads(line)
+					report(await app.ainvoke(initial_state(item["request"], item.get("repo_path", args.repo_path))))
+	else:
+		report(await app.ainvoke(initial_state(args.request, args.repo_path)))
+
+
+asyncio.run(run())
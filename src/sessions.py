@@ -1,17 +1,110 @@
-import json, os
+import gzip
+import os
 from typing import Dict, Any
+from .state import LogBuffer
+from .tools import fast_json
 
 
 DEFAULT_PATH = ".agent/state.json"
 
+# Compact the delta log into the snapshot after this many records
+COMPACT_EVERY = 200
+
+# Last saved log lines used to find where new lines start once the buffer is full
+LOG_WINDOW = 8
+
+# Environment flags: gzip the snapshot (AGENT_COMPACT_STATE), indent it for debugging (AGENT_STATE_PRETTY)
+COMPRESS_ENV = "AGENT_COMPACT_STATE"
+PRETTY_ENV = "AGENT_STATE_PRETTY"
+
+
+def _json_default(obj):
+    # Log buffers and deferred log records are stored as plain strings
+    if isinstance(obj, LogBuffer):
+        return list(obj)
+    return str(obj)
+
 
 class Session:
+    """
+    REPL state persisted as a snapshot plus an append-only log of deltas.
+
+    update() appends only the keys that changed and the new log lines to
+    <path>.log; the snapshot at <path> (or <path>.gz) is rewritten on compaction.
+    """
+
     def __init__(self, path: str = DEFAULT_PATH):
         self.path = path
+        self.log_path = path + ".log"
         self.state: Dict[str, Any] = {}
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                self.state = json.load(f)
+        self._saved: Dict[str, str] = {}
+        self._records = 0
+        self.state = self._read_snapshot()
+        if self.state or os.path.exists(self.log_path):
+            self.state["logs"] = LogBuffer(self.state.get("logs", []))
+            self._replay()
+        self._mark_saved()
+
+    def _read_snapshot(self) -> Dict[str, Any]:
+        # Whichever of state.json / state.json.gz was written last
+        candidates = [p for p in (self.path, self.path + ".gz") if os.path.exists(p)]
+        if not candidates:
+            return {}
+        latest = max(candidates, key=os.path.getmtime)
+        opener = gzip.open if latest.endswith(".gz") else open
+        with opener(latest, "rb") as f:
+            return fast_json.loads(f.read())
+
+    def _replay(self):
+        if not os.path.exists(self.log_path):
+            return
+        good = 0
+        with open(self.log_path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # torn final write
+                try:
+                    record = fast_json.loads(line)
+                except fast_json.JSONDecodeError:
+                    break
+                changed = record.get("set", {})
+                if "logs" in changed:
+                    changed["logs"] = LogBuffer(changed["logs"])
+                self.state.update(changed)
+                logs = self.state["logs"]
+                for _ in range(min(record.get("drop", 0), len(logs))):
+                    logs.popleft()
+                logs.extend(record.get("logs", ()))
+                self._records += 1
+                good += len(line)
+        if good < os.path.getsize(self.log_path):
+            # Cut the torn tail off, or the next record would be appended onto it and lost
+            os.truncate(self.log_path, good)
+
+    def _mark_saved(self):
+        self._saved = {k: fast_json.dumps(v, default=_json_default) for k, v in self.state.items() if k != "logs"}
+        self._mark_logs_saved(self.state.get("logs") or ())
+
+    def _mark_logs_saved(self, logs):
+        self._saved_log_count = len(logs)
+        self._saved_log_window = [logs[i] for i in range(max(0, len(logs) - LOG_WINDOW), len(logs))]
+
+    def _log_delta(self, logs):
+        """(entries dropped from the front, entries appended) since the last save, or None if the buffer was replaced"""
+        window = self._saved_log_window
+        if not window:
+            return (0, [logs[i] for i in range(len(logs))]) if self._saved_log_count == 0 else None
+        w = len(window)
+        last = window[-1]
+        # Search back from the end for the last saved line; usually only the new lines are passed
+        for end in range(len(logs) - 1, w - 2, -1):
+            if logs[end] != last or any(logs[end - w + 1 + j] != window[j] for j in range(w - 1)):
+                continue
+            dropped = (self._saved_log_count - w) - (end - w + 1)
+            if dropped < 0:
+                return None
+            return dropped, [logs[i] for i in range(end + 1, len(logs))]
+        return None
 
     def init_if_empty(self, **kwargs):
         if not self.state:
@@ -20,16 +113,63 @@ class Session:
                 "repo_path": kwargs["repo_path"],
                 "prd": "", "rfc": "", "tasks": [],
                 "branch": "", "lint_ok": False, "tests_ok": False,
-                "sec_ok": False, "pr_url": "", "logs": [],
+                "sec_ok": False, "pr_url": "", "project_analysis": None,
+                "last_test_fingerprint": "", "last_audit_fingerprint": "",
+                "logs": LogBuffer(),
             }
             self.save()
         return self.state
 
     def update(self, new_state: Dict[str, Any]):
         self.state.update(new_state)
-        self.save()
+        record: Dict[str, Any] = {"set": {}}
+        for key, value in self.state.items():
+            if key == "logs":
+                continue
+            encoded = fast_json.dumps(value, default=_json_default)
+            if self._saved.get(key) != encoded:
+                record["set"][key] = value
+                self._saved[key] = encoded
+
+        logs = self.state.get("logs") or LogBuffer()
+        delta = self._log_delta(logs)
+        if delta is None:
+            # Buffer was replaced: store it whole
+            record["set"]["logs"] = logs
+        else:
+            # A full buffer drops its oldest lines as new ones arrive; record only the change
+            dropped, appended = delta
+            if dropped:
+                record["drop"] = dropped
+            if appended:
+                record["logs"] = appended
+        self._mark_logs_saved(logs)
+
+        if not record["set"] and "logs" not in record and "drop" not in record:
+            return
+        os.makedirs(os.path.dirname(self.log_path) or ".", exist_ok=True)
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(fast_json.dumps(record, default=_json_default) + "\n")
+        self._records += 1
+        if self._records >= COMPACT_EVERY:
+            self.compact()
+
+    def compact(self):
+        """Write the full state snapshot atomically and truncate the delta log."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        compress = bool(os.environ.get(COMPRESS_ENV))
+        target, stale = (self.path + ".gz", self.path) if compress else (self.path, self.path + ".gz")
+        data = fast_json.dumps(self.state, indent=bool(os.environ.get(PRETTY_ENV)), default=_json_default).encode("utf-8")
+        tmp_path = target + ".tmp"
+        with (gzip.open(tmp_path, "wb", compresslevel=6) if compress else open(tmp_path, "wb")) as f:
+            f.write(data)
+        os.replace(tmp_path, target)
+        if os.path.exists(stale):
+            os.remove(stale)
+        if os.path.exists(self.log_path):
+            os.remove(self.log_path)
+        self._records = 0
+        self._mark_saved()
 
     def save(self):
-        os.makedirs(os.path.dirname(self.path), exist_ok=True)
-        with open(self.path, "w", encoding="utf-8") as f:
-            json.dump(self.state, f, indent=2)
+        self.compact()
@@ -1,19 +1,119 @@
-from typing import List, TypedDict, Optional
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Annotated, Any, Dict, List, Optional
 
 
-class BuildState(TypedDict):
+# Oldest entries are dropped beyond this so long REPL sessions stay bounded
+MAX_LOG_ENTRIES = 2000
+
+# String arguments longer than this are formatted right away, so a %.Ns template
+# truncates them instead of the record holding the whole command output or response
+EAGER_FORMAT_CHARS = 1024
+
+
+class LogRecord:
+    """A log entry whose %-formatting is deferred until it is read."""
+    __slots__ = ("template", "args")
+
+    def __init__(self, template: str, args: tuple):
+        self.template = template
+        self.args = args
+
+    def __str__(self) -> str:
+        return self.template % self.args
+
+
+class LogBuffer(deque):
+    """Bounded log of str/LogRecord entries; indexing and iteration yield formatted strings."""
+
+    def __init__(self, entries=(), maxlen: int = MAX_LOG_ENTRIES):
+        super().__init__(entries, maxlen)
+
+    def __getitem__(self, index) -> str:
+        return str(super().__getitem__(index))
+
+    def __iter__(self):
+        for entry in super().__iter__():
+            yield str(entry)
+
+    def entries(self):
+        """Iterate the raw entries without formatting them."""
+        return super().__iter__()
+
+
+def add_logs(left, right):
+    """
+    Reducer for state["logs"]: append a node's new entries to the bounded buffer.
+    
+    Nodes that return partial updates hand back only their own entries, so parallel
+    branches (tests and security) merge instead of overwriting each other. A node that
+    appended in place and returned the whole state hands back the same buffer.
+    """
+    if right is left:
+        return left
+    merged = LogBuffer(left.entries() if isinstance(left, LogBuffer) else (left or ()))
+    merged.extend(right.entries() if isinstance(right, LogBuffer) else (right or ()))
+    return merged
+
+
+def apply_update(state: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge a node's return value into a state dict the way the graph does."""
+    if update is state:
+        return state
+    merged = dict(state)
+    for key, value in update.items():
+        merged[key] = add_logs(state.get("logs"), value) if key == "logs" else value
+    return merged
+
+
+def log(state: Any, template: str, *args):
+    """Append to state["logs"], formatting template % args only when the entry is read."""
+    if not args:
+        state["logs"].append(template)
+    elif any(isinstance(arg, str) and len(arg) > EAGER_FORMAT_CHARS for arg in args):
+        state["logs"].append(template % args)
+    else:
+        state["logs"].append(LogRecord(template, args))
+
+
+@dataclass(slots=True)
+class BuildState:
+    """
+    Graph state. Fields are plain attributes; the mapping shims let nodes written
+    against dicts (state["logs"], state.get(...)) run on it unchanged.
+    """
     request: str
     repo_path: str
     # artifacts
-    prd: str
-    rfc: str
-    tasks: List[dict]
+    prd: str = ""
+    rfc: str = ""
+    tasks: List[dict] = field(default_factory=list)
     # control flags
-    branch: str
-    lint_ok: bool
-    tests_ok: bool
-    sec_ok: bool
-    pr_url: str
-    dev_attempts: int
+    branch: str = ""
+    lint_ok: bool = False
+    tests_ok: bool = False
+    sec_ok: bool = False
+    pr_url: str = ""
+    dev_attempts: int = 0
+    project_analysis: Optional[dict] = None
+    last_test_fingerprint: str = ""
+    last_audit_fingerprint: str = ""
     # trace
-    logs: List[str]
+    logs: Annotated[List[str], add_logs] = field(default_factory=LogBuffer)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__dataclass_fields__
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
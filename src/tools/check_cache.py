@@ -0,0 +1,166 @@
+"""
+Content-addressed cache of check results (lint, tests, build).
+
+Passing results are stored under .agent/check_cache in the target repo, keyed by
+the check, a hash of the source tree and the toolchain/dependency state, so a dev
+retry that leaves the code and environment unchanged gets the previous result
+back instead of re-running the subprocess. Failures are never stored: they may
+come from a missing tool or dependency that gets installed later.
+"""
+
+import os
+import sys
+import hashlib
+from typing import Callable, Dict, Iterable, Tuple
+
+from . import fast_json
+from .file_operations import write_file_content
+from .shell import which
+
+
+CACHE_DIR = os.path.join(".agent", "check_cache")
+
+# Stored results kept per repo; the least recently used are pruned past this
+MAX_ENTRIES = 64
+
+# Sentinel dependency_manager writes after a successful install (hash of the manifests)
+_DEPS_HASH_FILE = os.path.join(".agent", "deps_hash")
+
+# Installed-dependency directories tree_hash skips; their mtimes change when packages
+# or their entry points are added or removed
+_ENV_DIRS = (
+    "venv", os.path.join("venv", "bin"), os.path.join("venv", "Scripts"),
+    "node_modules", os.path.join("node_modules", ".bin"), "vendor",
+)
+
+# Directories that are never sources, at any depth: VCS, agent state and tool caches.
+# Other dot entries (.eslintrc.json, .flake8, .github/) are config and are hashed.
+_SKIP_ANYWHERE = frozenset({'.git', '.agent', '__pycache__', '.pytest_cache', '.mypy_cache', '.ruff_cache'})
+
+# Installed dependencies and build output, skipped only at the repo root: nested
+# names like src/bin (Cargo binaries) or pkg/build are ordinary source directories
+_SKIP_ROOT = frozenset({
+    'node_modules', 'venv', '.venv', 'env', 'vendor', 'target', 'bin', 'obj', 'dist', 'build', '.gradle',
+})
+
+# Per-file content digests keyed by absolute path -> (mtime_ns, size, digest)
+_digests: Dict[str, Tuple[int, int, bytes]] = {}
+
+
+def _file_digest(path: str, st: os.stat_result) -> bytes:
+    """Content digest of a file, rehashed only when its mtime or size changed"""
+    cached = _digests.get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            h.update(block)
+    digest = h.digest()
+    _digests[path] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+
+def tree_hash(repo_path: str) -> str:
+    """Hash the relative paths and contents of the source files under repo_path"""
+    entries = []
+    stack = [repo_path]
+    while stack:
+        current = stack.pop()
+        at_root = current == repo_path
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    name = entry.name
+                    if name in _SKIP_ANYWHERE:
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not (at_root and name in _SKIP_ROOT):
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            digest = _file_digest(entry.path, entry.stat())
+                            entries.append((os.path.relpath(entry.path, repo_path), digest))
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+    h = hashlib.blake2b(digest_size=16)
+    for rel_path, digest in sorted(entries):
+        h.update(rel_path.encode("utf-8", "surrogateescape"))
+        h.update(b"\0")
+        h.update(digest)
+    return h.hexdigest()
+
+
+def env_hash(repo_path: str, tools: Iterable[str] = ()) -> str:
+    """Hash the interpreter, the resolved tool paths and the installed-dependency state"""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{sys.executable}\0{os.environ.get('PATH', '')}\0".encode("utf-8", "surrogateescape"))
+    for tool in tools:
+        h.update(f"{tool}={which(tool)}\0".encode("utf-8", "surrogateescape"))
+    for name in (_DEPS_HASH_FILE,) + _ENV_DIRS:
+        try:
+            st = os.stat(os.path.join(repo_path, name))
+            h.update(f"{name}\0{st.st_mtime_ns}\0{st.st_size}\0".encode("utf-8", "surrogateescape"))
+        except OSError:
+            h.update(f"{name}\0missing\0".encode("utf-8", "surrogateescape"))
+    return h.hexdigest()
+
+
+def _prune(cache_dir: str):
+    """Remove the least recently used entries beyond MAX_ENTRIES"""
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [(entry.stat().st_mtime_ns, entry.path) for entry in it if entry.name.endswith(".json")]
+    except OSError:
+        return
+    entries.sort()
+    for _, path in entries[:-MAX_ENTRIES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def cached_run(check: str, repo_path: str, run: Callable[[], Tuple[int, str]], tools: Iterable[str] = ()) -> Tuple[int, str]:
+    """
+    Return the stored passing result of check for the current tree and environment,
+    or run it and store the result if it passed.
+    
+    Args:
+        check: Identifies the command being run (e.g. "lint:python")
+        repo_path: Repository the check runs in
+        run: Runs the check and returns (exit code, output)
+        tools: Commands the check may run; where they resolve on PATH is part of the key
+
+    Returns:
+        (exit code, output)
+    """
+    key = hashlib.blake2b(
+        f"{check}\0{tree_hash(repo_path)}\0{env_hash(repo_path, tools)}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+    entry = os.path.join(CACHE_DIR, f"{key}.json")
+    cache_path = os.path.join(repo_path, entry)
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = fast_json.loads(f.read())
+        if cached["rc"] == 0:
+            try:
+                os.utime(cache_path)  # recently used, so pruned last
+            except OSError:
+                pass
+            return cached["rc"], cached["out"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    code, out = run()
+    # Only passes are reused: a failure, timeout or missing tool has to be checked again
+    if code == 0:
+        # write_file_content replaces the entry atomically, so a concurrent reader never sees it torn
+        if write_file_content(repo_path, entry, fast_json.dumps({"check": check, "rc": code, "out": out})):
+            _prune(os.path.dirname(cache_path))
+        else:
+            print(f"Warning: could not store check result for {check}")
+    return code, out
@@ -3,28 +3,64 @@ Multi-language code runner for different programming languages.
 """
 
 import os
+import asyncio
+import multiprocessing
+import py_compile
 import subprocess
-from typing import Dict, Any, Tuple, List, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from types import MappingProxyType
+from typing import Dict, Any, Tuple, List, Optional, Iterable
+
+from .check_cache import cached_run
+from .shell import TAIL_BYTES, capture, which
+from .language_detector import find_local_bins, scan_project
+
+
+def _resolve_program(program: str) -> str:
+    """Absolute path for a bare command name, when it is on PATH"""
+    if os.sep in program:
+        return program  # relative to the repo (./gradlew, vendor/bin/phpunit)
+    return which(program) or program
+
+
+def _run_capture_tail(cmd: List[str], cwd: str, timeout: int, tail_bytes: int = TAIL_BYTES) -> subprocess.CompletedProcess:
+    """Run cmd with its output spooled to temp files, returning only the tail of each stream"""
+    return capture([_resolve_program(cmd[0])] + list(cmd[1:]), cwd, timeout, tail_bytes)
+
+
+# Worker processes shared across builds (byte-compiling), started on first use
+_POOL_WORKERS = min(4, os.cpu_count() or 1)
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Return the shared worker pool, starting it if needed"""
+    global _pool
+    if _pool is None:
+        # Never fork: this process runs threads, and a lock held by one would be copied locked
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _pool = ProcessPoolExecutor(max_workers=_POOL_WORKERS, mp_context=multiprocessing.get_context(method))
+    return _pool
+
+
+def _discard_pool():
+    """Drop the shared pool so the next use starts a fresh one"""
+    global _pool
+    pool, _pool = _pool, None
+    if pool is None:
+        return
+    pool.shutdown(wait=False, cancel_futures=True)
 
 
 def run_project_tests(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int, str]:
     """Run tests for a project based on its language and structure"""
     language = project_analysis.get("primary_language", "unknown")
     
-    test_runners = {
-        'python': run_python_tests,
-        'javascript': run_javascript_tests,
-        'typescript': run_typescript_tests,
-        'csharp': run_csharp_tests,
-        'java': run_java_tests,
-        'go': run_go_tests,
-        'rust': run_rust_tests,
-        'php': run_php_tests,
-        'ruby': run_ruby_tests,
-    }
-    
-    if language in test_runners:
-        return test_runners[language](repo_path, project_analysis)
+    runner = _TEST_RUNNERS.get(language)
+    if runner is not None:
+        return cached_run(f"tests:{language}", repo_path, lambda: runner(repo_path, project_analysis),
+                          _CHECK_TOOLS.get(language, ()))
     
     return 0, f"No test runner available for {language}"
 
@@ -33,20 +69,10 @@ def run_project_build(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple
     """Build a project based on its language and structure"""
     language = project_analysis.get("primary_language", "unknown")
     
-    build_runners = {
-        'python': build_python_project,
-        'javascript': build_javascript_project,
-        'typescript': build_typescript_project,
-        'csharp': build_csharp_project,
-        'java': build_java_project,
-        'go': build_go_project,
-        'rust': build_rust_project,
-        'php': build_php_project,
-        'ruby': build_ruby_project,
-    }
-    
-    if language in build_runners:
-        return build_runners[language](repo_path, project_analysis)
+    runner = _BUILD_RUNNERS.get(language)
+    if runner is not None:
+        return cached_run(f"build:{language}", repo_path, lambda: runner(repo_path, project_analysis),
+                          _CHECK_TOOLS.get(language, ()))
     
     return 0, f"No build runner available for {language}"
 
@@ -55,48 +81,98 @@ def run_project_linting(repo_path: str, project_analysis: Dict[str, Any]) -> Tup
     """Run linting for a project based on its language and structure"""
     language = project_analysis.get("primary_language", "unknown")
     
-    linters = {
-        'python': run_python_linting,
-        'javascript': run_javascript_linting,
-        'typescript': run_typescript_linting,
-        'csharp': run_csharp_linting,
-        'java': run_java_linting,
-        'go': run_go_linting,
-        'rust': run_rust_linting,
-        'php': run_php_linting,
-        'ruby': run_ruby_linting,
-    }
-    
-    if language in linters:
-        return linters[language](repo_path, project_analysis)
+    runner = _LINTERS.get(language)
+    if runner is not None:
+        return cached_run(f"lint:{language}", repo_path, lambda: runner(repo_path, project_analysis),
+                          _CHECK_TOOLS.get(language, ()))
     
     return 0, f"No linter available for {language}"
 
 
+async def run_checks_parallel(
+    repo_path: str,
+    project_analysis: Dict[str, Any],
+    checks: Iterable[str] = ("tests", "build", "lint"),
+) -> Dict[str, Tuple[int, str]]:
+    """
+    Run several checks for a project concurrently.
+    
+    Each check is a blocking subprocess wait, so running them side by side makes
+    the wall time the slowest check rather than the sum of all of them.
+    
+    Returns:
+        Dict mapping each check name to its (exit code, output)
+    """
+    checks = list(checks)
+    results = await asyncio.gather(*(
+        asyncio.to_thread(_CHECKS[check], repo_path, project_analysis) for check in checks
+    ))
+    return dict(zip(checks, results))
+
+
+def _check_files_parallel(repo_path: str, command: List[str], files: List[str], timeout: int = 30) -> Optional[Tuple[int, str]]:
+    """
+    Run a per-file checker over files concurrently.
+    
+    Returns:
+        (exit code, output) of the first failing file, or None when all pass
+    """
+    def check(file_path: str) -> subprocess.CompletedProcess:
+        return _run_capture_tail(command + [file_path], repo_path, timeout)
+    
+    executor = ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(files)))
+    try:
+        # Collect in submission order so the reported failure doesn't depend on timing
+        for future in [executor.submit(check, f) for f in files]:
+            result = future.result()
+            if result.returncode != 0:
+                return result.returncode, result.stdout + result.stderr
+        return None
+    finally:
+        # Drop queued checks once a failure is known
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _markers(repo_path: str, project_analysis: Dict[str, Any]) -> Dict[str, bool]:
+    """Marker files found by the project analysis, scanning if it predates them"""
+    return project_analysis.get("markers") or scan_project(repo_path)
+
+
+def _node_tool(repo_path: str, project_analysis: Dict[str, Any], name: str) -> List[str]:
+    """Command prefix for a Node tool: the local node_modules/.bin binary, else npx"""
+    bins = project_analysis.get("bin")
+    if bins is None:
+        bins = find_local_bins(repo_path)
+    local = bins.get(name)
+    return [local] if local else ["npx", name]
+
+
+def _source_files(project_analysis: Dict[str, Any], ext: str) -> List[str]:
+    """Source files with extension ext (no dot), grouped at analysis time when available"""
+    files_by_ext = project_analysis.get("files_by_ext")
+    if files_by_ext is not None:
+        return files_by_ext.get(ext, [])
+    suffix = "." + ext
+    return [f for f in project_analysis.get("source_files", []) if f.endswith(suffix)]
+
+
 # Python runners
 def run_python_tests(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int, str]:
     """Run Python tests"""
+    # Always a fresh interpreter: an in-process run would reuse modules imported
+    # from the previous version of the sources
     try:
         # Try pytest first
-        result = subprocess.run(
-            ["python", "-m", "pytest", "-v"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
+        result = _run_capture_tail(["python", "-m", "pytest", "-v"], repo_path, 120)
         
-        if result.returncode == 0 or "collected" in result.stdout:
+        # Only the output tail is kept, so the "collected N items" header may be gone;
+        # pytest ran unless the module is missing or it stopped with a usage error
+        pytest_ran = result.returncode in (0, 1, 2, 5) and "No module named pytest" not in result.stderr
+        if pytest_ran:
             return result.returncode, result.stdout + result.stderr
         
         # Fallback to unittest
-        result = subprocess.run(
-            ["python", "-m", "unittest", "discover", "-v"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
+        result = _run_capture_tail(["python", "-m", "unittest", "discover", "-v"], repo_path, 120)
         return result.returncode, result.stdout + result.stderr
     
     except subprocess.TimeoutExpired:
@@ -105,17 +181,40 @@ def run_python_tests(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[
         return 1, f"Error running Python tests: {e}"
 
 
+def _compile_python_files(repo_path: str, files: List[str]) -> Tuple[int, str]:
+    """Byte-compile files in a pool worker, reporting every failure like py_compile's CLI"""
+    errors = []
+    for file_path in files:
+        try:
+            py_compile.compile(os.path.join(repo_path, file_path), doraise=True)
+        except py_compile.PyCompileError as e:
+            errors.append(e.msg)
+        except OSError as e:
+            errors.append(f"{file_path}: {e}")
+    return (1 if errors else 0), "\n".join(errors)
+
+
 def build_python_project(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int, str]:
     """Build Python project (mainly check syntax)"""
+    py_files = _source_files(project_analysis, "py")
+    if not py_files:
+        return 0, "No Python files found"
+    
     try:
-        result = subprocess.run(
-            ["python", "-m", "py_compile"] + [f for f in project_analysis.get("source_files", []) if f.endswith('.py')],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-        return result.returncode, result.stdout + result.stderr
+        # Compile in the warm workers instead of starting a new interpreter each build
+        pool = _get_pool()
+        workers = min(_POOL_WORKERS, len(py_files))
+        futures = [pool.submit(_compile_python_files, repo_path, py_files[i::workers]) for i in range(workers)]
+        results = [future.result(timeout=60) for future in futures]
+        code = max(rc for rc, _ in results)
+        return code, "\n".join(out for _, out in results if out)
+    except BrokenProcessPool:
+        _discard_pool()
+        return 1, "Error building Python project: compile worker died"
+    except FutureTimeoutError:
+        # A worker stuck on one build would otherwise hold its slot for the next one
+        _discard_pool()
+        return 1, "Error building Python project: compile timed out after 60s"
     except Exception as e:
         return 1, f"Error building Python project: {e}"
 
@@ -124,25 +223,13 @@ def run_python_linting(repo_path: str, project_analysis: Dict[str, Any]) -> Tupl
     """Run Python linting"""
     try:
         # Try ruff first
-        result = subprocess.run(
-            ["ruff", "check", "."],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+        result = _run_capture_tail(["ruff", "check", "."], repo_path, 60)
         
         if result.returncode != 127:  # Command found
             return result.returncode, result.stdout + result.stderr
         
         # Fallback to flake8
-        result = subprocess.run(
-            ["flake8", "."],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+        result = _run_capture_tail(["flake8", "."], repo_path, 60)
         return result.returncode, result.stdout + result.stderr
     
     except Exception as e:
@@ -152,15 +239,10 @@ def run_python_linting(repo_path: str, project_analysis: Dict[str, Any]) -> Tupl
 # JavaScript/Node.js runners
 def run_javascript_tests(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int, str]:
     """Run JavaScript tests"""
+    markers = _markers(repo_path, project_analysis)
     try:
-        if os.path.exists(os.path.join(repo_path, "package.json")):
-            result = subprocess.run(
-                ["npm", "test"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
+        if markers["has_package_json"]:
+            result = _run_capture_tail(["npm", "test"], repo_path, 120)
             return result.returncode, result.stdout + result.stderr
         else:
             return 0, "No package.json found"
@@ -170,15 +252,10 @@ def run_javascript_tests(repo_path: str, project_analysis: Dict[str, Any]) -> Tu
 
 def build_javascript_project(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int, str]:
     """Build JavaScript project"""
+    markers = _markers(repo_path, project_analysis)
     try:
-        if os.path.exists(os.path.join(repo_path, "package.json")):
-            result = subprocess.run(
-                ["npm", "run", "build"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
+        if markers["has_package_json"]:
+            result = _run_capture_tail(["npm", "run", "build"], repo_path, 120)
             # If build script doesn't exist, that's okay
             if "missing script: build" in result.stderr:
                 return 0, "No build script defined (okay for basic projects)"
@@ -193,13 +270,7 @@ def run_javascript_linting(repo_path: str, project_analysis: Dict[str, Any]) ->
     """Run JavaScript linting"""
     try:
         # Try ESLint
-        result = subprocess.run(
-            ["npx", "eslint", "."],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+        result = _run_capture_tail(_node_tool(repo_path, project_analysis, "eslint") + ["."], repo_path, 60)
         return result.returncode, result.stdout + result.stderr
     except Exception as e:
         return 1, f"Error running JavaScript linting: {e}"
@@ -213,15 +284,10 @@ def run_typescript_tests(repo_path: str, project_analysis: Dict[str, Any]) -> Tu
 
 def build_typescript_project(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int, str]:
     """Build TypeScript project"""
+    markers = _markers(repo_path, project_analysis)
     try:
-        if os.path.exists(os.path.join(repo_path, "tsconfig.json")):
-            result = subprocess.run(
-                ["npx", "tsc"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+        if markers["has_tsconfig"]:
+            result = _run_capture_tail(_node_tool(repo_path, project_analysis, "tsc"), repo_path, 60)
             return result.returncode, result.stdout + result.stderr
         else:
             return build_javascript_project(repo_path, project_analysis)
@@ -233,13 +299,7 @@ def run_typescript_linting(repo_path: str, project_analysis: Dict[str, Any]) ->
     """Run TypeScript linting"""
     try:
         # Try TypeScript compiler for type checking
-        result = subprocess.run(
-            ["npx", "tsc", "--noEmit"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+        result = _run_capture_tail(_node_tool(repo_path, project_analysis, "tsc") + ["--noEmit"], repo_path, 60)
         return result.returncode, result.stdout + result.stderr
     except Exception as e:
         return 1, f"Error running TypeScript linting: {e}"
@@ -249,13 +309,7 @@ def run_typescript_linting(repo_path: str, project_analysis: Dict[str, Any]) ->
 def run_csharp_tests(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int, str]:
     """Run C# tests"""
     try:
-        result = subprocess.run(
-            ["dotnet", "test"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
+        result = _run_capture_tail(["dotnet", "test"], repo_path, 120)
         return result.returncode, result.stdout + result.stderr
     except Exception as e:
         return 1, f"Error running C# tests: {e}"
@@ -264,13 +318,7 @@ def run_csharp_tests(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[
 def build_csharp_project(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int, str]:
     """Build C# project"""
     try:
-        result = subprocess.run(
-            ["dotnet", "build"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
+        result = _run_capture_tail(["dotnet", "build"], repo_path, 120)
         return result.returncode, result.stdout + result.stderr
     except Exception as e:
         return 1, f"Error building C# project: {e}"
@@ -280,13 +328,7 @@ def run_csharp_linting(repo_path: str, project_analysis: Dict[str, Any]) -> Tupl
     """Run C# linting"""
     try:
         # dotnet build includes compile-time checks
-        result = subprocess.run(
-            ["dotnet", "build", "--verbosity", "normal"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+        result = _run_capture_tail(["dotnet", "build", "--verbosity", "normal"], repo_path, 60)
         return result.returncode, result.stdout + result.stderr
     except Exception as e:
         return 1, f"Error running C# linting: {e}"
@@ -295,24 +337,13 @@ def run_csharp_linting(repo_path: str, project_analysis: Dict[str, Any]) -> Tupl
 # Java runners
 def run_java_tests(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int, str]:
     """Run Java tests"""
+    markers = _markers(repo_path, project_analysis)
     try:
-        if os.path.exists(os.path.join(repo_path, "pom.xml")):
-            result = subprocess.run(
-                ["mvn", "test"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=180
-            )
-        elif os.path.exists(os.path.join(repo_path, "build.gradle")):
-            gradle_cmd = "./gradlew" if os.path.exists(os.path.join(repo_path, "gradlew")) else "gradle"
-            result = subprocess.run(
-                [gradle_cmd, "test"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=180
-            )
+        if markers["has_pom"]:
+            result = _run_capture_tail(["mvn", "test"], repo_path, 180)
+        elif markers["has_gradle"]:
+            gradle_cmd = "./gradlew" if markers["has_gradlew"] else "gradle"
+            result = _run_capture_tail([gradle_cmd, "test"], repo_path, 180)
         else:
             return 0, "No Maven or Gradle build file found"
         
@@ -323,24 +354,13 @@ def run_java_tests(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[in
 
 def build_java_project(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int, str]:
     """Build Java project"""
+    markers = _markers(repo_path, project_analysis)
     try:
-        if os.path.exists(os.path.join(repo_path, "pom.xml")):
-            result = subprocess.run(
-                ["mvn", "compile"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=180
-            )
-        elif os.path.exists(os.path.join(repo_path, "build.gradle")):
-            gradle_cmd = "./gradlew" if os.path.exists(os.path.join(repo_path, "gradlew")) else "gradle"
-            result = subprocess.run(
-                [gradle_cmd, "compileJava"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=180
-            )
+        if markers["has_pom"]:
+            result = _run_capture_tail(["mvn", "compile"], repo_path, 180)
+        elif markers["has_gradle"]:
+            gradle_cmd = "./gradlew" if markers["has_gradlew"] else "gradle"
+            result = _run_capture_tail([gradle_cmd, "compileJava"], repo_path, 180)
         else:
             return 0, "No Maven or Gradle build file found"
         
@@ -351,15 +371,10 @@ def build_java_project(repo_path: str, project_analysis: Dict[str, Any]) -> Tupl
 
 def run_java_linting(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int, str]:
     """Run Java linting"""
+    markers = _markers(repo_path, project_analysis)
     try:
         # Use checkstyle if available, otherwise just compile
-        result = subprocess.run(
-            ["mvn", "checkstyle:check"] if os.path.exists(os.path.join(repo_path, "pom.xml")) else ["gradle", "check"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+        result = _run_capture_tail(["mvn", "checkstyle:check"] if markers["has_pom"] else ["gradle", "check"], repo_path, 60)
         return result.returncode, result.stdout + result.stderr
     except Exception as e:
         return build_java_project(repo_path, project_analysis)  # Fallback to build
@@ -369,13 +384,7 @@ def run_java_linting(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[
 def run_go_tests(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int, str]:
     """Run Go tests"""
     try:
-        result = subprocess.run(
-            ["go", "test", "./..."],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
+        result = _run_capture_tail(["go", "test", "./..."], repo_path, 120)
         return result.returncode, result.stdout + result.stderr
     except Exception as e:
         return 1, f"Error running Go tests: {e}"
@@ -384,13 +393,7 @@ def run_go_tests(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int,
 def build_go_project(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int, str]:
     """Build Go project"""
     try:
-        result = subprocess.run(
-            ["go", "build", "./..."],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+        result = _run_capture_tail(["go", "build", "./..."], repo_path, 60)
         return result.returncode, result.stdout + result.stderr
     except Exception as e:
         return 1, f"Error building Go project: {e}"
@@ -400,25 +403,13 @@ def run_go_linting(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[in
     """Run Go linting"""
     try:
         # Try golangci-lint first, then go vet
-        result = subprocess.run(
-            ["golangci-lint", "run"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+        result = _run_capture_tail(["golangci-lint", "run"], repo_path, 60)
         
         if result.returncode != 127:  # Command found
             return result.returncode, result.stdout + result.stderr
         
         # Fallback to go vet
-        result = subprocess.run(
-            ["go", "vet", "./..."],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+        result = _run_capture_tail(["go", "vet", "./..."], repo_path, 60)
         return result.returncode, result.stdout + result.stderr
     except Exception as e:
         return 1, f"Error running Go linting: {e}"
@@ -428,13 +419,7 @@ def run_go_linting(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[in
 def run_rust_tests(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int, str]:
     """Run Rust tests"""
     try:
-        result = subprocess.run(
-            ["cargo", "test"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=180
-        )
+        result = _run_capture_tail(["cargo", "test"], repo_path, 180)
         return result.returncode, result.stdout + result.stderr
     except Exception as e:
         return 1, f"Error running Rust tests: {e}"
@@ -443,13 +428,7 @@ def run_rust_tests(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[in
 def build_rust_project(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int, str]:
     """Build Rust project"""
     try:
-        result = subprocess.run(
-            ["cargo", "build"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=180
-        )
+        result = _run_capture_tail(["cargo", "build"], repo_path, 180)
         return result.returncode, result.stdout + result.stderr
     except Exception as e:
         return 1, f"Error building Rust project: {e}"
@@ -458,13 +437,7 @@ def build_rust_project(repo_path: str, project_analysis: Dict[str, Any]) -> Tupl
 def run_rust_linting(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int, str]:
     """Run Rust linting"""
     try:
-        result = subprocess.run(
-            ["cargo", "clippy", "--", "-D", "warnings"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+        result = _run_capture_tail(["cargo", "clippy", "--", "-D", "warnings"], repo_path, 60)
         return result.returncode, result.stdout + result.stderr
     except Exception as e:
         return 1, f"Error running Rust linting: {e}"
@@ -473,23 +446,12 @@ def run_rust_linting(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[
 # PHP runners
 def run_php_tests(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int, str]:
     """Run PHP tests"""
+    markers = _markers(repo_path, project_analysis)
     try:
-        if os.path.exists(os.path.join(repo_path, "vendor/bin/phpunit")):
-            result = subprocess.run(
-                ["vendor/bin/phpunit"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
+        if markers["has_vendor_phpunit"]:
+            result = _run_capture_tail(["vendor/bin/phpunit"], repo_path, 120)
         else:
-            result = subprocess.run(
-                ["phpunit"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
+            result = _run_capture_tail(["phpunit"], repo_path, 120)
         return result.returncode, result.stdout + result.stderr
     except Exception as e:
         return 1, f"Error running PHP tests: {e}"
@@ -498,20 +460,13 @@ def run_php_tests(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int
 def build_php_project(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int, str]:
     """Build PHP project (syntax check)"""
     try:
-        php_files = [f for f in project_analysis.get("source_files", []) if f.endswith('.php')]
+        php_files = _source_files(project_analysis, "php")
         if not php_files:
             return 0, "No PHP files found"
         
-        for php_file in php_files:
-            result = subprocess.run(
-                ["php", "-l", php_file],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            if result.returncode != 0:
-                return result.returncode, result.stdout + result.stderr
+        failure = _check_files_parallel(repo_path, ["php", "-l"], php_files)
+        if failure is not None:
+            return failure
         
         return 0, "All PHP files syntax check passed"
     except Exception as e:
@@ -522,13 +477,7 @@ def run_php_linting(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[i
     """Run PHP linting"""
     try:
         # Try PHP_CodeSniffer
-        result = subprocess.run(
-            ["phpcs", "."],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+        result = _run_capture_tail(["phpcs", "."], repo_path, 60)
         return result.returncode, result.stdout + result.stderr
     except Exception as e:
         return build_php_project(repo_path, project_analysis)  # Fallback to syntax check
@@ -537,25 +486,14 @@ def run_php_linting(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[i
 # Ruby runners
 def run_ruby_tests(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int, str]:
     """Run Ruby tests"""
+    markers = _markers(repo_path, project_analysis)
     try:
-        if os.path.exists(os.path.join(repo_path, "spec")):
+        if markers["has_spec_dir"]:
             # RSpec
-            result = subprocess.run(
-                ["rspec"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
+            result = _run_capture_tail(["rspec"], repo_path, 120)
         else:
             # Minitest
-            result = subprocess.run(
-                ["ruby", "-Itest", "-e", "Dir.glob('./test/**/*_test.rb').each {|f| require f}"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
+            result = _run_capture_tail(["ruby", "-Itest", "-e", "Dir.glob('./test/**/*_test.rb').each {|f| require f}"], repo_path, 120)
         return result.returncode, result.stdout + result.stderr
     except Exception as e:
         return 1, f"Error running Ruby tests: {e}"
@@ -564,20 +502,13 @@ def run_ruby_tests(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[in
 def build_ruby_project(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[int, str]:
     """Build Ruby project (syntax check)"""
     try:
-        ruby_files = [f for f in project_analysis.get("source_files", []) if f.endswith('.rb')]
+        ruby_files = _source_files(project_analysis, "rb")
         if not ruby_files:
             return 0, "No Ruby files found"
         
-        for ruby_file in ruby_files:
-            result = subprocess.run(
-                ["ruby", "-c", ruby_file],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            if result.returncode != 0:
-                return result.returncode, result.stdout + result.stderr
+        failure = _check_files_parallel(repo_path, ["ruby", "-c"], ruby_files)
+        if failure is not None:
+            return failure
         
         return 0, "All Ruby files syntax check passed"
     except Exception as e:
@@ -588,79 +519,131 @@ def run_ruby_linting(repo_path: str, project_analysis: Dict[str, Any]) -> Tuple[
     """Run Ruby linting"""
     try:
         # Try RuboCop
-        result = subprocess.run(
-            ["rubocop"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+        result = _run_capture_tail(["rubocop"], repo_path, 60)
         return result.returncode, result.stdout + result.stderr
     except Exception as e:
         return build_ruby_project(repo_path, project_analysis)  # Fallback to syntax check
 
 
+# Dispatch tables, bound once at import
+_TEST_RUNNERS = MappingProxyType({
+    'python': run_python_tests,
+    'javascript': run_javascript_tests,
+    'typescript': run_typescript_tests,
+    'csharp': run_csharp_tests,
+    'java': run_java_tests,
+    'go': run_go_tests,
+    'rust': run_rust_tests,
+    'php': run_php_tests,
+    'ruby': run_ruby_tests,
+})
+
+_BUILD_RUNNERS = MappingProxyType({
+    'python': build_python_project,
+    'javascript': build_javascript_project,
+    'typescript': build_typescript_project,
+    'csharp': build_csharp_project,
+    'java': build_java_project,
+    'go': build_go_project,
+    'rust': build_rust_project,
+    'php': build_php_project,
+    'ruby': build_ruby_project,
+})
+
+_LINTERS = MappingProxyType({
+    'python': run_python_linting,
+    'javascript': run_javascript_linting,
+    'typescript': run_typescript_linting,
+    'csharp': run_csharp_linting,
+    'java': run_java_linting,
+    'go': run_go_linting,
+    'rust': run_rust_linting,
+    'php': run_php_linting,
+    'ruby': run_ruby_linting,
+})
+
+# Commands each language's checks may run; a stored result is only reused while they resolve the same
+_CHECK_TOOLS = MappingProxyType({
+    'python': ('python', 'ruff', 'flake8'),
+    'javascript': ('node', 'npm', 'npx'),
+    'typescript': ('node', 'npm', 'npx'),
+    'csharp': ('dotnet',),
+    'java': ('java', 'mvn', 'gradle'),
+    'go': ('go', 'golangci-lint'),
+    'rust': ('cargo',),
+    'php': ('php', 'phpunit', 'phpcs'),
+    'ruby': ('ruby', 'rspec', 'rubocop'),
+})
+
+_CHECKS = MappingProxyType({
+    "tests": run_project_tests,
+    "build": run_project_build,
+    "lint": run_project_linting,
+})
+
+
+_RUN_COMMANDS = {
+    'python': {
+        'run': 'python main.py',
+        'test': 'pytest',
+        'lint': 'ruff check .',
+        'install': 'pip install -r requirements.txt'
+    },
+    'javascript': {
+        'run': 'node index.js',
+        'test': 'npm test',
+        'lint': 'eslint .',
+        'install': 'npm install',
+        'build': 'npm run build'
+    },
+    'typescript': {
+        'run': 'npm start',
+        'test': 'npm test',
+        'lint': 'tsc --noEmit',
+        'install': 'npm install',
+        'build': 'tsc'
+    },
+    'csharp': {
+        'run': 'dotnet run',
+        'test': 'dotnet test',
+        'build': 'dotnet build',
+        'restore': 'dotnet restore'
+    },
+    'java': {
+        'maven_run': 'mvn exec:java',
+        'maven_test': 'mvn test',
+        'maven_build': 'mvn compile',
+        'gradle_run': 'gradle run',
+        'gradle_test': 'gradle test',
+        'gradle_build': 'gradle build'
+    },
+    'go': {
+        'run': 'go run main.go',
+        'test': 'go test ./...',
+        'build': 'go build',
+        'lint': 'go vet ./...'
+    },
+    'rust': {
+        'run': 'cargo run',
+        'test': 'cargo test',
+        'build': 'cargo build',
+        'lint': 'cargo clippy'
+    },
+    'php': {
+        'run': 'php index.php',
+        'test': 'phpunit',
+        'lint': 'phpcs .',
+        'install': 'composer install'
+    },
+    'ruby': {
+        'run': 'ruby main.rb',
+        'test': 'rspec',
+        'lint': 'rubocop',
+        'install': 'bundle install'
+    }
+}
+
+
 def get_run_commands(language: str, project_type: str = "basic") -> Dict[str, str]:
     """Get common run commands for a language"""
-    commands = {
-        'python': {
-            'run': 'python main.py',
-            'test': 'pytest',
-            'lint': 'ruff check .',
-            'install': 'pip install -r requirements.txt'
-        },
-        'javascript': {
-            'run': 'node index.js',
-            'test': 'npm test',
-            'lint': 'eslint .',
-            'install': 'npm install',
-            'build': 'npm run build'
-        },
-        'typescript': {
-            'run': 'npm start',
-            'test': 'npm test',
-            'lint': 'tsc --noEmit',
-            'install': 'npm install',
-            'build': 'tsc'
-        },
-        'csharp': {
-            'run': 'dotnet run',
-            'test': 'dotnet test',
-            'build': 'dotnet build',
-            'restore': 'dotnet restore'
-        },
-        'java': {
-            'maven_run': 'mvn exec:java',
-            'maven_test': 'mvn test',
-            'maven_build': 'mvn compile',
-            'gradle_run': 'gradle run',
-            'gradle_test': 'gradle test',
-            'gradle_build': 'gradle build'
-        },
-        'go': {
-            'run': 'go run main.go',
-            'test': 'go test ./...',
-            'build': 'go build',
-            'lint': 'go vet ./...'
-        },
-        'rust': {
-            'run': 'cargo run',
-            'test': 'cargo test',
-            'build': 'cargo build',
-            'lint': 'cargo clippy'
-        },
-        'php': {
-            'run': 'php index.php',
-            'test': 'phpunit',
-            'lint': 'phpcs .',
-            'install': 'composer install'
-        },
-        'ruby': {
-            'run': 'ruby main.rb',
-            'test': 'rspec',
-            'lint': 'rubocop',
-            'install': 'bundle install'
-        }
-    }
-    
-    return commands.get(language, {})
+    return dict(_RUN_COMMANDS.get(language, {}))
@@ -1,140 +1,18 @@
 # Multi-language dependency management tool
+import hashlib
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
+from . import fast_json
+from .file_operations import read_file_content, write_file_content, write_files_batch
+from .shell import run
 
-def create_dependency_file(repo_path: str, project_analysis: dict) -> bool:
-    """Create appropriate dependency file based on project language"""
-    from .file_operations import write_file_content
-    
-    language = project_analysis.get("primary_language", "unknown")
-    frameworks = project_analysis.get("frameworks", [])
-    
-    if language == "python":
-        return create_python_requirements(repo_path, frameworks)
-    elif language in ["javascript", "typescript"]:
-        return create_package_json(repo_path, frameworks, language)
-    elif language == "csharp":
-        return create_csproj(repo_path, frameworks)
-    elif language == "java":
-        return create_pom_xml(repo_path, frameworks)
-    elif language == "go":
-        return create_go_mod(repo_path, frameworks)
-    elif language == "rust":
-        return create_cargo_toml(repo_path, frameworks)
-    
-    return False
 
-
-def create_python_requirements(repo_path: str, frameworks: list) -> bool:
-    """Create requirements.txt for Python projects"""
-    from .file_operations import write_file_content
-    
-    requirements = []
-    
-    if "fastapi" in frameworks:
-        requirements.extend([
-            "fastapi>=0.100.0",
-            "uvicorn[standard]>=0.23.0",
-            "pydantic>=2.0.0"
-        ])
-    
-    if "flask" in frameworks:
-        requirements.extend([
-            "flask>=2.3.0",
-            "werkzeug>=2.3.0"
-        ])
-    
-    if "django" in frameworks:
-        requirements.extend([
-            "django>=4.2.0",
-            "djangorestframework>=3.14.0"
-        ])
-    
-    # Always add testing dependencies
-    requirements.extend([
-        "pytest>=7.4.0",
-        "pytest-asyncio>=0.21.0"
-    ])
-    
-    # Add httpx for FastAPI testing
-    if "fastapi" in frameworks:
-        requirements.append("httpx>=0.24.0")
-    
-    content = "\n".join(requirements) + "\n"
-    return write_file_content(repo_path, "requirements.txt", content)
-
-
-def create_package_json(repo_path: str, frameworks: list, language: str) -> bool:
-    """Create package.json for Node.js projects"""
-    from .file_operations import write_file_content, read_file_content
-    import json
-    import os
-    
-    # Check if package.json already exists and has React dependencies
-    package_json_path = os.path.join(repo_path, "package.json")
-    if os.path.exists(package_json_path):
-        try:
-            existing_content = read_file_content(repo_path, "package.json")
-            if existing_content and ("react" in existing_content or "react-scripts" in existing_content):
-                # Package.json already exists with React setup, don't override
-                return True
-        except:
-            pass  # If we can't read it, continue with creation
-    
-    package_data = {
-        "name": "generated-project",
-        "version": "1.0.0",
-        "description": "Generated project",
-        "main": "index.js" if language == "javascript" else "dist/index.js",
-        "scripts": {
-            "start": "node index.js" if language == "javascript" else "node dist/index.js",
-            "test": "jest",
-            "build": "tsc" if language == "typescript" else "echo 'No build step needed'"
-        },
-        "dependencies": {},
-        "devDependencies": {}
-    }
-    
-    # Add framework dependencies
-    if "express" in frameworks:
-        package_data["dependencies"]["express"] = "^4.18.0"
-        package_data["devDependencies"]["@types/express"] = "^4.17.0"
-    
-    if "react" in frameworks:
-        package_data["dependencies"].update({
-            "react": "^18.2.0",
-            "react-dom": "^18.2.0"
-        })
-        package_data["devDependencies"].update({
-            "@types/react": "^18.2.0",
-            "@types/react-dom": "^18.2.0"
-        })
-    
-    if "next" in frameworks:
-        package_data["dependencies"]["next"] = "^14.0.0"
-        package_data["scripts"]["dev"] = "next dev"
-        package_data["scripts"]["build"] = "next build"
-        package_data["scripts"]["start"] = "next start"
-    
-    # TypeScript specific
-    if language == "typescript":
-        package_data["devDependencies"]["typescript"] = "^5.0.0"
-        package_data["devDependencies"]["@types/node"] = "^20.0.0"
-    
-    # Testing
-    package_data["devDependencies"]["jest"] = "^29.0.0"
-    
-    content = json.dumps(package_data, indent=2)
-    return write_file_content(repo_path, "package.json", content)
-
-
-def create_csproj(repo_path: str, frameworks: list) -> bool:
-    """Create .csproj file for C# projects"""
-    from .file_operations import write_file_content
-    
-    project_type = "web" if any(f in ["asp.net", "blazor", "mvc"] for f in frameworks) else "console"
-    target_framework = "net8.0"
-    
-    csproj_content = f'''<Project Sdk="Microsoft.NET.Sdk{'.Web' if project_type == 'web' else ''}">
+# Static skeletons for the generated manifests; only the framework fragments vary
+_CSPROJ_TEMPLATE = '''<Project Sdk="Microsoft.NET.Sdk{sdk}">
 
   <PropertyGroup>
     <TargetFramework>{target_framework}</TargetFramework>
@@ -143,30 +21,25 @@ def create_csproj(repo_path: str, frameworks: list) -> bool:
   </PropertyGroup>
 
   <ItemGroup>
-'''
-    
-    # Add package references based on frameworks
-    if "asp.net" in frameworks:
-        csproj_content += '    <PackageReference Include="Microsoft.AspNetCore.OpenApi" Version="8.0.0" />\n'
-        csproj_content += '    <PackageReference Include="Swashbuckle.AspNetCore" Version="6.4.0" />\n'
-    
-    # Testing packages
-    csproj_content += '    <PackageReference Include="Microsoft.NET.Test.Sdk" Version="17.6.0" />\n'
-    csproj_content += '    <PackageReference Include="xunit" Version="2.4.2" />\n'
-    csproj_content += '    <PackageReference Include="xunit.runner.visualstudio" Version="2.4.5" />\n'
-    
-    csproj_content += '''  </ItemGroup>
+{packages}  </ItemGroup>
 
 </Project>'''
-    
-    return write_file_content(repo_path, "Project.csproj", csproj_content)
 
+# Frameworks that make a C# project use the Web SDK
+_WEB_CSHARP = frozenset({"asp.net", "blazor", "mvc"})
 
-def create_pom_xml(repo_path: str, frameworks: list) -> bool:
-    """Create pom.xml for Java projects"""
-    from .file_operations import write_file_content
-    
-    pom_content = '''<?xml version="1.0" encoding="UTF-8"?>
+_CSPROJ_ASPNET_PACKAGES = (
+    '    <PackageReference Include="Microsoft.AspNetCore.OpenApi" Version="8.0.0" />\n'
+    '    <PackageReference Include="Swashbuckle.AspNetCore" Version="6.4.0" />\n'
+)
+
+_CSPROJ_TEST_PACKAGES = (
+    '    <PackageReference Include="Microsoft.NET.Test.Sdk" Version="17.6.0" />\n'
+    '    <PackageReference Include="xunit" Version="2.4.2" />\n'
+    '    <PackageReference Include="xunit.runner.visualstudio" Version="2.4.5" />\n'
+)
+
+_POM_HEADER = '''<?xml version="1.0" encoding="UTF-8"?>
 <project xmlns="http://maven.apache.org/POM/4.0.0"
          xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
          xsi:schemaLocation="http://maven.apache.org/POM/4.0.0 
@@ -186,9 +59,8 @@ def create_pom_xml(repo_path: str, frameworks: list) -> bool:
 
     <dependencies>
 '''
-    
-    if "spring" in frameworks or "springboot" in frameworks:
-        pom_content += '''        <dependency>
+
+_POM_SPRING_DEPS = '''        <dependency>
             <groupId>org.springframework.boot</groupId>
             <artifactId>spring-boot-starter-web</artifactId>
             <version>3.1.0</version>
@@ -200,9 +72,8 @@ def create_pom_xml(repo_path: str, frameworks: list) -> bool:
             <scope>test</scope>
         </dependency>
 '''
-    
-    # Testing dependencies
-    pom_content += '''        <dependency>
+
+_POM_FOOTER = '''        <dependency>
             <groupId>junit</groupId>
             <artifactId>junit</artifactId>
             <version>4.13.2</version>
@@ -220,59 +91,258 @@ def create_pom_xml(repo_path: str, frameworks: list) -> bool:
         </plugins>
     </build>
 </project>'''
-    
-    return write_file_content(repo_path, "pom.xml", pom_content)
 
-
-def create_go_mod(repo_path: str, frameworks: list) -> bool:
-    """Create go.mod for Go projects"""
-    from .file_operations import write_file_content
-    
-    go_mod_content = '''module generated-project
+_GO_MOD_HEADER = '''module generated-project
 
 go 1.21
 '''
-    
-    if frameworks:
-        go_mod_content += '\nrequire (\n'
-        
-        if "gin" in frameworks:
-            go_mod_content += '    github.com/gin-gonic/gin v1.9.1\n'
-        if "echo" in frameworks:
-            go_mod_content += '    github.com/labstack/echo/v4 v4.11.1\n'
-        
-        go_mod_content += ')\n'
-    
-    return write_file_content(repo_path, "go.mod", go_mod_content)
 
+_GO_REQUIRES = (
+    ("gin", '    github.com/gin-gonic/gin v1.9.1\n'),
+    ("echo", '    github.com/labstack/echo/v4 v4.11.1\n'),
+)
 
-def create_cargo_toml(repo_path: str, frameworks: list) -> bool:
-    """Create Cargo.toml for Rust projects"""
-    from .file_operations import write_file_content
-    
-    cargo_content = '''[package]
+_CARGO_HEADER = '''[package]
 name = "generated-project"
 version = "0.1.0"
 edition = "2021"
 
 [dependencies]
 '''
+
+_CARGO_ACTIX_DEPS = 'actix-web = "4.4"\ntokio = { version = "1.0", features = ["full"] }\n'
+_CARGO_WARP_DEPS = 'warp = "0.3"\ntokio = { version = "1.0", features = ["full"] }\n'
+
+# Web framework dependencies, first match wins
+_CARGO_FRAMEWORK_DEPS = {"actix": _CARGO_ACTIX_DEPS, "warp": _CARGO_WARP_DEPS}
+
+# Framework -> requirements, emitted in table order so the output is stable
+_PY_FRAMEWORK_DEPS = {
+    "fastapi": ("fastapi>=0.100.0", "uvicorn[standard]>=0.23.0", "pydantic>=2.0.0"),
+    "flask": ("flask>=2.3.0", "werkzeug>=2.3.0"),
+    "django": ("django>=4.2.0", "djangorestframework>=3.14.0"),
+}
+_PY_TEST_DEPS = ("pytest>=7.4.0", "pytest-asyncio>=0.21.0")
+# Extra test dependencies per framework (httpx for FastAPI's TestClient)
+_PY_FRAMEWORK_TEST_DEPS = {"fastapi": ("httpx>=0.24.0",)}
+
+# Framework -> (dependencies, devDependencies, script overrides)
+_NODE_FRAMEWORK_DEPS = {
+    "express": ({"express": "^4.18.0"}, {"@types/express": "^4.17.0"}, {}),
+    "react": (
+        {"react": "^18.2.0", "react-dom": "^18.2.0"},
+        {"@types/react": "^18.2.0", "@types/react-dom": "^18.2.0"},
+        {},
+    ),
+    "next": ({"next": "^14.0.0"}, {}, {"dev": "next dev", "build": "next build", "start": "next start"}),
+}
+_NODE_TYPESCRIPT_DEV_DEPS = {"typescript": "^5.0.0", "@types/node": "^20.0.0"}
+
+
+def create_dependency_file(repo_path: str, project_analysis: dict) -> bool:
+    """Create appropriate dependency file based on project language"""
+    files = plan_dependency_files(repo_path, project_analysis)
+    if files is None:
+        return False
+    # One batched sweep: parent directories are created once, then each file is written
+    return all(write_files_batch(repo_path, files))
+
+
+def plan_dependency_files(repo_path: str, project_analysis: dict) -> dict[str, str] | None:
+    """
+    Collect the dependency files to write for the project without touching disk.
+    
+    Returns:
+        {file_path: content}, empty when the existing files should be kept,
+        or None when the language has no dependency file
+    """
+    # Content builders are memoized on the framework frozenset, so repeated
+    # framework combinations in a batch run cost a cache lookup
+    language = project_analysis.get("primary_language", "unknown")
+    fw = frozenset(project_analysis.get("frameworks", []))
+    
+    if language == "python":
+        return {"requirements.txt": _python_requirements(fw)}
+    elif language in ["javascript", "typescript"]:
+        if _has_react_package_json(repo_path):
+            return {}
+        return {"package.json": _package_json(fw, language)}
+    elif language == "csharp":
+        return {"Project.csproj": _csproj(fw)}
+    elif language == "java":
+        return {"pom.xml": _pom_xml(fw)}
+    elif language == "go":
+        return {"go.mod": _go_mod(fw)}
+    elif language == "rust":
+        return {"Cargo.toml": _cargo_toml(fw)}
+    
+    return None
+
+
+def create_python_requirements(repo_path: str, frameworks: list) -> bool:
+    """Create requirements.txt for Python projects"""
+    return write_file_content(repo_path, "requirements.txt", _python_requirements(frozenset(frameworks)))
+
+
+@lru_cache(maxsize=64)
+def _python_requirements(fw: frozenset) -> str:
+    requirements = [dep for name, deps in _PY_FRAMEWORK_DEPS.items() if name in fw for dep in deps]
     
-    if "actix" in frameworks:
-        cargo_content += 'actix-web = "4.4"\n'
-        cargo_content += 'tokio = { version = "1.0", features = ["full"] }\n'
-    elif "warp" in frameworks:
-        cargo_content += 'warp = "0.3"\n'
-        cargo_content += 'tokio = { version = "1.0", features = ["full"] }\n'
+    # Always add testing dependencies
+    requirements.extend(_PY_TEST_DEPS)
+    requirements.extend(dep for name, deps in _PY_FRAMEWORK_TEST_DEPS.items() if name in fw for dep in deps)
     
-    return write_file_content(repo_path, "Cargo.toml", cargo_content)
+    return "\n".join(requirements) + "\n"
+
+def create_package_json(repo_path: str, frameworks: list, language: str) -> bool:
+    """Create package.json for Node.js projects"""
+    if _has_react_package_json(repo_path):
+        # Package.json already exists with React setup, don't override
+        return True
+    return write_file_content(repo_path, "package.json", _package_json(frozenset(frameworks), language))
+
+
+def _has_react_package_json(repo_path: str) -> bool:
+    """Whether an existing package.json already declares React dependencies"""
+    existing_content = read_file_content(repo_path, "package.json")  # "" when missing
+    if existing_content:
+        try:
+            existing = fast_json.loads(existing_content)
+            deps = {**existing.get("dependencies", {}), **existing.get("devDependencies", {})}
+            return "react" in deps or "react-scripts" in deps
+        except (ValueError, AttributeError, TypeError):
+            pass  # If we can't parse it, continue with creation
+    return False
+
+
+@lru_cache(maxsize=64)
+def _package_json(fw: frozenset, language: str) -> str:
+    package_data = {
+        "name": "generated-project",
+        "version": "1.0.0",
+        "description": "Generated project",
+        "main": "index.js" if language == "javascript" else "dist/index.js",
+        "scripts": {
+            "start": "node index.js" if language == "javascript" else "node dist/index.js",
+            "test": "jest",
+            "build": "tsc" if language == "typescript" else "echo 'No build step needed'"
+        },
+        "dependencies": {},
+        "devDependencies": {}
+    }
+    
+    # Add framework dependencies
+    for name, (deps, dev_deps, scripts) in _NODE_FRAMEWORK_DEPS.items():
+        if name in fw:
+            package_data["dependencies"].update(deps)
+            package_data["devDependencies"].update(dev_deps)
+            package_data["scripts"].update(scripts)
+    
+    # TypeScript specific
+    if language == "typescript":
+        package_data["devDependencies"].update(_NODE_TYPESCRIPT_DEV_DEPS)
+    
+    # Testing
+    package_data["devDependencies"]["jest"] = "^29.0.0"
+    
+    return fast_json.dumps(package_data, indent=True)
+
+
+def create_csproj(repo_path: str, frameworks: list) -> bool:
+    """Create .csproj file for C# projects"""
+    return write_file_content(repo_path, "Project.csproj", _csproj(frozenset(frameworks)))
+
+
+@lru_cache(maxsize=64)
+def _csproj(fw: frozenset) -> str:
+    project_type = "web" if fw & _WEB_CSHARP else "console"
+    
+    packages = [_CSPROJ_ASPNET_PACKAGES] if "asp.net" in fw else []
+    packages.append(_CSPROJ_TEST_PACKAGES)
+    return _CSPROJ_TEMPLATE.format(
+        sdk=".Web" if project_type == "web" else "",
+        target_framework="net8.0",
+        packages="".join(packages),
+    )
+
+
+def create_pom_xml(repo_path: str, frameworks: list) -> bool:
+    """Create pom.xml for Java projects"""
+    return write_file_content(repo_path, "pom.xml", _pom_xml(frozenset(frameworks)))
+
+
+@lru_cache(maxsize=64)
+def _pom_xml(fw: frozenset) -> str:
+    spring = "spring" in fw or "springboot" in fw
+    return "".join((_POM_HEADER, _POM_SPRING_DEPS if spring else "", _POM_FOOTER))
+
+
+def create_go_mod(repo_path: str, frameworks: list) -> bool:
+    """Create go.mod for Go projects"""
+    return write_file_content(repo_path, "go.mod", _go_mod(frozenset(frameworks)))
+
+
+@lru_cache(maxsize=64)
+def _go_mod(fw: frozenset) -> str:
+    parts = [_GO_MOD_HEADER]
+    if fw:
+        parts.append('\nrequire (\n')
+        parts.extend(line for name, line in _GO_REQUIRES if name in fw)
+        parts.append(')\n')
+    return "".join(parts)
+
+
+def create_cargo_toml(repo_path: str, frameworks: list) -> bool:
+    """Create Cargo.toml for Rust projects"""
+    return write_file_content(repo_path, "Cargo.toml", _cargo_toml(frozenset(frameworks)))
+
+
+@lru_cache(maxsize=64)
+def _cargo_toml(fw: frozenset) -> str:
+    deps = next((deps for name, deps in _CARGO_FRAMEWORK_DEPS.items() if name in fw), "")
+    return _CARGO_HEADER + deps
+
+
+# Sentinel holding the hash of the manifests the last successful install used
+DEPS_HASH_FILE = os.path.join(".agent", "deps_hash")
+
+# Files whose content decides what gets installed, for languages whose setup step is a
+# pure dependency install. The others (mvn compile, cargo build, dotnet restore, go mod
+# tidy) also build or rewrite against the sources, so they always run.
+_DEPS_MANIFESTS = {
+    "python": ("requirements.txt",),
+    "javascript": ("package.json", "package-lock.json", "yarn.lock", "pnpm-lock.yaml"),
+    "typescript": ("package.json", "package-lock.json", "yarn.lock", "pnpm-lock.yaml"),
+}
+
+# Install outputs that must still exist for a cached install to count
+_DEPS_OUTPUTS = {
+    "python": "venv",
+    "javascript": "node_modules",
+    "typescript": "node_modules",
+}
+
+
+def _deps_hash(repo_path: str, language: str) -> str:
+    """blake2b of the language's manifests, or "" when there is nothing to key on (or nothing installed)"""
+    manifests = _DEPS_MANIFESTS.get(language)
+    if not manifests:
+        return ""
+    output = _DEPS_OUTPUTS.get(language)
+    if output and not os.path.isdir(os.path.join(repo_path, output)):
+        return ""
+    h = hashlib.blake2b(language.encode("utf-8"), digest_size=16)
+    for name in manifests:
+        try:
+            with open(os.path.join(repo_path, name), "rb") as f:
+                h.update(b"\0" + name.encode("utf-8") + b"\0" + f.read())
+        except FileNotFoundError:
+            h.update(b"\0" + name.encode("utf-8") + b"\0missing")
+    return h.hexdigest()
 
 
 def setup_project_dependencies(repo_path: str, project_analysis: dict) -> tuple[int, str]:
     """Set up project dependencies for multi-language projects"""
-    from .shell import run
-    import os
-    
     language = project_analysis.get("primary_language", "unknown")
     
     try:
@@ -280,108 +350,205 @@ def setup_project_dependencies(repo_path: str, project_analysis: dict) -> tuple[
         if not create_dependency_file(repo_path, project_analysis):
             return 1, "Failed to create dependency file"
         
+        # Skip the install when the manifests are unchanged since the last successful one
+        deps_hash = _deps_hash(repo_path, language)
+        marker = os.path.join(repo_path, DEPS_HASH_FILE)
+        if deps_hash and read_file_content(repo_path, DEPS_HASH_FILE) == deps_hash:
+            return 0, "Dependencies unchanged since last install (cached)"
+        
         # Language-specific dependency installation
         if language == "python":
-            return setup_python_deps(repo_path)
+            code, out = setup_python_deps(repo_path)
         elif language in ["javascript", "typescript"]:
-            return setup_node_deps(repo_path)
+            code, out = setup_node_deps(repo_path)
         elif language == "csharp":
-            return setup_dotnet_deps(repo_path)
+            code, out = setup_dotnet_deps(repo_path)
         elif language == "java":
-            return setup_java_deps(repo_path)
+            code, out = setup_java_deps(repo_path)
         elif language == "go":
-            return setup_go_deps(repo_path)
+            code, out = setup_go_deps(repo_path)
         elif language == "rust":
-            return setup_rust_deps(repo_path)
+            code, out = setup_rust_deps(repo_path)
         else:
             return 0, f"No dependency setup available for {language}"
+        
+        # Hash after the install: it creates venv/node_modules and may write the lockfile
+        deps_hash = _deps_hash(repo_path, language) if code == 0 else ""
+        if deps_hash:
+            write_file_content(repo_path, DEPS_HASH_FILE, deps_hash)
+        elif os.path.exists(marker):
+            os.remove(marker)
+        return code, out
             
     except Exception as e:
         return 1, f"Error setting up dependencies: {e}"
 
 
+def setup_all(jobs: list[tuple[str, dict]]) -> dict[str, tuple[int, str]]:
+    """
+    Set up dependencies for several sub-projects concurrently.
+    
+    Installs are dominated by network and subprocess waits, so they overlap well on threads.
+    
+    Args:
+        jobs: (repo_path, project_analysis) pairs
+    
+    Returns:
+        Dict mapping each repo_path to its (exit code, output)
+    """
+    if len(jobs) <= 1:
+        return {repo_path: setup_project_dependencies(repo_path, analysis) for repo_path, analysis in jobs}
+    with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+        futures = {executor.submit(setup_project_dependencies, repo_path, analysis): repo_path for repo_path, analysis in jobs}
+        return {futures[future]: future.result() for future in as_completed(futures)}
+
+
+# pip download/wheel cache shared by every generated project
+PIP_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "mcgs", "pip")
+
+
+def _pip_install_options() -> list[str]:
+    """Prefer wheels, skip .pyc compilation, and reuse the shared cache (plus MCGS_WHEELHOUSE if set)"""
+    options = ["--prefer-binary", "--no-compile", "--cache-dir", PIP_CACHE_DIR]
+    wheelhouse = os.environ.get("MCGS_WHEELHOUSE")
+    if wheelhouse:
+        options += ["--find-links", wheelhouse]
+    return options
+
+
+def _create_venv(repo_path: str) -> tuple[int, str]:
+    """Create ./venv with the fastest tool available: uv, then virtualenv, then the stdlib venv"""
+    if shutil.which("uv"):
+        return run(["uv", "venv", "venv"], cwd=repo_path)
+    if shutil.which("virtualenv"):
+        return run(["virtualenv", "venv"], cwd=repo_path)
+    return run(["python", "-m", "venv", "venv"], cwd=repo_path)
+
+
 def setup_python_deps(repo_path: str) -> tuple[int, str]:
     """Setup Python dependencies"""
-    from .shell import run
-    import os
-    
     # Check if we should install dependencies (only if venv exists or we can create one)
     venv_path = os.path.join(repo_path, "venv")
-    if not os.path.exists(venv_path):
+    try:
+        os.stat(venv_path)
+    except FileNotFoundError:
         # Create virtual environment
-        code, out = run(["python", "-m", "venv", "venv"], cwd=repo_path)
+        code, out = _create_venv(repo_path)
         if code != 0:
             return code, f"Failed to create venv: {out}"
     
     # Install dependencies
-    if os.name == 'nt':  # Windows
-        pip_path = os.path.join(venv_path, "Scripts", "pip")
-    else:  # Unix/Linux/macOS
-        pip_path = os.path.join(venv_path, "bin", "pip")
+    bin_dir = os.path.join(venv_path, "Scripts" if os.name == 'nt' else "bin")
+    
+    if shutil.which("uv"):
+        # uv venvs have no pip of their own; uv installs into them directly
+        options = ["--find-links", os.environ["MCGS_WHEELHOUSE"]] if os.environ.get("MCGS_WHEELHOUSE") else []
+        python_path = os.path.join(bin_dir, "python")
+        return run(["uv", "pip", "install", "--python", python_path, *options, "-r", "requirements.txt"], cwd=repo_path)
     
-    code, out = run([pip_path, "install", "-r", "requirements.txt"], cwd=repo_path)
+    pip_path = os.path.join(bin_dir, "pip")
+    code, out = run([pip_path, "install", *_pip_install_options(), "-r", "requirements.txt"], cwd=repo_path)
     return code, out
 
 
 def setup_node_deps(repo_path: str) -> tuple[int, str]:
     """Setup Node.js dependencies"""
-    from .shell import run
-    import os
-    
-    if not os.path.exists(os.path.join(repo_path, "package.json")):
+    try:
+        os.stat(os.path.join(repo_path, "package.json"))
+    except FileNotFoundError:
         return 0, "No package.json found"
     
-    # Check for yarn.lock or use npm
-    if os.path.exists(os.path.join(repo_path, "yarn.lock")):
-        code, out = run(["yarn", "install"], cwd=repo_path)
+    # pnpm hardlinks from its global store instead of copying into node_modules
+    if shutil.which("pnpm"):
+        return run(["pnpm", "install", "--prefer-offline"], cwd=repo_path)
+    
+    try:
+        os.stat(os.path.join(repo_path, "package-lock.json"))
+    except FileNotFoundError:
+        pass
     else:
-        code, out = run(["npm", "install"], cwd=repo_path)
+        code, out = run(["npm", "ci", "--prefer-offline", "--no-audit", "--no-fund"], cwd=repo_path)
+        if code == 0:
+            return code, out
+        # npm ci refuses a lockfile that no longer matches the regenerated package.json
     
-    return code, out
+    try:
+        os.stat(os.path.join(repo_path, "yarn.lock"))
+    except FileNotFoundError:
+        return run(["npm", "install", "--prefer-offline", "--no-audit", "--no-fund"], cwd=repo_path)
+    return run(["yarn", "install", "--frozen-lockfile", "--prefer-offline"], cwd=repo_path)
 
 
 def setup_dotnet_deps(repo_path: str) -> tuple[int, str]:
     """Setup .NET dependencies"""
-    from .shell import run
-    
     code, out = run(["dotnet", "restore"], cwd=repo_path)
     return code, out
 
 
+# Written after the first successful online Java build; later builds try offline first
+JAVA_FETCHED_FILE = os.path.join(".agent", "java_deps_fetched")
+
+
+# Offline build output meaning a dependency or plugin is not in the local cache (Maven, then Gradle);
+# any other failure (compile errors, failing tests, timeouts) would fail the same way online
+_OFFLINE_MISS = re.compile(
+    r"offline mode|has not been downloaded from it before|Could not resolve dependencies"
+    r"|Could not resolve (?:all|plugin|project)|No cached version (?:of|available)",
+    re.IGNORECASE,
+)
+
+
+def _run_offline_first(repo_path: str, offline_cmd: list[str], online_cmd: list[str]) -> tuple[int, str]:
+    """Run offline_cmd once dependencies have been fetched, going online only when it misses the cache"""
+    marker = os.path.join(repo_path, JAVA_FETCHED_FILE)
+    try:
+        os.stat(marker)
+    except FileNotFoundError:
+        pass
+    else:
+        code, out = run(offline_cmd, cwd=repo_path)
+        if code == 0 or not _OFFLINE_MISS.search(out):
+            return code, out
+    # First build, or the offline build is missing newly added dependencies
+    code, out = run(online_cmd, cwd=repo_path)
+    if code == 0:
+        write_file_content(repo_path, JAVA_FETCHED_FILE, "")
+    return code, out
+
+
 def setup_java_deps(repo_path: str) -> tuple[int, str]:
     """Setup Java dependencies"""
-    from .shell import run
-    import os
-    
-    if os.path.exists(os.path.join(repo_path, "pom.xml")):
-        code, out = run(["mvn", "compile"], cwd=repo_path)
-    elif os.path.exists(os.path.join(repo_path, "build.gradle")):
-        code, out = run(["gradle", "build"], cwd=repo_path)
+    try:
+        os.stat(os.path.join(repo_path, "pom.xml"))
+    except FileNotFoundError:
+        pass
     else:
+        # -T 1C: one reactor thread per core
+        return _run_offline_first(repo_path, ["mvn", "-o", "-T", "1C", "compile"], ["mvn", "-T", "1C", "compile"])
+    try:
+        os.stat(os.path.join(repo_path, "build.gradle"))
+    except FileNotFoundError:
         return 0, "No Maven or Gradle build file found"
-    
-    return code, out
+    return _run_offline_first(
+        repo_path,
+        ["gradle", "--offline", "--parallel", "--build-cache", "build"],
+        ["gradle", "--parallel", "--build-cache", "build"],
+    )
 
 
 def setup_go_deps(repo_path: str) -> tuple[int, str]:
     """Setup Go dependencies"""
-    from .shell import run
-    import os
-    
-    if os.path.exists(os.path.join(repo_path, "go.mod")):
-        code, out = run(["go", "mod", "tidy"], cwd=repo_path)
-        return code, out
-    else:
+    try:
+        os.stat(os.path.join(repo_path, "go.mod"))
+    except FileNotFoundError:
         return 0, "No go.mod found"
+    return run(["go", "mod", "tidy"], cwd=repo_path)
 
 
 def setup_rust_deps(repo_path: str) -> tuple[int, str]:
     """Setup Rust dependencies"""
-    from .shell import run
-    import os
-    
-    if os.path.exists(os.path.join(repo_path, "Cargo.toml")):
-        code, out = run(["cargo", "build"], cwd=repo_path)
-        return code, out
-    else:
+    try:
+        os.stat(os.path.join(repo_path, "Cargo.toml"))
+    except FileNotFoundError:
         return 0, "No Cargo.toml found"
+    return run(["cargo", "build"], cwd=repo_path)
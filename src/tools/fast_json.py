@@ -0,0 +1,44 @@
+"""
+JSON encode/decode through orjson when it is installed.
+
+orjson is several times faster than the stdlib on the multi-KB payloads the
+agents pass around (LLM responses, project analyses, session state). The
+stdlib is used with matching options when orjson is not available.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # orjson not available, use the stdlib
+
+
+JSONDecodeError = orjson.JSONDecodeError if orjson else json.JSONDecodeError
+
+
+def loads(data: Any) -> Any:
+    """Decode JSON from str or bytes."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Encode obj as JSON text (2-space indent when indent is set; default converts unsupported types)."""
+    if orjson:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        sort_keys=sort_keys,
+        default=default,
+        ensure_ascii=False,
+        separators=None if indent else (",", ":"),
+    )
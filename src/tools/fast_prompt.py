@@ -0,0 +1,28 @@
+"""
+Prompts split into a static system block and a small human template.
+
+ChatPromptTemplate re-parses and re-renders every message on each call. When the
+system block has no variables it can be built once, and only the human turn needs
+formatting. Keeping the system text a single interned string also keeps the
+prompt prefix byte-identical across calls, which is what provider prompt caches
+match on.
+"""
+
+import sys
+from typing import List
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+
+class SplitPrompt:
+    """A static system prompt plus a str.format_map human template."""
+
+    def __init__(self, system_static: str, human_template: str):
+        self.system_static = sys.intern(system_static)
+        self.human_template = human_template
+
+    def format_messages(self, **kwargs) -> List[BaseMessage]:
+        return [
+            SystemMessage(content=self.system_static),
+            HumanMessage(content=self.human_template.format_map(kwargs)),
+        ]
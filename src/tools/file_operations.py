@@ -1,6 +1,13 @@
 import os
+import re
+import stat
 import json
-from typing import List, Dict, Any
+import fnmatch
+import hashlib
+import secrets
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Mapping, Optional, Tuple, Union
 
 
 def read_file_content(repo_path: str, file_path: str) -> str:
@@ -15,9 +22,39 @@ def read_file_content(repo_path: str, file_path: str) -> str:
         return f"Error reading file: {e}"
 
 
-def write_file_content(repo_path: str, file_path: str, content: str) -> bool:
-    """Write content to a file relative to repo_path"""
-    full_path = os.path.join(repo_path, file_path)
+def read_file_head_bytes(repo_path: str, file_path: str, max_bytes: int = 16384, max_size: Optional[int] = None) -> bytes:
+    """Read at most the first max_bytes of a file relative to repo_path, undecoded (b"" if unreadable or over max_size)"""
+    try:
+        with open(os.path.join(repo_path, file_path), 'rb') as f:
+            if max_size is not None and os.fstat(f.fileno()).st_size > max_size:
+                return b""
+            return f.read(max_bytes)
+    except OSError:
+        return b""
+
+
+def read_file_head(repo_path: str, file_path: str, max_bytes: int = 16384, max_size: Optional[int] = None) -> str:
+    """Read at most the first max_bytes of a file relative to repo_path ("" if unreadable or over max_size)"""
+    # The cut may split a multi-byte character; drop it rather than fail
+    return read_file_head_bytes(repo_path, file_path, max_bytes, max_size).decode('utf-8', errors='ignore')
+
+
+def _same_content(full_path: str, st: os.stat_result, data: bytes) -> bool:
+    """Whether the existing file already holds exactly data (size is checked before reading)"""
+    if st.st_size != len(data):
+        return False
+    try:
+        with open(full_path, 'rb') as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+# Set AGENT_WRITE_NO_FSYNC=1 to skip fsync when scaffolding throwaway projects
+_FSYNC = not os.environ.get("AGENT_WRITE_NO_FSYNC")
+
+
+def _write_text(full_path: str, file_path: str, content: str, make_dirs: bool = True) -> bool:
     try:
         # Validate content is string
         if not isinstance(content, str):
@@ -26,9 +63,41 @@ def write_file_content(repo_path: str, file_path: str, content: str) -> bool:
             return False
             
         # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        with open(full_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        directory = os.path.dirname(full_path) or '.'
+        if make_dirs:
+            os.makedirs(directory, exist_ok=True)
+        data = content.encode('utf-8')
+        try:
+            st = os.stat(full_path)
+        except FileNotFoundError:
+            st = None
+        if st is not None and _same_content(full_path, st, data):
+            return True  # leave mtime alone so downstream build tools see no change
+        
+        # Write a sibling temp file and rename it over the target, so readers and
+        # crashes only ever see the old or the new content, never a torn file
+        # Created 0666 so the umask applies to new files, as open(..., 'w') did
+        tmp_path = os.path.join(directory, f".{os.path.basename(full_path)}.{secrets.token_hex(4)}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+        try:
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                if _FSYNC:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+            # Keep an existing target's mode
+            if st is not None:
+                os.chmod(tmp_path, stat.S_IMODE(st.st_mode))
+            os.replace(tmp_path, full_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
         return True
     except Exception as e:
         print(f"Error writing file {file_path}: {e}")
@@ -36,28 +105,102 @@ def write_file_content(repo_path: str, file_path: str, content: str) -> bool:
         return False
 
 
+def write_file_content(repo_path: str, file_path: str, content: str) -> bool:
+    """Write content to a file relative to repo_path"""
+    return _write_text(os.path.join(repo_path, file_path), file_path, content)
+
+
+# Below this many files a thread pool costs more than it overlaps
+_PARALLEL_WRITE_MIN = 4
+
+
+def write_files_batch(repo_path: str, files: Union[Dict[str, str], List[Tuple[str, str]]]) -> List[bool]:
+    """Write (file_path, content) pairs or a {file_path: content} dict relative to repo_path; returns per-file success in order"""
+    if isinstance(files, dict):
+        files = list(files.items())
+    targets = [(os.path.join(repo_path, file_path), file_path, content) for file_path, content in files]
+    
+    # Create each distinct parent directory once instead of once per file
+    for directory in {os.path.dirname(full_path) for full_path, _, _ in targets}:
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError:
+            pass  # reported by the write below
+    
+    if len(targets) < _PARALLEL_WRITE_MIN:
+        return [_write_text(full_path, file_path, content, make_dirs=False) for full_path, file_path, content in targets]
+    
+    # Files are independent, so write them concurrently; map() keeps results in submission order
+    with ThreadPoolExecutor(max_workers=min(8, len(targets))) as pool:
+        return list(pool.map(lambda target: _write_text(*target, make_dirs=False), targets))
+
+
+# Directories list_files never descends into (hidden ones are skipped too)
+_LIST_SKIP_DIRS = frozenset({'__pycache__', 'node_modules', 'venv', 'env'})
+
+
+@lru_cache(maxsize=32)
+def _name_matcher(pattern: str):
+    """Compiled fnmatch pattern (case-insensitive on Windows, like fnmatch.fnmatch)"""
+    return re.compile(fnmatch.translate(pattern), re.IGNORECASE if os.name == 'nt' else 0).match
+
+
 def list_files(repo_path: str, pattern: str = "*.py") -> List[str]:
-    """List files in repo matching pattern"""
-    import glob
+    """List files in repo whose name matches pattern"""
+    match = _name_matcher(pattern)
     files = []
-    for root, dirs, filenames in os.walk(repo_path):
-        # Skip hidden directories and common build/cache directories
-        dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['__pycache__', 'node_modules', 'venv', 'env']]
-        for filename in filenames:
-            if not filename.startswith('.'):
-                rel_path = os.path.relpath(os.path.join(root, filename), repo_path)
-                files.append(rel_path)
+    stack = [(repo_path, "")]
+    while stack:
+        base, prefix = stack.pop()
+        try:
+            with os.scandir(base) as it:
+                for entry in it:
+                    name = entry.name
+                    # Skip hidden files/directories and common build/cache directories
+                    if name.startswith('.'):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in _LIST_SKIP_DIRS:
+                            stack.append((entry.path, prefix + name + os.sep))
+                    elif match(name) and entry.is_file():
+                        files.append(prefix + name)
+        except OSError:
+            continue
     return files
 
 
+def fingerprint_files(repo_path: str, files: List[str]) -> str:
+    """Cheap content fingerprint of files relative to repo_path from their (path, mtime, size)"""
+    h = hashlib.blake2b(digest_size=16)
+    for file_path in sorted(set(files)):
+        try:
+            st = os.stat(os.path.join(repo_path, file_path))
+            h.update(f"{file_path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode("utf-8", "surrogateescape"))
+        except OSError:
+            h.update(f"{file_path}\0missing\n".encode("utf-8", "surrogateescape"))
+    return h.hexdigest()
+
+
 def analyze_project_structure(repo_path: str) -> Dict[str, Any]:
     """Analyze the project structure to understand what kind of project it is"""
-    # Use the new language detector
+    # Use the new language detector (it caches per repo root mtime)
     from .language_detector import analyze_project_structure as detect_structure
     return detect_structure(repo_path)
 
 
-def get_project_template(language: str, project_type: str = "basic") -> Dict[str, str]:
-    """Get project template files for a specific language and type"""
+def invalidate_project_analysis(repo_path: str):
+    """Drop the cached analysis for repo_path (call after writing files into it)"""
+    from .language_detector import invalidate_project_analysis as invalidate
+    invalidate(repo_path)
+
+
+def get_project_template(language: str, project_type: str = "basic") -> Mapping[str, str]:
+    """Get project template files for a specific language and type (shared; read-only)"""
     from .project_templates import get_template_files
     return get_template_files(language, project_type)
+
+
+def write_templates(repo_path: str, language: str, project_type: str = "basic") -> List[bool]:
+    """Scaffold a project template into repo_path; returns per-file success in template order"""
+    from .project_templates import iter_template_files
+    return write_files_batch(repo_path, list(iter_template_files(language, project_type)))
@@ -1,8 +1,7 @@
-from .shell import run
+from .shell import run_bytes
 
 
 def ensure_branch(repo_path: str, name: str) -> str:
-    code, out = run(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=repo_path)
-    # create if not exists
-    run(["git", "checkout", "-B", name], cwd=repo_path)
+    # -B creates the branch or resets it to HEAD, so no prior lookup is needed
+    run_bytes(["git", "checkout", "-B", name], cwd=repo_path)
     return name
@@ -1,7 +1,14 @@
 import os
-from typing import Optional, Dict, Any
+import sys
+import time
+import functools
+from dataclasses import asdict, dataclass, replace
+from importlib.util import find_spec
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping
 from langchain_huggingface import HuggingFaceEndpoint, ChatHuggingFace
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage
 
 # Load environment variables
 try:
@@ -10,132 +17,158 @@ try:
 except ImportError:
     pass  # dotenv not available, rely on system environment
 
+# Environment-derived settings, read once after .env is loaded (see refresh_env_snapshot)
+_HF_MODEL_ID_OVERRIDE = os.getenv("HF_MODEL_ID")
+_HF_TOKEN = os.getenv("HUGGINGFACEHUB_API_TOKEN")
+
+
+@dataclass(frozen=True, slots=True)
+class ModelConfig:
+    """Settings for one chat model; max_new_tokens is used by Hugging Face, max_tokens by the others."""
+    provider: str
+    model_id: str
+    temperature: float
+    max_new_tokens: int = 1024
+    max_tokens: int = 1024
+
 
 # Model configurations for different use cases
 MODEL_CONFIGS = {
-    "default": {
-        "provider": "huggingface",
-        "model_id": "meta-llama/Meta-Llama-3.1-8B-Instruct",
-        "temperature": 0.2,
-        "max_new_tokens": 1024,
-    },
-    "planning": {
-        "provider": "huggingface", 
-        "model_id": "meta-llama/Meta-Llama-3.1-70B-Instruct",  # Larger model for complex planning
-        "temperature": 0.3,
-        "max_new_tokens": 2048,
-    },
-    "coding": {
-        "provider": "huggingface",
-        "model_id": "meta-llama/Meta-Llama-3.1-8B-Instruct",  # Use working model for now
-        "temperature": 0.1,  # Lower temperature for more deterministic code
-        "max_new_tokens": 4096,
-    },
-    "architecture": {
-        "provider": "huggingface",
-        "model_id": "meta-llama/Meta-Llama-3.1-8B-Instruct",
-        "temperature": 0.2,
-        "max_new_tokens": 1536,
-    },
+    "default": ModelConfig(
+        provider="huggingface",
+        model_id="meta-llama/Meta-Llama-3.1-8B-Instruct",
+        temperature=0.2,
+        max_new_tokens=1024,
+    ),
+    "planning": ModelConfig(
+        provider="huggingface", 
+        model_id="meta-llama/Meta-Llama-3.1-70B-Instruct",  # Larger model for complex planning
+        temperature=0.3,
+        max_new_tokens=2048,
+    ),
+    "coding": ModelConfig(
+        provider="huggingface",
+        model_id="meta-llama/Meta-Llama-3.1-8B-Instruct",  # Use working model for now
+        temperature=0.1,  # Lower temperature for more deterministic code
+        max_new_tokens=4096,
+    ),
+    "architecture": ModelConfig(
+        provider="huggingface",
+        model_id="meta-llama/Meta-Llama-3.1-8B-Instruct",
+        temperature=0.2,
+        max_new_tokens=1536,
+    ),
     # Additional Hugging Face models for variety
-    "mistral": {
-        "provider": "huggingface",
-        "model_id": "mistralai/Mistral-7B-Instruct-v0.1",
-        "temperature": 0.2,
-        "max_new_tokens": 1024,
-    },
-    "codellama": {
-        "provider": "huggingface", 
-        "model_id": "codellama/CodeLlama-13b-Instruct-hf",
-        "temperature": 0.1,
-        "max_new_tokens": 2048,
-    },
-    "gemma": {
-        "provider": "huggingface",
-        "model_id": "google/gemma-7b-it",
-        "temperature": 0.3,
-        "max_new_tokens": 1024,
-    },
+    "mistral": ModelConfig(
+        provider="huggingface",
+        model_id="mistralai/Mistral-7B-Instruct-v0.1",
+        temperature=0.2,
+        max_new_tokens=1024,
+    ),
+    "codellama": ModelConfig(
+        provider="huggingface", 
+        model_id="codellama/CodeLlama-13b-Instruct-hf",
+        temperature=0.1,
+        max_new_tokens=2048,
+    ),
+    "gemma": ModelConfig(
+        provider="huggingface",
+        model_id="google/gemma-7b-it",
+        temperature=0.3,
+        max_new_tokens=1024,
+    ),
     # Language-specific coding models (when available)
-    "python_coding": {
-        "provider": "huggingface",
-        "model_id": "meta-llama/Meta-Llama-3.1-8B-Instruct",
-        "temperature": 0.1,
-        "max_new_tokens": 4096,
-    },
-    "javascript_coding": {
-        "provider": "huggingface", 
-        "model_id": "meta-llama/Meta-Llama-3.1-8B-Instruct",
-        "temperature": 0.1,
-        "max_new_tokens": 4096,
-    },
-    "csharp_coding": {
-        "provider": "huggingface",
-        "model_id": "meta-llama/Meta-Llama-3.1-8B-Instruct", 
-        "temperature": 0.1,
-        "max_new_tokens": 4096,
-    },
+    "python_coding": ModelConfig(
+        provider="huggingface",
+        model_id="meta-llama/Meta-Llama-3.1-8B-Instruct",
+        temperature=0.1,
+        max_new_tokens=4096,
+    ),
+    "javascript_coding": ModelConfig(
+        provider="huggingface", 
+        model_id="meta-llama/Meta-Llama-3.1-8B-Instruct",
+        temperature=0.1,
+        max_new_tokens=4096,
+    ),
+    "csharp_coding": ModelConfig(
+        provider="huggingface",
+        model_id="meta-llama/Meta-Llama-3.1-8B-Instruct", 
+        temperature=0.1,
+        max_new_tokens=4096,
+    ),
     # OpenAPI models (require langchain-openai)
-    "openai_gpt4": {
-        "provider": "openai",
-        "model_id": "gpt-4",
-        "temperature": 0.2,
-        "max_tokens": 1024,
-    },
-    "openai_gpt35": {
-        "provider": "openai",
-        "model_id": "gpt-3.5-turbo",
-        "temperature": 0.2,
-        "max_tokens": 1024,
-    },
+    "openai_gpt4": ModelConfig(
+        provider="openai",
+        model_id="gpt-4",
+        temperature=0.2,
+        max_tokens=1024,
+    ),
+    "openai_gpt35": ModelConfig(
+        provider="openai",
+        model_id="gpt-3.5-turbo",
+        temperature=0.2,
+        max_tokens=1024,
+    ),
     # Anthropic models (require langchain-anthropic)
-    "anthropic_claude": {
-        "provider": "anthropic", 
-        "model_id": "claude-3-sonnet-20240229",
-        "temperature": 0.2,
-        "max_tokens": 1024,
-    },
-    "anthropic_haiku": {
-        "provider": "anthropic",
-        "model_id": "claude-3-haiku-20240307",
-        "temperature": 0.2,
-        "max_tokens": 1024,
-    },
+    "anthropic_claude": ModelConfig(
+        provider="anthropic", 
+        model_id="claude-3-sonnet-20240229",
+        temperature=0.2,
+        max_tokens=1024,
+    ),
+    "anthropic_haiku": ModelConfig(
+        provider="anthropic",
+        model_id="claude-3-haiku-20240307",
+        temperature=0.2,
+        max_tokens=1024,
+    ),
     # Ollama models (require langchain-ollama)
-    "ollama_codellama": {
-        "provider": "ollama",
-        "model_id": "codellama:13b",
-        "temperature": 0.1,
-        "max_tokens": 4096,
-    },
-    "ollama_mistral": {
-        "provider": "ollama", 
-        "model_id": "mistral:7b",
-        "temperature": 0.2,
-        "max_tokens": 2048,
-    },
+    "ollama_codellama": ModelConfig(
+        provider="ollama",
+        model_id="codellama:13b",
+        temperature=0.1,
+        max_tokens=4096,
+    ),
+    "ollama_mistral": ModelConfig(
+        provider="ollama", 
+        model_id="mistral:7b",
+        temperature=0.2,
+        max_tokens=2048,
+    ),
 }
 
 
+def _share_identical_configs(configs: Dict[str, ModelConfig]) -> None:
+    """Point names with equal settings at one ModelConfig and intern its strings."""
+    shared: Dict[ModelConfig, ModelConfig] = {}
+    for name, config in configs.items():
+        config = replace(config, provider=sys.intern(config.provider), model_id=sys.intern(config.model_id))
+        configs[name] = shared.setdefault(config, config)
+
+
+# coding, python_coding, javascript_coding and csharp_coding end up as one object
+_share_identical_configs(MODEL_CONFIGS)
+
+
 # Language-specific model preferences
 LANGUAGE_MODEL_PREFERENCES = {
-    "python": ["python_coding", "coding", "default"],
-    "javascript": ["javascript_coding", "coding", "default"],
-    "typescript": ["javascript_coding", "coding", "default"],
-    "csharp": ["csharp_coding", "coding", "default"],
-    "java": ["coding", "default"],
-    "go": ["coding", "default"],
-    "rust": ["coding", "default"],
-    "cpp": ["coding", "default"],
-    "c": ["coding", "default"],
+    "python": ("python_coding", "coding", "default"),
+    "javascript": ("javascript_coding", "coding", "default"),
+    "typescript": ("javascript_coding", "coding", "default"),
+    "csharp": ("csharp_coding", "coding", "default"),
+    "java": ("coding", "default"),
+    "go": ("coding", "default"),
+    "rust": ("coding", "default"),
+    "cpp": ("coding", "default"),
+    "c": ("coding", "default"),
 }
 
 # Task-specific model fallbacks
 TASK_MODEL_FALLBACKS = {
-    "coding": ["coding", "python_coding", "javascript_coding", "default"],
-    "planning": ["planning", "architecture", "default"],
-    "architecture": ["architecture", "planning", "default"],
-    "general": ["default"],
+    "coding": ("coding", "python_coding", "javascript_coding", "default"),
+    "planning": ("planning", "architecture", "default"),
+    "architecture": ("architecture", "planning", "default"),
+    "general": ("default",),
 }
 
 
@@ -143,6 +176,9 @@ def select_best_model_for_language(language: str, task: str = "coding") -> str:
     """
     Select the best available model for a given programming language and task.
     
+    Every (language, task) combination is resolved once into a lookup table;
+    reset_provider_cache() rebuilds it after environment changes.
+    
     Args:
         language: Programming language (python, javascript, etc.)
         task: Type of task (coding, planning, architecture, etc.)
@@ -157,14 +193,37 @@ def select_best_model_for_language(language: str, task: str = "coding") -> str:
         >>> select_best_model_for_language("rust", "planning") 
         'planning'  # language-specific not needed for planning
     """
-    
+    table = _resolved_models or _build_resolved_table()
+    # Languages and tasks without preferences share the None row/column
+    key = (
+        language if language in LANGUAGE_MODEL_PREFERENCES else None,
+        task if task in TASK_MODEL_FALLBACKS else None,
+    )
+    return table[key]
+
+
+# (language or None, task or None) -> config name, built on first use
+_resolved_models: Optional[MappingProxyType] = None
+
+
+def _build_resolved_table() -> MappingProxyType:
+    global _resolved_models
+    _resolved_models = MappingProxyType({
+        (language, task): _resolve_model(language, task)
+        for language in (*LANGUAGE_MODEL_PREFERENCES, None)
+        for task in (*TASK_MODEL_FALLBACKS, None)
+    })
+    return _resolved_models
+
+
+def _resolve_model(language: Optional[str], task: Optional[str]) -> str:
     # First try language-specific models
     if language in LANGUAGE_MODEL_PREFERENCES:
         for model_config in LANGUAGE_MODEL_PREFERENCES[language]:
             if model_config in MODEL_CONFIGS:
                 # Check if the provider is available
                 config = MODEL_CONFIGS[model_config]
-                if is_provider_available(config["provider"]):
+                if is_provider_available(config.provider):
                     return model_config
     
     # Fall back to task-specific models
@@ -172,88 +231,166 @@ def select_best_model_for_language(language: str, task: str = "coding") -> str:
         for model_config in TASK_MODEL_FALLBACKS[task]:
             if model_config in MODEL_CONFIGS:
                 config = MODEL_CONFIGS[model_config]
-                if is_provider_available(config["provider"]):
+                if is_provider_available(config.provider):
                     return model_config
     
     # Final fallback to default
     return "default"
 
 
+# How long an Ollama health probe result is trusted, in seconds
+OLLAMA_PROBE_TTL = 60.0
+
+_ollama_probe: Optional[tuple] = None  # (checked_at, available)
+_ollama_session = None
+
+
 def is_provider_available(provider: str) -> bool:
     """
     Check if a provider is available based on environment variables and dependencies.
     
+    Key-based providers are resolved once per process (environment variables don't
+    change after startup); the Ollama probe is cached for OLLAMA_PROBE_TTL seconds.
+    Call reset_provider_cache() after changing the environment.
+    
     Args:
         provider: Provider name (huggingface, openai, anthropic, ollama)
         
     Returns:
         True if provider is available, False otherwise
     """
-    
-    if provider == "huggingface":
-        return bool(os.environ.get("HUGGINGFACEHUB_API_TOKEN"))
-    
-    elif provider == "openai":
-        return bool(os.environ.get("OPENAI_API_KEY"))
-    
-    elif provider == "anthropic":
-        return bool(os.environ.get("ANTHROPIC_API_KEY"))
-    
-    elif provider == "ollama":
-        # Check if Ollama is running locally
-        try:
-            import requests
-            base_url = os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434")
-            response = requests.get(f"{base_url}/api/tags", timeout=2)
-            return response.status_code == 200
-        except:
-            return False
-    
-    return False
+    if provider == "ollama":
+        return _ollama_available()
+    return _provider_available_cached(provider)
+
 
+# API key variable per key-based provider
+_PROVIDER_ENVS = MappingProxyType({
+    "huggingface": "HUGGINGFACEHUB_API_TOKEN",
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+})
 
-def _create_huggingface_chat(config: Dict[str, Any]) -> BaseChatModel:
+
+@functools.lru_cache(maxsize=None)
+def _provider_available_cached(provider: str) -> bool:
+    env = _PROVIDER_ENVS.get(provider)
+    if env is None or not _PROVIDER_SDK_INSTALLED.get(provider, True):
+        return False
+    return bool(os.environ.get(env))
+
+
+def _ollama_available() -> bool:
+    global _ollama_probe
+    now = time.monotonic()
+    if _ollama_probe is not None and now - _ollama_probe[0] < OLLAMA_PROBE_TTL:
+        return _ollama_probe[1]
+    
+    # Check if Ollama is running locally
+    try:
+        base_url = os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434")
+        response = _get_ollama_session().get(f"{base_url}/api/tags", timeout=2)
+        available = response.status_code == 200
+    except:
+        available = False
+    _ollama_probe = (now, available)
+    return available
+
+
+def _get_ollama_session():
+    """Keep-alive session for the Ollama probe so repeat checks skip the TCP handshake."""
+    global _ollama_session
+    if _ollama_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        session = requests.Session()
+        session.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=2, max_retries=0))
+        session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=2, max_retries=0))
+        session.headers["Connection"] = "keep-alive"
+        _ollama_session = session
+    return _ollama_session
+
+
+def reset_provider_cache():
+    """Forget cached provider availability (e.g. after changing environment variables)."""
+    global _ollama_probe, _resolved_models
+    _provider_available_cached.cache_clear()
+    _ollama_probe = None
+    _resolved_models = None
+
+
+def refresh_env_snapshot():
+    """Re-read HF_MODEL_ID and the Hugging Face token, dropping everything derived from them."""
+    global _HF_MODEL_ID_OVERRIDE, _HF_TOKEN
+    _HF_MODEL_ID_OVERRIDE = os.getenv("HF_MODEL_ID")
+    _HF_TOKEN = os.getenv("HUGGINGFACEHUB_API_TOKEN")
+    reset_provider_cache()
+    clear_chat_cache()
+
+
+def _create_huggingface_chat(config: ModelConfig, token: Optional[str]) -> BaseChatModel:
     """Create a Hugging Face chat model."""
-    token = os.environ.get("HUGGINGFACEHUB_API_TOKEN")
     if not token:
         raise ValueError("HUGGINGFACEHUB_API_TOKEN environment variable is required. Please set it in your .env file or environment.")
     
     llm = HuggingFaceEndpoint(
-        repo_id=config["model_id"],
-        temperature=config["temperature"],
-        max_new_tokens=config["max_new_tokens"],
+        repo_id=config.model_id,
+        temperature=config.temperature,
+        max_new_tokens=config.max_new_tokens,
         huggingfacehub_api_token=token,
     )
     return ChatHuggingFace(llm=llm)
 
 
-def _create_openai_chat(config: Dict[str, Any]) -> BaseChatModel:
+# Optional provider SDKs, detected once without importing them
+_HAS_OPENAI = find_spec("langchain_openai") is not None
+_HAS_ANTHROPIC = find_spec("langchain_anthropic") is not None
+_PROVIDER_SDK_INSTALLED = {"openai": _HAS_OPENAI, "anthropic": _HAS_ANTHROPIC}
+
+# Provider name -> chat model class, filled on first use
+_PROVIDER_MODULES: Dict[str, Any] = {}
+
+
+def _create_openai_chat(config: ModelConfig, api_key: Optional[str]) -> BaseChatModel:
     """Create an OpenAI chat model."""
-    try:
+    ChatOpenAI = _PROVIDER_MODULES.get("openai")
+    if ChatOpenAI is None:
         from langchain_openai import ChatOpenAI
-        return ChatOpenAI(
-            model=config["model_id"],
-            temperature=config["temperature"],
-            max_tokens=config.get("max_tokens", 1024),
-            api_key=os.environ.get("OPENAI_API_KEY"),
-        )
-    except ImportError:
-        raise NotImplementedError(
-            "OpenAI provider requires langchain-openai. Install with: pip install langchain-openai"
-        )
+        _PROVIDER_MODULES["openai"] = ChatOpenAI
+    return ChatOpenAI(
+        model=config.model_id,
+        temperature=config.temperature,
+        max_tokens=config.max_tokens,
+        api_key=api_key,
+    )
+
+
+def _create_anthropic_chat(config: ModelConfig, api_key: Optional[str]) -> BaseChatModel:
+    """Create an Anthropic chat model."""
+    ChatAnthropic = _PROVIDER_MODULES.get("anthropic")
+    if ChatAnthropic is None:
+        from langchain_anthropic import ChatAnthropic
+        _PROVIDER_MODULES["anthropic"] = ChatAnthropic
+    return ChatAnthropic(
+        model=config.model_id,
+        temperature=config.temperature,
+        max_tokens=config.max_tokens,
+        api_key=api_key,
+    )
+
+
+def _missing_sdk_factory(name: str, package: str):
+    """Factory that fails straight away for a provider whose SDK isn't installed."""
+    def create(config: ModelConfig, api_key: Optional[str]) -> BaseChatModel:
+        raise NotImplementedError(f"{name} provider requires {package}. Install with: pip install {package}")
+    return create
 
 
-def _create_anthropic_chat(config: Dict[str, Any]) -> BaseChatModel:
-    """Create an Anthropic chat model. (Placeholder - requires langchain-anthropic)"""
-    # TODO: Uncomment when langchain-anthropic is installed  
-    # from langchain_anthropic import ChatAnthropic
-    # return ChatAnthropic(
-    #     model=config["model_id"],
-    #     temperature=config["temperature"],
-    #     max_tokens=config.get("max_tokens", 1024),
-    #     api_key=os.environ.get("ANTHROPIC_API_KEY"),
-    # )
-    raise NotImplementedError("Anthropic provider not yet implemented. Add langchain-anthropic to requirements.txt")
+# Bind the failing stubs once at import instead of catching ImportError per call
+if not _HAS_OPENAI:
+    _create_openai_chat = _missing_sdk_factory("OpenAI", "langchain-openai")
+if not _HAS_ANTHROPIC:
+    _create_anthropic_chat = _missing_sdk_factory("Anthropic", "langchain-anthropic")
 
 
 # Provider factory mapping
@@ -292,49 +429,117 @@ def make_chat(
         # Mix config with overrides
         chat = make_chat("planning", temperature=0.5)
         
-        # Use different provider (when implemented)
+        # Use a different provider (needs its SDK and API key)
         chat = make_chat("openai_gpt4")
-    """
     
-    # Start with default config
-    config = MODEL_CONFIGS["default"].copy()
+    Clients are cached per resolved config and credential, so repeated calls
+    reuse the same warm client (connection pool, credentials) instead of rebuilding it.
+    """
     
     # Apply named config if provided
     if model_config and model_config in MODEL_CONFIGS:
-        config.update(MODEL_CONFIGS[model_config])
+        named = MODEL_CONFIGS[model_config]
     elif model_config:
         raise ValueError(f"Unknown model config: {model_config}. Available: {list(MODEL_CONFIGS.keys())}")
+    else:
+        named = MODEL_CONFIGS["default"]
     
+    overrides = {}
     # Apply environment variable overrides ONLY if no specific config was requested
     # This allows HF_MODEL_ID to override the default, but preserves specialized configs
-    if os.getenv("HF_MODEL_ID") and not model_config:
-        config["model_id"] = os.getenv("HF_MODEL_ID")
+    if _HF_MODEL_ID_OVERRIDE and not model_config:
+        overrides["model_id"] = _HF_MODEL_ID_OVERRIDE
     
     # Apply parameter overrides
     if model_id:
-        config["model_id"] = model_id
+        overrides["model_id"] = model_id
     if provider:
-        config["provider"] = provider
-    config.update(kwargs)
+        overrides["provider"] = provider
+    overrides.update(kwargs)
     
+    # Configs are frozen, so the shared instance is used as-is unless something is overridden
+    config = replace(named, **overrides) if overrides else named
+    return _build_chat(config)
+
+
+def _build_chat(config: ModelConfig) -> BaseChatModel:
     # Get the provider factory
-    provider_name = config["provider"]
+    provider_name = config.provider
     if provider_name not in PROVIDER_FACTORIES:
         raise ValueError(f"Unknown provider: {provider_name}. Available: {list(PROVIDER_FACTORIES.keys())}")
     
-    # Create and return the chat model
-    factory = PROVIDER_FACTORIES[provider_name]
-    return factory(config)
+    # The credential is part of the key so a rotated key takes effect
+    credential = _HF_TOKEN if provider_name == "huggingface" else os.environ.get(_PROVIDER_ENVS[provider_name])
+    return _cached_client(config, credential)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_client(config: ModelConfig, credential: Optional[str]) -> BaseChatModel:
+    """One live client per resolved config and credential."""
+    return PROVIDER_FACTORIES[config.provider](config, credential)
+
 
+def clear_chat_cache():
+    """Drop all cached chat model instances."""
+    _cached_client.cache_clear()
 
-def list_available_models() -> Dict[str, Dict[str, Any]]:
+
+# Providers that only reuse a cached prompt prefix when it is explicitly marked.
+# OpenAI caches stable prefixes automatically, so no markers are needed there.
+PROMPT_CACHE_PROVIDERS = {"anthropic"}
+
+
+def cache_prompt(messages: List[BaseMessage], model_config: str = "default", human_min_tokens: Optional[int] = None) -> List[BaseMessage]:
+    """
+    Mark the static system prompt as a prompt-cache breakpoint.
+    
+    Args:
+        messages: Formatted prompt messages
+        model_config: Name of the config the messages will be sent to
+        human_min_tokens: Also mark the human turn when it is at least this many tokens
+        
+    Returns:
+        Messages with cache_control blocks for providers that need them, otherwise unchanged
+    """
+    config = MODEL_CONFIGS.get(model_config, MODEL_CONFIGS["default"])
+    if config.provider not in PROMPT_CACHE_PROVIDERS:
+        return messages
+    
+    cached = []
+    for message in messages:
+        mark = message.type == "system" or (
+            message.type == "human"
+            and human_min_tokens is not None
+            and isinstance(message.content, str)
+            and len(message.content) // 4 >= human_min_tokens  # ~4 chars per token
+        )
+        if mark and isinstance(message.content, str):
+            message = message.model_copy(update={"content": [
+                {"type": "text", "text": message.content, "cache_control": {"type": "ephemeral"}}
+            ]})
+        cached.append(message)
+    return cached
+
+
+def cache_usage(response: Any) -> Optional[str]:
+    """Summarize prompt-cache token usage reported on a response, if any."""
+    usage = getattr(response, "usage_metadata", None) or {}
+    details = usage.get("input_token_details") or {}
+    read = details.get("cache_read", 0)
+    created = details.get("cache_creation", 0)
+    if not read and not created:
+        return None
+    return f"read={read} created={created} input={usage.get('input_tokens', 0)}"
+
+
+def list_available_models() -> Mapping[str, ModelConfig]:
     """
     Return all available model configurations.
     
     Returns:
-        Dict mapping config names to their configurations
+        Read-only mapping of config names to their configurations
     """
-    return MODEL_CONFIGS.copy()
+    return MappingProxyType(MODEL_CONFIGS)
 
 
 def get_model_info(model_config: str) -> Dict[str, Any]:
@@ -353,57 +558,61 @@ def get_model_info(model_config: str) -> Dict[str, Any]:
     if model_config not in MODEL_CONFIGS:
         raise ValueError(f"Unknown model config: {model_config}. Available: {list(MODEL_CONFIGS.keys())}")
     
-    config = MODEL_CONFIGS[model_config].copy()
+    model = MODEL_CONFIGS[model_config]
+    config = asdict(model)
     
-    # Add some metadata
-    config["available"] = config["provider"] == "huggingface"  # Only HF is currently implemented
+    # Usable means a factory exists, its SDK is installed and its credential is set
+    config["available"] = model.provider in PROVIDER_FACTORIES and is_provider_available(model.provider)
     
-    if config["provider"] == "huggingface":
-        config["description"] = _get_hf_model_description(config["model_id"])
+    if model.provider == "huggingface":
+        config["description"] = _get_hf_model_description(model.model_id)
+    elif model.provider not in PROVIDER_FACTORIES:
+        config["description"] = f"{model.provider.title()} model (not yet implemented)"
+    elif not _PROVIDER_SDK_INSTALLED.get(model.provider, True):
+        config["description"] = f"{model.provider.title()} model (SDK not installed)"
     else:
-        config["description"] = f"{config['provider'].title()} model (not yet implemented)"
+        config["description"] = f"{model.provider.title()} model"
     
     return config
 
 
+_HF_DESCRIPTIONS = MappingProxyType({
+    "meta-llama/Meta-Llama-3.1-8B-Instruct": "General-purpose instruction-following model, good balance of capability and speed",
+    "meta-llama/Meta-Llama-3.1-70B-Instruct": "Large model with enhanced reasoning capabilities, best for complex planning",
+    "bigcode/starcoder2-15b": "Code-specialized model optimized for programming tasks",
+    "mistralai/Mistral-7B-Instruct-v0.1": "Efficient general-purpose model with good instruction following",
+    "codellama/CodeLlama-13b-Instruct-hf": "Code-focused Llama variant, excellent for programming",
+    "google/gemma-7b-it": "Google's instruction-tuned model with strong reasoning abilities",
+})
+
+
 def _get_hf_model_description(model_id: str) -> str:
     """Get a description for a Hugging Face model."""
-    descriptions = {
-        "meta-llama/Meta-Llama-3.1-8B-Instruct": "General-purpose instruction-following model, good balance of capability and speed",
-        "meta-llama/Meta-Llama-3.1-70B-Instruct": "Large model with enhanced reasoning capabilities, best for complex planning",
-        "bigcode/starcoder2-15b": "Code-specialized model optimized for programming tasks",
-        "mistralai/Mistral-7B-Instruct-v0.1": "Efficient general-purpose model with good instruction following",
-        "codellama/CodeLlama-13b-Instruct-hf": "Code-focused Llama variant, excellent for programming",
-        "google/gemma-7b-it": "Google's instruction-tuned model with strong reasoning abilities",
-    }
-    return descriptions.get(model_id, f"Hugging Face model: {model_id}")
+    return _HF_DESCRIPTIONS.get(model_id, f"Hugging Face model: {model_id}")
 
 
 def print_available_models():
     """Print a formatted list of all available models."""
-    print("Available Model Configurations:")
-    print("=" * 50)
+    lines = ["Available Model Configurations:", "=" * 50]
+    available, unavailable = "✅ Available", "🚧 Unavailable"
     
-    for name, config in MODEL_CONFIGS.items():
-        status = "✅ Available" if config["provider"] == "huggingface" else "🚧 Placeholder"
-        provider = config["provider"].title()
-        model_id = config["model_id"]
-        temp = config["temperature"]
-        
-        print(f"\n{name}:")
-        print(f"  Status: {status}")
-        print(f"  Provider: {provider}")
-        print(f"  Model: {model_id}")
-        print(f"  Temperature: {temp}")
+    for name in MODEL_CONFIGS:
+        info = get_model_info(name)
+        lines.append(f"\n{name}:")
+        lines.append(f"  Status: {available if info['available'] else unavailable}")
+        lines.append(f"  Provider: {info['provider'].title()}")
+        lines.append(f"  Model: {info['model_id']}")
+        lines.append(f"  Temperature: {info['temperature']}")
+        lines.append(f"  Description: {info['description']}")
         
-        if config["provider"] == "huggingface":
-            print(f"  Description: {_get_hf_model_description(model_id)}")
-        
-    print(f"\nUsage Examples:")
-    print(f"  chat = make_chat()                    # Use default model")
-    print(f"  chat = make_chat('coding')            # Use code-specialized model")  
-    print(f"  chat = make_chat('planning')          # Use large model for planning")
-    print(f"  chat = make_chat(model_id='custom')   # Override model directly")
+    lines.append("\nUsage Examples:")
+    lines.append("  chat = make_chat()                    # Use default model")
+    lines.append("  chat = make_chat('coding')            # Use code-specialized model")
+    lines.append("  chat = make_chat('planning')          # Use large model for planning")
+    lines.append("  chat = make_chat(model_id='custom')   # Override model directly")
+    
+    # One write instead of a locked print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def make_chat_for_language(
@@ -0,0 +1,159 @@
+"""
+Extract JSON objects from free-form LLM output.
+
+Models often wrap the requested JSON in prose or markdown fences. Rather than
+parsing, searching for the outermost braces and parsing again, the response is
+scanned once for the first balanced object, honoring string literals and escapes.
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+from .fast_json import loads
+
+
+# Only braces, quotes and backslashes affect object boundaries
+_SIGNIFICANT = re.compile(r'[{}"\\]')
+_STRUCTURAL = re.compile(r'[{}\[\]"\\]')
+
+
+def _parse_object(text: str) -> Optional[Dict[str, Any]]:
+    try:
+        value = loads(text)
+    except ValueError:
+        return None
+    return value if isinstance(value, dict) else None
+
+
+def extract_first_json(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the first complete JSON object found in text, or None.
+
+    Args:
+        text: Raw model response
+
+    Returns:
+        Parsed object, or None when no balanced object parses
+    """
+    stripped = text.strip()
+    # Fast path: the whole response is the object
+    if stripped.startswith("{") and stripped.endswith("}"):
+        value = _parse_object(stripped)
+        if value is not None:
+            return value
+
+    start = text.find("{")
+    while start != -1:
+        depth = 0
+        in_string = False
+        escaped = False
+        escape_at = -1
+        end = -1
+        for match in _SIGNIFICANT.finditer(text, start):
+            ch = match.group()
+            pos = match.start()
+            if escaped:
+                # The escaped character is always the one right after the backslash
+                escaped = False
+                if pos == escape_at + 1:
+                    continue
+            if in_string:
+                if ch == "\\":
+                    escaped = True
+                    escape_at = pos
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch == "{":
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+                if depth == 0:
+                    end = pos + 1
+                    break
+        if end == -1:
+            return None  # unbalanced: nothing complete follows
+        value = _parse_object(text[start:end])
+        if value is not None:
+            return value
+        start = text.find("{", start + 1)
+    return None
+
+
+class ArrayItemScanner:
+    """
+    Incrementally pull complete objects out of one array in a streamed top-level object.
+
+    Fed the chunks of {"files": [{...}, {...}], ...}, each file object is returned
+    as soon as its closing brace arrives, before the rest of the response is in.
+    Objects in arrays under any other top-level key are ignored.
+    """
+
+    def __init__(self, key: str = "files"):
+        self.key = key
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape_at = -2
+        self._offset = 0
+        self._item_parts: Optional[List[str]] = None
+        # Text of the top-level string being read, and the last one completed:
+        # when an array opens at the top level, that string is its key
+        self._key_parts: Optional[List[str]] = None
+        self._last_key = ""
+        self._in_target = False
+
+    def _finish_key(self):
+        raw = "".join(self._key_parts)
+        self._key_parts = None
+        try:
+            self._last_key = loads(f'"{raw}"') if "\\" in raw else raw
+        except ValueError:
+            self._last_key = raw
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Consume the next chunk and return the objects it completed."""
+        items = []
+        item_start = 0 if self._item_parts is not None else None
+        key_start = 0
+        for match in _STRUCTURAL.finditer(chunk):
+            ch = match.group()
+            pos = match.start()
+            if self._offset + pos == self._escape_at + 1:
+                continue  # escaped character, possibly split across chunks
+            if self._in_string:
+                if ch == "\\":
+                    self._escape_at = self._offset + pos
+                elif ch == '"':
+                    self._in_string = False
+                    if self._key_parts is not None:
+                        self._key_parts.append(chunk[key_start:pos])
+                        self._finish_key()
+            elif ch == '"':
+                self._in_string = True
+                if self._stack == ["{"]:
+                    self._key_parts = []
+                    key_start = pos + 1
+            elif ch == "{" or ch == "[":
+                if ch == "[" and self._stack == ["{"]:
+                    self._in_target = self._last_key == self.key
+                elif ch == "{" and self._in_target and self._stack == ["{", "["]:
+                    self._item_parts = []
+                    item_start = pos
+                self._stack.append(ch)
+            else:
+                if self._stack:
+                    self._stack.pop()
+                if ch == "}" and self._item_parts is not None and self._stack == ["{", "["]:
+                    self._item_parts.append(chunk[item_start:pos + 1])
+                    value = _parse_object("".join(self._item_parts))
+                    if value is not None:
+                        items.append(value)
+                    self._item_parts = None
+                    item_start = None
+        if self._item_parts is not None:
+            self._item_parts.append(chunk[item_start:])
+        if self._key_parts is not None:
+            self._key_parts.append(chunk[key_start:])
+        self._offset += len(chunk)
+        return items
@@ -4,442 +4,710 @@ Supports Python, JavaScript/Node.js, C#/.NET, Java, Go, Rust, and more.
 """
 
 import os
+import re
+import copy
 import json
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 
 
+# Build/test marker files probed at the repo root -> key in analysis["markers"]
+PROJECT_MARKERS = {
+    "pom.xml": "has_pom",
+    "build.gradle": "has_gradle",
+    "build.gradle.kts": "has_gradle_kts",
+    "gradlew": "has_gradlew",
+    "package.json": "has_package_json",
+    "tsconfig.json": "has_tsconfig",
+    "spec": "has_spec_dir",
+    "requirements.txt": "has_requirements_txt",
+    "venv": "has_venv",
+}
+
+# Node tools run directly from node_modules/.bin when installed, skipping npx's resolution
+LOCAL_BINS = ("eslint", "tsc")
+
+
+# Language keywords in request
+LANGUAGE_KEYWORDS = {
+    'python': ['python', 'django', 'flask', 'fastapi', 'pytest', 'pip'],
+    'javascript': ['javascript', 'js', 'node', 'nodejs', 'npm', 'yarn', 'react', 'vue', 'angular', 'express'],
+    'typescript': ['typescript', 'ts', 'angular', 'nest', 'nestjs'],
+    'csharp': ['c#', 'csharp', '.net', 'dotnet', 'asp.net', 'blazor', 'mvc'],
+    'java': ['java', 'spring', 'maven', 'gradle', 'springboot'],
+    'go': ['go', 'golang', 'gin', 'gorilla', 'echo'],
+    'rust': ['rust', 'cargo', 'actix', 'warp', 'tokio'],
+    'php': ['php', 'laravel', 'symfony', 'composer'],
+    'ruby': ['ruby', 'rails', 'sinatra', 'gem'],
+    'swift': ['swift', 'ios', 'xcode', 'cocoapods'],
+    'kotlin': ['kotlin', 'android', 'spring'],
+    'dart': ['dart', 'flutter']
+}
+
+# Primary language names get higher weight
+PRIMARY_LANGUAGE_NAMES = {
+    'python': frozenset({'python'}),
+    'javascript': frozenset({'javascript', 'js', 'node.js', 'nodejs'}),
+    'typescript': frozenset({'typescript', 'ts'}),
+    'csharp': frozenset({'c#', 'csharp', 'c-sharp', '.net', 'dotnet'}),
+    'java': frozenset({'java'}),
+    'go': frozenset({'go', 'golang'}),
+    'rust': frozenset({'rust'}),
+    'ruby': frozenset({'ruby'}),
+    'swift': frozenset({'swift'}),
+    'kotlin': frozenset({'kotlin'}),
+    'dart': frozenset({'dart'})
+}
+
+# Keywords with special characters are matched as plain substrings, the rest on word boundaries
+_SUBSTRING_KEYWORDS = frozenset({'c#', '.net'})
+
+
+def _keyword_weights() -> Dict[str, tuple]:
+    weights: Dict[str, tuple] = {}
+    for lang, keywords in LANGUAGE_KEYWORDS.items():
+        primary = PRIMARY_LANGUAGE_NAMES.get(lang, ())
+        for keyword in keywords:
+            # Give higher weight to primary language names
+            weights[keyword] = weights.get(keyword, ()) + ((lang, 3 if keyword in primary else 1),)
+    return weights
+
+
+# keyword -> (language, weight) pairs it scores for (angular and spring count for two)
+_KEYWORD_WEIGHTS = _keyword_weights()
+
+def _trie_pattern(words) -> str:
+    """
+    Regex alternation for words factored into a prefix trie.
+    
+    Shared prefixes are matched once (e.g. java(?:script)?) and each branch starts
+    with a distinct character, so at most one branch is tried per position;
+    optional tails are greedy, so the longest keyword is still preferred.
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = None  # end of a word
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            return body + '?' if len(branches) == 1 and len(body) == 1 else '(?:' + body + ')?'
+        return body
+
+    return build(trie)
+
+
+# Every word-boundary keyword in one trie-shaped alternation, so the request is scanned once
+_KEYWORD_RE = re.compile(r'\b(?:' + _trie_pattern(
+    keyword for keyword in _KEYWORD_WEIGHTS if keyword not in _SUBSTRING_KEYWORDS
+) + r')\b')
+
+
+@lru_cache(maxsize=256)
 def detect_language_from_request(request: str) -> Optional[str]:
     """Detect intended programming language from user request"""
     request_lower = request.lower()
     
-    # Language keywords in request
-    language_keywords = {
-        'python': ['python', 'django', 'flask', 'fastapi', 'pytest', 'pip'],
-        'javascript': ['javascript', 'js', 'node', 'nodejs', 'npm', 'yarn', 'react', 'vue', 'angular', 'express'],
-        'typescript': ['typescript', 'ts', 'angular', 'nest', 'nestjs'],
-        'csharp': ['c#', 'csharp', '.net', 'dotnet', 'asp.net', 'blazor', 'mvc'],
-        'java': ['java', 'spring', 'maven', 'gradle', 'springboot'],
-        'go': ['go', 'golang', 'gin', 'gorilla', 'echo'],
-        'rust': ['rust', 'cargo', 'actix', 'warp', 'tokio'],
-        'php': ['php', 'laravel', 'symfony', 'composer'],
-        'ruby': ['ruby', 'rails', 'sinatra', 'gem'],
-        'swift': ['swift', 'ios', 'xcode', 'cocoapods'],
-        'kotlin': ['kotlin', 'android', 'spring'],
-        'dart': ['dart', 'flutter']
-    }
-    
-    # Count matches for each language with weighted scoring
-    language_scores = {}
+    matched = {match.group() for match in _KEYWORD_RE.finditer(request_lower)}
+    matched.update(keyword for keyword in _SUBSTRING_KEYWORDS if keyword in request_lower)
     
-    # Primary language names get higher weight
-    primary_language_names = {
-        'python': ['python'],
-        'javascript': ['javascript', 'js', 'node.js', 'nodejs'],
-        'typescript': ['typescript', 'ts'],
-        'csharp': ['c#', 'csharp', 'c-sharp', '.net', 'dotnet'],
-        'java': ['java'],
-        'go': ['go', 'golang'],
-        'rust': ['rust'],
-        'ruby': ['ruby'],
-        'swift': ['swift'],
-        'kotlin': ['kotlin'],
-        'dart': ['dart']
-    }
-    
-    for lang, keywords in language_keywords.items():
-        score = 0
-        # Give higher weight to primary language names  
-        primary_names = primary_language_names.get(lang, [])
-        for keyword in keywords:
-            # Use word boundaries to avoid partial matches, but handle special cases
-            import re
-            if keyword in ['c#', '.net']:
-                # Special handling for keywords with special characters
-                if keyword in request_lower:
-                    weight = 3 if keyword in primary_names else 1
-                    score += weight
-            else:
-                # Use word boundaries for normal keywords
-                pattern = r'\b' + re.escape(keyword) + r'\b'
-                if re.search(pattern, request_lower):
-                    weight = 3 if keyword in primary_names else 1
-                    score += weight
-        
-        if score > 0:
-            language_scores[lang] = score
+    # Count matches for each language with weighted scoring, in LANGUAGE_KEYWORDS
+    # order so ties resolve to the same language as before
+    language_scores = dict.fromkeys(LANGUAGE_KEYWORDS, 0)
+    for keyword in matched:
+        for lang, weight in _KEYWORD_WEIGHTS[keyword]:
+            language_scores[lang] += weight
     
     # Return language with highest score
-    if language_scores:
-        return max(language_scores, key=language_scores.get)
-    
-    return None
+    best = max(language_scores, key=language_scores.get)
+    return best if language_scores[best] > 0 else None
+
+
+# Most recent analyses kept, keyed by absolute repo path -> (root mtime, analysis)
+ANALYSIS_CACHE_SIZE = 16
+_analysis_cache: "OrderedDict[str, tuple]" = OrderedDict()
 
 
 def analyze_project_structure(repo_path: str) -> Dict[str, Any]:
-    """Analyze project structure and detect language/framework"""
-    structure = {
-        "primary_language": "unknown",
-        "secondary_languages": [],
-        "project_type": "unknown",
-        "frameworks": [],
-        "build_tools": [],
-        "package_managers": [],
-        "config_files": [],
-        "source_files": [],
-        "test_files": [],
-        "documentation_files": [],
-        "has_tests": False,
-        "entry_points": []
-    }
+    """Analyze project structure and detect language/framework (cached per root mtime)"""
+    try:
+        mtime = os.stat(repo_path).st_mtime_ns
+    except OSError:
+        return _analyze_project_structure(repo_path)
+    
+    key = os.path.abspath(repo_path)
+    cached = _analysis_cache.get(key)
+    if cached and cached[0] == mtime:
+        _analysis_cache.move_to_end(key)
+        return copy.deepcopy(cached[1])
+    
+    analysis = _analyze_project_structure(repo_path)
+    _analysis_cache[key] = (mtime, copy.deepcopy(analysis))
+    _analysis_cache.move_to_end(key)
+    while len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+        _analysis_cache.popitem(last=False)
+    return analysis
+
+
+def invalidate_project_analysis(repo_path: str):
+    """Drop the cached analysis for repo_path (call after writing files into it)"""
+    _analysis_cache.pop(os.path.abspath(repo_path), None)
+
+
+@dataclass(slots=True)
+class ProjectStructure:
+    """Analysis built up by analyze_project_structure; callers receive it as a dict"""
+    primary_language: str = "unknown"
+    secondary_languages: List[str] = field(default_factory=list)
+    project_type: str = "unknown"
+    frameworks: List[str] = field(default_factory=list)
+    build_tools: List[str] = field(default_factory=list)
+    package_managers: List[str] = field(default_factory=list)
+    config_files: List[str] = field(default_factory=list)
+    source_files: List[str] = field(default_factory=list)
+    test_files: List[str] = field(default_factory=list)
+    documentation_files: List[str] = field(default_factory=list)
+    has_tests: bool = False
+    entry_points: List[str] = field(default_factory=list)
+    files_by_ext: Dict[str, List[str]] = field(default_factory=dict)
+    markers: Dict[str, bool] = field(default_factory=dict)
+    bin: Dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Field name -> value, sharing the field objects (no deep copy like asdict)"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _analyze_project_structure(repo_path: str) -> Dict[str, Any]:
+    structure = ProjectStructure(markers=scan_project(repo_path), bin=find_local_bins(repo_path))
     
     files = list_all_files(repo_path)
     
-    # Language detection by file extensions
-    language_counts = {}
+    # One pass classifies every file: language, config/build tool, entry point, test.
+    # Lists are filled through bound appends and attached to the structure afterwards.
+    languages, source_files, config_files, entry_points, test_files = [], [], [], [], []
+    add_language, add_source, add_config = languages.append, source_files.append, config_files.append
+    add_entry_point, add_test = entry_points.append, test_files.append
+    files_by_ext = structure.files_by_ext
+    build_tools = {}  # insertion-ordered set
     for file_path in files:
-        ext = get_file_extension(file_path)
-        lang = extension_to_language(ext)
+        filename = file_path.rpartition('/')[2]  # list_all_files always uses '/'
+        ext = _name_extension(filename)
+        lang = EXTENSION_LANGUAGES.get(ext)
         if lang:
-            language_counts[lang] = language_counts.get(lang, 0) + 1
-            structure["source_files"].append(file_path)
+            add_language(lang)
+            add_source(file_path)
+            # Source files grouped by extension (without the dot) for the runners
+            files_by_ext.setdefault(ext[1:], []).append(file_path)
+        
+        tool = _config_tool(filename)
+        if tool:
+            add_config(file_path)
+            build_tools[tool] = None
+        if filename in ENTRY_POINT_NAMES:
+            add_entry_point(file_path)
+        if _is_test_file(file_path):
+            add_test(file_path)
     
-    # Determine primary language
-    if language_counts:
-        structure["primary_language"] = max(language_counts, key=language_counts.get)
-        structure["secondary_languages"] = [lang for lang in language_counts.keys() 
-                                          if lang != structure["primary_language"]]
+    structure.source_files = source_files
+    structure.config_files = config_files
+    structure.entry_points = entry_points
+    structure.test_files = test_files
+    structure.build_tools = list(build_tools)
+    structure.has_tests = len(structure.test_files) > 0
     
-    # Analyze config files and frameworks
-    analyze_config_files(repo_path, files, structure)
+    # Determine primary language; secondary ones follow by file count (ties in first-seen order)
+    ranked = Counter(languages).most_common()
+    if ranked:
+        structure.primary_language = ranked[0][0]
+        structure.secondary_languages = [lang for lang, _ in ranked[1:]]
     
-    # Detect project type and frameworks
-    detect_frameworks_and_type(repo_path, files, structure)
+    # Detect project type and frameworks (needs the primary language, so it reads
+    # only that language's source files after the pass above)
+    structure.frameworks.extend(_detect_frameworks(
+        repo_path, structure.source_files, structure.primary_language, structure.frameworks))
     
-    # Find entry points and test files
-    find_entry_points(files, structure)
-    find_test_files(files, structure)
+    return structure.to_dict()
+
+
+@lru_cache(maxsize=32)
+def _scan_markers(repo_path: str, mtime_ns: int) -> Dict[str, bool]:
+    markers = dict.fromkeys(PROJECT_MARKERS.values(), False)
+    markers["has_vendor_phpunit"] = False
+    try:
+        with os.scandir(repo_path) as it:
+            names = {entry.name for entry in it}
+    except OSError:
+        return markers
+    for name in names & PROJECT_MARKERS.keys():
+        markers[PROJECT_MARKERS[name]] = True
+    if "vendor" in names:
+        markers["has_vendor_phpunit"] = os.path.exists(os.path.join(repo_path, "vendor", "bin", "phpunit"))
+    return markers
+
+
+def scan_project(repo_path: str) -> Dict[str, bool]:
+    """
+    Probe the root marker files the runners need with one directory listing.
     
-    return structure
+    Cached per root mtime; callers must not modify the returned dict.
+    """
+    try:
+        mtime_ns = os.stat(repo_path).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return _scan_markers(os.path.abspath(repo_path), mtime_ns)
+
+
+def find_local_bins(repo_path: str) -> Dict[str, str]:
+    """Map the LOCAL_BINS installed under node_modules/.bin to their absolute paths"""
+    bin_dir = os.path.join(os.path.abspath(repo_path), "node_modules", ".bin")
+    try:
+        names = set(os.listdir(bin_dir))
+    except OSError:
+        return {}
+    return {name: os.path.join(bin_dir, name) for name in LOCAL_BINS if name in names}
+
+
+# Directories and files list_all_files leaves out
+IGNORE_DIRS = frozenset({
+    '.git', '.svn', '.hg', '.agent',
+    'node_modules', '__pycache__', '.pytest_cache',
+    'venv', 'env', '.venv', '.env',
+    'target', 'build', 'dist', 'out',
+    'bin', 'obj', '.vs', '.vscode',
+    '.idea', '.gradle', '.maven'
+})
+
+IGNORE_FILES = frozenset({
+    '.DS_Store', 'Thumbs.db', '.gitignore',
+    '.env', '.env.local', '.env.production'
+})
 
 
 def list_all_files(repo_path: str) -> List[str]:
     """List all files in the repository, excluding common ignore patterns"""
-    ignore_dirs = {
-        '.git', '.svn', '.hg',
-        'node_modules', '__pycache__', '.pytest_cache',
-        'venv', 'env', '.venv', '.env',
-        'target', 'build', 'dist', 'out',
-        'bin', 'obj', '.vs', '.vscode',
-        '.idea', '.gradle', '.maven'
-    }
-    
-    ignore_files = {
-        '.DS_Store', 'Thumbs.db', '.gitignore',
-        '.env', '.env.local', '.env.production'
-    }
-    
     files = []
-    for root, dirs, filenames in os.walk(repo_path):
-        # Remove ignored directories
-        dirs[:] = [d for d in dirs if d not in ignore_dirs]
-        
-        for filename in filenames:
-            if filename not in ignore_files:
-                rel_path = os.path.relpath(os.path.join(root, filename), repo_path)
-                files.append(rel_path)
-    
+    _walk(repo_path, "", files)
     return files
 
 
+def _walk(directory: str, rel_dir: str, files: List[str]):
+    """Append the '/'-separated relative paths under directory, in os.walk's top-down order"""
+    subdirs = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # Symlinked directories are neither listed nor followed, as with os.walk
+                    if name not in IGNORE_DIRS and not entry.is_symlink():
+                        subdirs.append((entry.path, rel_dir + name + "/"))
+                elif name not in IGNORE_FILES:
+                    files.append(rel_dir + name)
+    except OSError:
+        return
+    for path, rel_path in subdirs:
+        _walk(path, rel_path, files)
+
+
+# Paths from list_all_files always use '/'; only Windows callers may pass other separators
+if os.sep == '/':
+    def _basename(file_path: str) -> str:
+        return file_path.rpartition('/')[2]
+else:
+    _basename = os.path.basename
+
+
+def _name_extension(filename: str) -> str:
+    """Lowercased extension of a bare file name, with os.path.splitext's rules for leading dots"""
+    if '.' not in filename.lstrip('.'):
+        return ''
+    return '.' + filename.rpartition('.')[2].lower()
+
+
 def get_file_extension(file_path: str) -> str:
     """Get file extension in lowercase"""
-    return os.path.splitext(file_path)[1].lower()
+    return _name_extension(_basename(file_path))
+
+
+# File extension -> programming language
+EXTENSION_LANGUAGES = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.mjs': 'javascript',
+    '.ts': 'typescript',
+    '.tsx': 'typescript',
+    '.jsx': 'javascript',
+    '.cs': 'csharp',
+    '.vb': 'vb.net',
+    '.fs': 'fsharp',
+    '.java': 'java',
+    '.kt': 'kotlin',
+    '.scala': 'scala',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.php': 'php',
+    '.rb': 'ruby',
+    '.swift': 'swift',
+    '.m': 'objective-c',
+    '.mm': 'objective-c++',
+    '.cpp': 'cpp',
+    '.cc': 'cpp',
+    '.cxx': 'cpp',
+    '.c': 'c',
+    '.h': 'c',
+    '.hpp': 'cpp',
+    '.dart': 'dart',
+    '.r': 'r',
+    '.jl': 'julia',
+    '.ex': 'elixir',
+    '.exs': 'elixir',
+    '.clj': 'clojure',
+    '.hs': 'haskell',
+    '.ml': 'ocaml',
+    '.fsi': 'fsharp',
+    '.fsx': 'fsharp',
+    '.pl': 'perl',
+    '.sh': 'bash',
+    '.ps1': 'powershell'
+}
 
 
 def extension_to_language(ext: str) -> Optional[str]:
     """Map file extension to programming language"""
-    extension_map = {
-        '.py': 'python',
-        '.js': 'javascript',
-        '.mjs': 'javascript',
-        '.ts': 'typescript',
-        '.tsx': 'typescript',
-        '.jsx': 'javascript',
-        '.cs': 'csharp',
-        '.vb': 'vb.net',
-        '.fs': 'fsharp',
-        '.java': 'java',
-        '.kt': 'kotlin',
-        '.scala': 'scala',
-        '.go': 'go',
-        '.rs': 'rust',
-        '.php': 'php',
-        '.rb': 'ruby',
-        '.swift': 'swift',
-        '.m': 'objective-c',
-        '.mm': 'objective-c++',
-        '.cpp': 'cpp',
-        '.cc': 'cpp',
-        '.cxx': 'cpp',
-        '.c': 'c',
-        '.h': 'c',
-        '.hpp': 'cpp',
-        '.dart': 'dart',
-        '.r': 'r',
-        '.jl': 'julia',
-        '.ex': 'elixir',
-        '.exs': 'elixir',
-        '.clj': 'clojure',
-        '.hs': 'haskell',
-        '.ml': 'ocaml',
-        '.fs': 'fsharp',
-        '.pl': 'perl',
-        '.sh': 'bash',
-        '.ps1': 'powershell'
-    }
-    return extension_map.get(ext)
+    return EXTENSION_LANGUAGES.get(ext)
+
+
+# Configuration files -> (language, build tool / package manager)
+CONFIG_PATTERNS = {
+    # Python
+    'requirements.txt': ('python', 'pip'),
+    'pyproject.toml': ('python', 'poetry/setuptools'),
+    'setup.py': ('python', 'setuptools'),
+    'Pipfile': ('python', 'pipenv'),
+    'poetry.lock': ('python', 'poetry'),
+    
+    # Node.js/JavaScript
+    'package.json': ('javascript', 'npm/yarn'),
+    'yarn.lock': ('javascript', 'yarn'),
+    'package-lock.json': ('javascript', 'npm'),
+    'tsconfig.json': ('typescript', 'tsc'),
+    'webpack.config.js': ('javascript', 'webpack'),
+    'vite.config.js': ('javascript', 'vite'),
+    'next.config.js': ('javascript', 'next.js'),
+    
+    # .NET
+    '*.csproj': ('csharp', 'dotnet'),
+    '*.vbproj': ('vb.net', 'dotnet'),
+    '*.fsproj': ('fsharp', 'dotnet'),
+    '*.sln': ('csharp', 'dotnet'),
+    'global.json': ('csharp', 'dotnet'),
+    
+    # Java
+    'pom.xml': ('java', 'maven'),
+    'build.gradle': ('java', 'gradle'),
+    'build.gradle.kts': ('kotlin', 'gradle'),
+    
+    # Go
+    'go.mod': ('go', 'go modules'),
+    'go.sum': ('go', 'go modules'),
+    
+    # Rust
+    'Cargo.toml': ('rust', 'cargo'),
+    'Cargo.lock': ('rust', 'cargo'),
+    
+    # PHP
+    'composer.json': ('php', 'composer'),
+    'composer.lock': ('php', 'composer'),
+    
+    # Ruby
+    'Gemfile': ('ruby', 'bundler'),
+    'Gemfile.lock': ('ruby', 'bundler'),
+    
+    # Other
+    'Dockerfile': ('docker', 'docker'),
+    'docker-compose.yml': ('docker', 'docker-compose'),
+    'Makefile': ('make', 'make'),
+    'CMakeLists.txt': ('cpp', 'cmake')
+}
+
+
+# CONFIG_PATTERNS split for O(1) lookups: exact file names, and extensions from the '*.ext' entries
+CONFIG_EXACT = {name: value for name, value in CONFIG_PATTERNS.items() if '*' not in name}
+CONFIG_EXT = {pattern[1:]: value for pattern, value in CONFIG_PATTERNS.items() if pattern.startswith('*.')}
 
 
 def analyze_config_files(repo_path: str, files: List[str], structure: Dict[str, Any]):
     """Analyze configuration files to detect build tools and package managers"""
-    config_patterns = {
-        # Python
-        'requirements.txt': ('python', 'pip'),
-        'pyproject.toml': ('python', 'poetry/setuptools'),
-        'setup.py': ('python', 'setuptools'),
-        'Pipfile': ('python', 'pipenv'),
-        'poetry.lock': ('python', 'poetry'),
-        
-        # Node.js/JavaScript
-        'package.json': ('javascript', 'npm/yarn'),
-        'yarn.lock': ('javascript', 'yarn'),
-        'package-lock.json': ('javascript', 'npm'),
-        'tsconfig.json': ('typescript', 'tsc'),
-        'webpack.config.js': ('javascript', 'webpack'),
-        'vite.config.js': ('javascript', 'vite'),
-        'next.config.js': ('javascript', 'next.js'),
-        
-        # .NET
-        '*.csproj': ('csharp', 'dotnet'),
-        '*.vbproj': ('vb.net', 'dotnet'),
-        '*.fsproj': ('fsharp', 'dotnet'),
-        '*.sln': ('csharp', 'dotnet'),
-        'global.json': ('csharp', 'dotnet'),
-        
-        # Java
-        'pom.xml': ('java', 'maven'),
-        'build.gradle': ('java', 'gradle'),
-        'build.gradle.kts': ('kotlin', 'gradle'),
-        
-        # Go
-        'go.mod': ('go', 'go modules'),
-        'go.sum': ('go', 'go modules'),
-        
-        # Rust
-        'Cargo.toml': ('rust', 'cargo'),
-        'Cargo.lock': ('rust', 'cargo'),
-        
-        # PHP
-        'composer.json': ('php', 'composer'),
-        'composer.lock': ('php', 'composer'),
-        
-        # Ruby
-        'Gemfile': ('ruby', 'bundler'),
-        'Gemfile.lock': ('ruby', 'bundler'),
-        
-        # Other
-        'Dockerfile': ('docker', 'docker'),
-        'docker-compose.yml': ('docker', 'docker-compose'),
-        'Makefile': ('make', 'make'),
-        'CMakeLists.txt': ('cpp', 'cmake')
-    }
-    
+    build_tools = dict.fromkeys(structure["build_tools"])
     for file_path in files:
-        filename = os.path.basename(file_path)
-        
-        # Exact match
-        if filename in config_patterns:
-            lang, tool = config_patterns[filename]
+        tool = _config_tool(_basename(file_path))
+        if tool:
             structure["config_files"].append(file_path)
-            if tool not in structure["build_tools"]:
-                structure["build_tools"].append(tool)
-        
-        # Pattern match for .csproj, .vbproj, etc.
-        for pattern, (lang, tool) in config_patterns.items():
-            if '*' in pattern:
-                if filename.endswith(pattern.replace('*', '')):
-                    structure["config_files"].append(file_path)
-                    if tool not in structure["build_tools"]:
-                        structure["build_tools"].append(tool)
+            build_tools[tool] = None
+    structure["build_tools"] = list(build_tools)
+
+
+def _config_tool(filename: str) -> Optional[str]:
+    """Build tool implied by a config file name, or None"""
+    # Exact match
+    hit = CONFIG_EXACT.get(filename)
+    if hit is None:
+        # Pattern match for .csproj, .vbproj, etc. (compared case-sensitively, like endswith)
+        dot = filename.rfind('.')
+        if dot == -1:
+            return None
+        hit = CONFIG_EXT.get(filename[dot:])
+        if hit is None:
+            return None
+    return hit[1]
+
+
+# Framework markers (imports, decorators) sit near the top of a file, so only this much is read
+FRAMEWORK_SCAN_BYTES = 16384
+
+# Larger files (minified bundles, generated code, data blobs) are skipped outright
+MAX_FRAMEWORK_SCAN_BYTES = 512 * 1024
+
+# Below this many source files a thread pool costs more than it overlaps
+_PARALLEL_READ_MIN = 8
+
+# Source substrings that reveal a framework, per primary language
+FRAMEWORK_PATTERNS = {
+    'python': {
+        'fastapi': ['from fastapi', 'import fastapi', 'FastAPI()'],
+        'flask': ['from flask', 'import flask', 'Flask(__name__)'],
+        'django': ['django.', 'DJANGO_SETTINGS_MODULE', 'manage.py'],
+        'pytest': ['import pytest', 'def test_', '@pytest.'],
+    },
+    'javascript': {
+        'react': ['import React', 'from "react"', 'React.Component'],
+        'vue': ['import Vue', 'from "vue"', '<template>'],
+        'angular': ['@angular/', '@Component', '@Injectable'],
+        'express': ['require("express")', 'import express', 'express()'],
+        'next': ['next/', 'from "next"', 'getServerSideProps'],
+    },
+    'csharp': {
+        'asp.net': ['using Microsoft.AspNetCore', '[ApiController]', 'WebApplication.'],
+        'blazor': ['@page', '@code', 'ComponentBase'],
+        'mvc': ['Controller', 'ActionResult', 'ViewResult'],
+    },
+    'java': {
+        'spring': ['@SpringBootApplication', '@RestController', '@Service'],
+        'springboot': ['@SpringBootApplication', 'SpringApplication.run'],
+    }
+}
+
+
+# FRAMEWORK_PATTERNS encoded once, so file heads are searched as raw bytes without decoding
+_FRAMEWORK_BYTE_PATTERNS = {
+    language: {framework: tuple(pattern.encode('utf-8') for pattern in patterns)
+               for framework, patterns in frameworks.items()}
+    for language, frameworks in FRAMEWORK_PATTERNS.items()
+}
 
 
 def detect_frameworks_and_type(repo_path: str, files: List[str], structure: Dict[str, Any]):
     """Detect frameworks and project type by analyzing file contents"""
-    from .file_operations import read_file_content
+    structure["frameworks"].extend(
+        _detect_frameworks(repo_path, files, structure["primary_language"], structure["frameworks"]))
+
+
+def _detect_frameworks(repo_path: str, files: List[str], language: str, found: List[str]) -> List[str]:
+    """Frameworks of language, not already in found, whose markers appear in files"""
+    from .file_operations import read_file_head_bytes
     
-    framework_patterns = {
-        'python': {
-            'fastapi': ['from fastapi', 'import fastapi', 'FastAPI()'],
-            'flask': ['from flask', 'import flask', 'Flask(__name__)'],
-            'django': ['django.', 'DJANGO_SETTINGS_MODULE', 'manage.py'],
-            'pytest': ['import pytest', 'def test_', '@pytest.'],
-        },
-        'javascript': {
-            'react': ['import React', 'from "react"', 'React.Component'],
-            'vue': ['import Vue', 'from "vue"', '<template>'],
-            'angular': ['@angular/', '@Component', '@Injectable'],
-            'express': ['require("express")', 'import express', 'express()'],
-            'next': ['next/', 'from "next"', 'getServerSideProps'],
-        },
-        'csharp': {
-            'asp.net': ['using Microsoft.AspNetCore', '[ApiController]', 'WebApplication.'],
-            'blazor': ['@page', '@code', 'ComponentBase'],
-            'mvc': ['Controller', 'ActionResult', 'ViewResult'],
-        },
-        'java': {
-            'spring': ['@SpringBootApplication', '@RestController', '@Service'],
-            'springboot': ['@SpringBootApplication', 'SpringApplication.run'],
-        }
-    }
+    detected = []
+    patterns_by_framework = _FRAMEWORK_BYTE_PATTERNS.get(language)
+    if not patterns_by_framework:
+        return detected
+    
+    # Only frameworks not seen yet are searched for, and reading stops once all are found
+    remaining = [framework for framework in patterns_by_framework if framework not in found]
+    extensions = get_source_extensions(language)
+    source_paths = [file_path for file_path in files if file_path.endswith(extensions)]
+    if not remaining or not source_paths:
+        return detected
     
-    language = structure["primary_language"]
-    if language in framework_patterns:
-        for file_path in files:
-            if file_path.endswith(get_source_extensions(language)):
-                content = read_file_content(repo_path, file_path)
-                
-                for framework, patterns in framework_patterns[language].items():
-                    if any(pattern in content for pattern in patterns):
-                        if framework not in structure["frameworks"]:
-                            structure["frameworks"].append(framework)
+    if len(source_paths) < _PARALLEL_READ_MIN:
+        contents = (read_file_head_bytes(repo_path, file_path, FRAMEWORK_SCAN_BYTES, MAX_FRAMEWORK_SCAN_BYTES)
+                    for file_path in source_paths)
+        pool = None
+    else:
+        # Reads are IO-bound and release the GIL; map() still yields in file order
+        pool = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+        contents = pool.map(
+            lambda file_path: read_file_head_bytes(repo_path, file_path, FRAMEWORK_SCAN_BYTES, MAX_FRAMEWORK_SCAN_BYTES),
+            source_paths)
+    try:
+        for content in contents:
+            hits = [framework for framework in remaining
+                    if any(pattern in content for pattern in patterns_by_framework[framework])]
+            if hits:
+                detected.extend(hits)
+                remaining = [framework for framework in remaining if framework not in hits]
+                if not remaining:
+                    break
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    return detected
+
+
+# Source file extensions read for framework detection, per language
+SOURCE_EXTENSIONS = {
+    'python': ('.py',),
+    'javascript': ('.js', '.mjs', '.jsx'),
+    'typescript': ('.ts', '.tsx'),
+    'csharp': ('.cs',),
+    'java': ('.java',),
+    'go': ('.go',),
+    'rust': ('.rs',),
+    'php': ('.php',),
+    'ruby': ('.rb',),
+}
 
 
 def get_source_extensions(language: str) -> tuple:
     """Get source file extensions for a language"""
-    extension_map = {
-        'python': ('.py',),
-        'javascript': ('.js', '.mjs', '.jsx'),
-        'typescript': ('.ts', '.tsx'),
-        'csharp': ('.cs',),
-        'java': ('.java',),
-        'go': ('.go',),
-        'rust': ('.rs',),
-        'php': ('.php',),
-        'ruby': ('.rb',),
-    }
-    return extension_map.get(language, ())
+    return SOURCE_EXTENSIONS.get(language, ())
+
+
+# Likely entry point file names
+ENTRY_POINT_NAMES = frozenset({
+    'main.py', 'app.py', 'server.py', 'run.py', '__main__.py',
+    'index.js', 'server.js', 'app.js', 'main.js',
+    'index.ts', 'server.ts', 'app.ts', 'main.ts',
+    'Program.cs', 'Startup.cs', 'Main.cs',
+    'Main.java', 'Application.java',
+    'main.go', 'server.go', 'app.go',
+    'main.rs', 'lib.rs', 'server.rs',
+    'index.php', 'app.php', 'server.php'
+})
+
+# Substrings that mark a path as a test file
+TEST_PATTERNS = (
+    'test_', '_test.', '.test.', '.spec.',
+    '/test/', '/tests/', '__tests__/',
+    'Test.cs', 'Tests.cs', 'Test.java'
+)
 
 
 def find_entry_points(files: List[str], structure: Dict[str, Any]):
     """Find likely entry point files"""
-    entry_patterns = {
-        'main.py', 'app.py', 'server.py', 'run.py', '__main__.py',
-        'index.js', 'server.js', 'app.js', 'main.js',
-        'index.ts', 'server.ts', 'app.ts', 'main.ts',
-        'Program.cs', 'Startup.cs', 'Main.cs',
-        'Main.java', 'Application.java',
-        'main.go', 'server.go', 'app.go',
-        'main.rs', 'lib.rs', 'server.rs',
-        'index.php', 'app.php', 'server.php'
-    }
-    
     for file_path in files:
-        filename = os.path.basename(file_path)
-        if filename in entry_patterns:
+        if _basename(file_path) in ENTRY_POINT_NAMES:
             structure["entry_points"].append(file_path)
 
 
+# Any test pattern anywhere in the path, in one search instead of a substring test per pattern
+_is_test_file = re.compile('|'.join(map(re.escape, TEST_PATTERNS))).search
+
+
 def find_test_files(files: List[str], structure: Dict[str, Any]):
     """Find test files"""
-    test_patterns = [
-        'test_', '_test.', '.test.', '.spec.',
-        '/test/', '/tests/', '__tests__/',
-        'Test.cs', 'Tests.cs', 'Test.java'
-    ]
-    
     for file_path in files:
-        if any(pattern in file_path for pattern in test_patterns):
+        if _is_test_file(file_path):
             structure["test_files"].append(file_path)
     
     structure["has_tests"] = len(structure["test_files"]) > 0
 
 
-def get_language_info(language: str) -> Dict[str, Any]:
-    """Get detailed information about a programming language"""
-    language_info = {
-        'python': {
-            'name': 'Python',
-            'extensions': ['.py'],
-            'package_managers': ['pip', 'poetry', 'pipenv'],
-            'build_tools': ['setuptools', 'poetry', 'pip'],
-            'test_frameworks': ['pytest', 'unittest', 'nose2'],
-            'frameworks': ['Django', 'Flask', 'FastAPI', 'Tornado'],
-            'entry_files': ['main.py', 'app.py', 'server.py', '__main__.py'],
-            'config_files': ['requirements.txt', 'pyproject.toml', 'setup.py', 'Pipfile']
-        },
-        'javascript': {
-            'name': 'JavaScript',
-            'extensions': ['.js', '.mjs', '.jsx'],
-            'package_managers': ['npm', 'yarn', 'pnpm'],
-            'build_tools': ['webpack', 'vite', 'rollup', 'parcel'],
-            'test_frameworks': ['jest', 'mocha', 'vitest', 'cypress'],
-            'frameworks': ['React', 'Vue', 'Angular', 'Express', 'Next.js'],
-            'entry_files': ['index.js', 'app.js', 'server.js', 'main.js'],
-            'config_files': ['package.json', 'package-lock.json', 'yarn.lock']
-        },
-        'typescript': {
-            'name': 'TypeScript',
-            'extensions': ['.ts', '.tsx'],
-            'package_managers': ['npm', 'yarn', 'pnpm'],
-            'build_tools': ['tsc', 'webpack', 'vite', 'rollup'],
-            'test_frameworks': ['jest', 'vitest', 'mocha'],
-            'frameworks': ['Angular', 'NestJS', 'Next.js', 'Express'],
-            'entry_files': ['index.ts', 'app.ts', 'server.ts', 'main.ts'],
-            'config_files': ['tsconfig.json', 'package.json']
-        },
-        'csharp': {
-            'name': 'C#',
-            'extensions': ['.cs'],
-            'package_managers': ['NuGet'],
-            'build_tools': ['dotnet', 'MSBuild'],
-            'test_frameworks': ['xUnit', 'NUnit', 'MSTest'],
-            'frameworks': ['ASP.NET Core', 'Blazor', 'WPF', 'WinForms'],
-            'entry_files': ['Program.cs', 'Startup.cs', 'Main.cs'],
-            'config_files': ['*.csproj', '*.sln', 'global.json']
-        },
-        'java': {
-            'name': 'Java',
-            'extensions': ['.java'],
-            'package_managers': ['Maven', 'Gradle'],
-            'build_tools': ['Maven', 'Gradle', 'Ant'],
-            'test_frameworks': ['JUnit', 'TestNG', 'Mockito'],
-            'frameworks': ['Spring Boot', 'Spring', 'Quarkus', 'Micronaut'],
-            'entry_files': ['Main.java', 'Application.java'],
-            'config_files': ['pom.xml', 'build.gradle', 'build.gradle.kts']
-        },
-        'go': {
-            'name': 'Go',
-            'extensions': ['.go'],
-            'package_managers': ['go modules'],
-            'build_tools': ['go build', 'go mod'],
-            'test_frameworks': ['testing', 'testify', 'ginkgo'],
-            'frameworks': ['Gin', 'Echo', 'Gorilla', 'Fiber'],
-            'entry_files': ['main.go', 'server.go', 'app.go'],
-            'config_files': ['go.mod', 'go.sum']
-        },
-        'rust': {
-            'name': 'Rust',
-            'extensions': ['.rs'],
-            'package_managers': ['cargo'],
-            'build_tools': ['cargo'],
-            'test_frameworks': ['built-in tests', 'rstest'],
-            'frameworks': ['Actix', 'Warp', 'Rocket', 'Axum'],
-            'entry_files': ['main.rs', 'lib.rs', 'server.rs'],
-            'config_files': ['Cargo.toml', 'Cargo.lock']
-        }
+# Reference details per language for get_language_info
+LANGUAGE_INFO = {
+    'python': {
+        'name': 'Python',
+        'extensions': ['.py'],
+        'package_managers': ['pip', 'poetry', 'pipenv'],
+        'build_tools': ['setuptools', 'poetry', 'pip'],
+        'test_frameworks': ['pytest', 'unittest', 'nose2'],
+        'frameworks': ['Django', 'Flask', 'FastAPI', 'Tornado'],
+        'entry_files': ['main.py', 'app.py', 'server.py', '__main__.py'],
+        'config_files': ['requirements.txt', 'pyproject.toml', 'setup.py', 'Pipfile']
+    },
+    'javascript': {
+        'name': 'JavaScript',
+        'extensions': ['.js', '.mjs', '.jsx'],
+        'package_managers': ['npm', 'yarn', 'pnpm'],
+        'build_tools': ['webpack', 'vite', 'rollup', 'parcel'],
+        'test_frameworks': ['jest', 'mocha', 'vitest', 'cypress'],
+        'frameworks': ['React', 'Vue', 'Angular', 'Express', 'Next.js'],
+        'entry_files': ['index.js', 'app.js', 'server.js', 'main.js'],
+        'config_files': ['package.json', 'package-lock.json', 'yarn.lock']
+    },
+    'typescript': {
+        'name': 'TypeScript',
+        'extensions': ['.ts', '.tsx'],
+        'package_managers': ['npm', 'yarn', 'pnpm'],
+        'build_tools': ['tsc', 'webpack', 'vite', 'rollup'],
+        'test_frameworks': ['jest', 'vitest', 'mocha'],
+        'frameworks': ['Angular', 'NestJS', 'Next.js', 'Express'],
+        'entry_files': ['index.ts', 'app.ts', 'server.ts', 'main.ts'],
+        'config_files': ['tsconfig.json', 'package.json']
+    },
+    'csharp': {
+        'name': 'C#',
+        'extensions': ['.cs'],
+        'package_managers': ['NuGet'],
+        'build_tools': ['dotnet', 'MSBuild'],
+        'test_frameworks': ['xUnit', 'NUnit', 'MSTest'],
+        'frameworks': ['ASP.NET Core', 'Blazor', 'WPF', 'WinForms'],
+        'entry_files': ['Program.cs', 'Startup.cs', 'Main.cs'],
+        'config_files': ['*.csproj', '*.sln', 'global.json']
+    },
+    'java': {
+        'name': 'Java',
+        'extensions': ['.java'],
+        'package_managers': ['Maven', 'Gradle'],
+        'build_tools': ['Maven', 'Gradle', 'Ant'],
+        'test_frameworks': ['JUnit', 'TestNG', 'Mockito'],
+        'frameworks': ['Spring Boot', 'Spring', 'Quarkus', 'Micronaut'],
+        'entry_files': ['Main.java', 'Application.java'],
+        'config_files': ['pom.xml', 'build.gradle', 'build.gradle.kts']
+    },
+    'go': {
+        'name': 'Go',
+        'extensions': ['.go'],
+        'package_managers': ['go modules'],
+        'build_tools': ['go build', 'go mod'],
+        'test_frameworks': ['testing', 'testify', 'ginkgo'],
+        'frameworks': ['Gin', 'Echo', 'Gorilla', 'Fiber'],
+        'entry_files': ['main.go', 'server.go', 'app.go'],
+        'config_files': ['go.mod', 'go.sum']
+    },
+    'rust': {
+        'name': 'Rust',
+        'extensions': ['.rs'],
+        'package_managers': ['cargo'],
+        'build_tools': ['cargo'],
+        'test_frameworks': ['built-in tests', 'rstest'],
+        'frameworks': ['Actix', 'Warp', 'Rocket', 'Axum'],
+        'entry_files': ['main.rs', 'lib.rs', 'server.rs'],
+        'config_files': ['Cargo.toml', 'Cargo.lock']
     }
-    
-    return language_info.get(language, {
+}
+
+
+def get_language_info(language: str) -> Dict[str, Any]:
+    """Get detailed information about a programming language (shared for known ones; do not modify)"""
+    info = LANGUAGE_INFO.get(language)
+    if info is not None:
+        return info
+    return {
         'name': language.title(),
         'extensions': [],
         'package_managers': [],
@@ -448,4 +716,4 @@ def get_language_info(language: str) -> Dict[str, Any]:
         'frameworks': [],
         'entry_files': [],
         'config_files': []
-    })
+    }
@@ -0,0 +1,125 @@
+"""
+In-process cache for LLM responses.
+
+Identical prompts sent to the same model (re-running the planner or router on an
+unchanged request, re-designing against an unchanged PRD) are answered from memory
+instead of making another network round trip.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage
+
+
+def _model_identity(chat: Any) -> str:
+    """Best-effort identifier for the model behind a chat instance."""
+    for attr in ("model_id", "model_name", "model"):
+        value = getattr(chat, attr, None)
+        if isinstance(value, str) and value:
+            return value
+    llm = getattr(chat, "llm", None)
+    repo_id = getattr(llm, "repo_id", None)
+    if repo_id:
+        return repo_id
+    return type(chat).__name__
+
+
+def prompt_key(chat: Any, messages: List[BaseMessage], key_extra: Optional[str] = None) -> str:
+    """Hash the model identity and rendered messages into a cache key."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(_model_identity(chat).encode("utf-8"))
+    for message in messages:
+        h.update(b"\x00")
+        h.update(message.type.encode("utf-8"))
+        h.update(b"\x01")
+        content = message.content if isinstance(message.content, str) else repr(message.content)
+        h.update(content.encode("utf-8"))
+    if key_extra:
+        h.update(b"\x02")
+        h.update(key_extra.encode("utf-8"))
+    return h.hexdigest()
+
+
+class ResponseCache:
+    """
+    Exact-match LRU cache of model responses.
+
+    Subclasses can override lookup/store to plug in another matching strategy
+    (e.g. embedding similarity) without touching the callers.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+
+    def lookup(self, key: str) -> Optional[Any]:
+        response = self._entries.get(key)
+        if response is not None:
+            self._entries.move_to_end(key)
+        return response
+
+    def store(self, key: str, response: Any) -> None:
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_default_cache = ResponseCache()
+
+
+def stream_response(chat: Any, messages: List[BaseMessage], on_chunk: Optional[Callable[[str], None]] = None) -> AIMessage:
+    """
+    Stream a chat response, collecting chunks in a list and joining once at the end.
+
+    Args:
+        chat: Chat model instance
+        messages: Formatted prompt messages
+        on_chunk: Called with each text chunk as it arrives
+
+    Returns:
+        An AIMessage with the full content and the last usage metadata reported
+    """
+    parts = []
+    usage = None
+    for chunk in chat.stream(messages):
+        content = chunk.content
+        if isinstance(content, str):
+            parts.append(content)
+            if on_chunk is not None:
+                on_chunk(content)
+        usage = getattr(chunk, "usage_metadata", None) or usage
+    return AIMessage(content="".join(parts), usage_metadata=usage)
+
+
+def cached_invoke(chat: Any, messages: List[BaseMessage], key_extra: Optional[str] = None, cache: Optional[ResponseCache] = None, stream: bool = False) -> Any:
+    """
+    Invoke a chat model, reusing the previous response for an identical prompt.
+
+    Args:
+        chat: Chat model instance
+        messages: Formatted prompt messages
+        key_extra: Extra context that affects the answer but is not part of the messages
+        cache: Cache to use instead of the module default
+        stream: Stream the response on a cache miss instead of a blocking invoke
+
+    Returns:
+        The model response message
+    """
+    cache = cache or _default_cache
+    key = prompt_key(chat, messages, key_extra)
+    response = cache.lookup(key)
+    if response is None:
+        response = stream_response(chat, messages) if stream else chat.invoke(messages)
+        cache.store(key, response)
+    return response
+
+
+def clear_llm_cache() -> None:
+    """Drop all cached responses."""
+    _default_cache.clear()
@@ -1,19 +1,103 @@
 import os
+import hashlib
+import functools
+
+
+# VCS, dependency and build output directories; they say nothing about the project layout
+SKIP_DIRS = frozenset({
+    ".git", "node_modules", "venv", ".venv", "target", "build", "dist", "__pycache__", ".mypy_cache"
+})
 
 
 def summarize_repo(repo_path: str, max_files: int = 200) -> str:
     """Naive repo summary: list top-level dirs/files and a few README lines."""
     parts = []
-    for root, dirs, files in os.walk(repo_path):
-        rel = os.path.relpath(root, repo_path)
-        depth = rel.count(os.sep)
-        if depth > 1:
-            continue
-        parts.append(f"[{rel}] files: {', '.join(files[:8])}")
-        if len(parts) > max_files:
-            break
-    readme = os.path.join(repo_path, "README.md")
-    if os.path.exists(readme):
-        with open(readme, "r", encoding="utf-8", errors="ignore") as f:
+    _list_dir(repo_path, ".", 0, parts, max_files)
+    try:
+        with open(os.path.join(repo_path, "README.md"), "r", encoding="utf-8", errors="ignore") as f:
             parts.append("README.md (head):\n" + f.read(400))
+    except (FileNotFoundError, NotADirectoryError):
+        pass
     return "\n".join(parts)
+
+
+def _list_dir(path: str, rel: str, depth: int, parts: list, max_files: int) -> bool:
+    """
+    Append "[rel] files: ..." for path and, up to grandchildren, its subdirectories.
+    
+    Mirrors os.walk's top-down order (symlinked directories are not entered), but
+    reads file/dir types from scandir's entries and only lists the levels shown.
+    Returns False once more than max_files lines were added.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return True
+    files = []
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir:
+            files.append(entry.name)
+        elif depth < 2 and entry.name not in SKIP_DIRS:
+            try:
+                if not entry.is_symlink():
+                    subdirs.append(entry)
+            except OSError:
+                pass
+    parts.append(f"[{rel}] files: {', '.join(files[:8])}")
+    if len(parts) > max_files:
+        return False
+    # rel is built by concatenation as we descend; no relpath/join per directory
+    sep = os.sep
+    for entry in subdirs:
+        child_rel = entry.name if depth == 0 else rel + sep + entry.name
+        if not _list_dir(entry.path, child_rel, depth + 1, parts, max_files):
+            return False
+    return True
+
+
+def repo_fingerprint(repo_path: str) -> str:
+    """Cheap fingerprint of what summarize_repo reads: listed dir mtimes plus README stat."""
+    h = hashlib.blake2b(digest_size=16)
+    stack = [(repo_path, 0)]
+    while stack:
+        path, depth = stack.pop()
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        h.update(f"{path}\0{st.st_mtime_ns}\0".encode("utf-8", "surrogateescape"))
+        # summarize_repo lists the root, its children and grandchildren
+        if depth >= 2:
+            continue
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False) and entry.name not in SKIP_DIRS:
+                        stack.append((entry.path, depth + 1))
+        except OSError:
+            continue
+    try:
+        st = os.stat(os.path.join(repo_path, "README.md"))
+        h.update(f"README\0{st.st_mtime_ns}\0{st.st_size}".encode("utf-8"))
+    except OSError:
+        pass
+    return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_summary(repo_path: str, fingerprint: str, limit: int) -> str:
+    # Only the truncated summary is kept to bound cache memory
+    return summarize_repo(repo_path)[:limit]
+
+
+def summarize_repo_cached(repo_path: str, limit: int = 4000, fingerprint: str = None) -> str:
+    """summarize_repo truncated to limit, memoized on the repo fingerprint."""
+    if fingerprint is None:
+        fingerprint = repo_fingerprint(repo_path)
+    return _cached_summary(os.path.abspath(repo_path), fingerprint, limit)
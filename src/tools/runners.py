@@ -1,235 +1,265 @@
-from .shell import run
+from .shell import DEFAULT_TIMEOUT, run, which
+from .language_detector import scan_project
+from .file_operations import fingerprint_files
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 import os
 
 
 def run_tests(repo_path: str, project_analysis: dict):
     """Run tests based on project language"""
     language = project_analysis.get("primary_language", "unknown")
-    
-    if language == "python":
-        return run_python_tests(repo_path)
-    elif language in ["javascript", "typescript"]:
-        return run_node_tests(repo_path)
-    elif language == "csharp":
-        return run_dotnet_tests(repo_path)
-    elif language == "java":
-        return run_java_tests(repo_path)
-    elif language == "go":
-        return run_go_tests(repo_path)
-    elif language == "rust":
-        return run_rust_tests(repo_path)
-    else:
+    runner = TEST_RUNNERS.get(language)
+    if runner is None:
         return 1, f"No test runner configured for {language}"
+    return runner(repo_path, project_analysis.get("markers"))
 
 
 def run_linter(repo_path: str, project_analysis: dict):
     """Run linter based on project language"""
     language = project_analysis.get("primary_language", "unknown")
-    
-    if language == "python":
-        return run_python_linter(repo_path)
-    elif language in ["javascript", "typescript"]:
-        return run_node_linter(repo_path)
-    elif language == "csharp":
-        return run_dotnet_linter(repo_path)
-    elif language == "java":
-        return run_java_linter(repo_path)
-    elif language == "go":
-        return run_go_linter(repo_path)
-    elif language == "rust":
-        return run_rust_linter(repo_path)
-    else:
+    linter = LINTERS.get(language)
+    if linter is None:
         return 0, f"No linter configured for {language}"
+    return linter(repo_path, project_analysis.get("markers"))
 
 
 def run_security_audit(repo_path: str, project_analysis: dict):
     """Run security audit based on project language"""
     language = project_analysis.get("primary_language", "unknown")
-    
-    if language == "python":
-        return run_python_audit(repo_path)
-    elif language in ["javascript", "typescript"]:
-        return run_node_audit(repo_path)
-    elif language == "csharp":
-        return run_dotnet_audit(repo_path)
-    elif language == "java":
-        return run_java_audit(repo_path)
-    elif language == "go":
-        return run_go_audit(repo_path)
-    elif language == "rust":
-        return run_rust_audit(repo_path)
-    else:
+    audit = SECURITY_AUDITS.get(language)
+    if audit is None:
         return 0, f"No security audit configured for {language}"
+    return audit(repo_path, project_analysis.get("markers"))
+
+
+# Checks run_all performs, each independent of the others
+CHECKS = (("test", run_tests), ("lint", run_linter), ("audit", run_security_audit))
+
+
+def run_all(repo_path: str, project_analysis: dict) -> Dict[str, Tuple[int, str]]:
+    """Run tests, linter and security audit concurrently; {"test"|"lint"|"audit": (code, output)}"""
+    # Each check is a subprocess wait, so threads overlap them without contending for the GIL
+    with ThreadPoolExecutor(max_workers=len(CHECKS)) as pool:
+        futures = {name: pool.submit(check, repo_path, project_analysis) for name, check in CHECKS}
+        return {name: future.result() for name, future in futures.items()}
+
+
+@dataclass(frozen=True)
+class Command:
+    """One way to run a check; skipped unless the repo has the `needs` root marker"""
+    argv: Tuple[str, ...]
+    needs: Optional[str] = None  # scan_project marker key
+    local: bool = False  # argv[0] is a repo-relative executable that must exist
+    uses_inputs: bool = True  # False when the result depends on more than the action's inputs (e.g. the environment)
+
+
+@dataclass(frozen=True)
+class Action:
+    """Candidate commands for one check, tried in order until one's tool is found"""
+    commands: Tuple[Command, ...]
+    missing: str  # every applicable command's tool was missing
+    unmatched: str = ""  # no command applies to this repo
+    inputs: Tuple[str, ...] = ()  # root files that alone determine the result; reuse it while they are unchanged
+    timeout: float = DEFAULT_TIMEOUT  # seconds; tests and linters use code_runner's limits
+
+
+def run_action(action: Action, repo_path: str, markers: Optional[Dict[str, bool]] = None):
+    """Run the first applicable command of action whose tool is installed"""
+    # The project analysis already holds the root markers; only probe the repo without it
+    if markers is None:
+        markers = scan_project(repo_path)
+    cache_key = fingerprint_files(repo_path, list(action.inputs)) if action.inputs else None
+    matched = False
+    for command in action.commands:
+        if command.needs and not markers[command.needs]:
+            continue
+        argv = list(command.argv)
+        if command.local:
+            argv[0] = os.path.join(repo_path, argv[0])
+            if not os.path.isfile(argv[0]):
+                continue
+        elif os.sep not in argv[0] and '/' not in argv[0]:
+            # Bare tool names are looked up on PATH; ./gradlew etc. resolve against the repo
+            tool = which(argv[0])
+            matched = True
+            if tool is None:
+                continue
+            argv[0] = tool
+        matched = True
+        try:
+            return run(argv, cwd=repo_path, cache_key=cache_key if command.uses_inputs else None,
+                       timeout=action.timeout)
+        except FileNotFoundError:
+            continue
+    return 1, action.missing if matched else action.unmatched
+
+
+# Project virtualenv's pytest, preferred over the system one
+_VENV_PYTEST = os.path.join("venv", "Scripts", "pytest.exe") if os.name == 'nt' else os.path.join("venv", "bin", "pytest")
+
+_NODE_TESTS = Action((Command(("npm", "test"), needs="has_package_json"), Command(("jest",))),
+                     "npm/jest not found - skipping tests", timeout=120)
+_NODE_LINT = Action((Command(("npx", "eslint", ".")),), "eslint not found - skipping lint check", timeout=60)
+_NODE_AUDIT = Action((Command(("npm", "audit")),), "npm not found - skipping security audit",
+                     inputs=("package.json", "package-lock.json"))
+
+# (language, check) -> how to run it
+ACTIONS = {
+    ("python", "test"): Action(
+        (Command((_VENV_PYTEST, "-q"), needs="has_venv", local=True), Command(("pytest", "-q"))),
+        "pytest not found - skipping tests", timeout=120),
+    ("python", "lint"): Action((Command(("ruff", "check", ".")),), "ruff not found - skipping lint check", timeout=60),
+    ("python", "audit"): Action(
+        (Command(("pip-audit", "-r", "requirements.txt"), needs="has_requirements_txt"), Command(("pip-audit",), uses_inputs=False)),
+        "pip-audit not found - skipping security check",
+        inputs=("requirements.txt",)),
+    ("javascript", "test"): _NODE_TESTS,
+    ("javascript", "lint"): _NODE_LINT,
+    ("javascript", "audit"): _NODE_AUDIT,
+    ("typescript", "test"): _NODE_TESTS,
+    ("typescript", "lint"): _NODE_LINT,
+    ("typescript", "audit"): _NODE_AUDIT,
+    ("csharp", "test"): Action((Command(("dotnet", "test")),), "dotnet not found - skipping tests", timeout=120),
+    ("csharp", "lint"): Action(
+        (Command(("dotnet", "format", "--verify-no-changes")),), "dotnet not found - skipping lint check", timeout=60),
+    ("csharp", "audit"): Action(
+        (Command(("dotnet", "list", "package", "--vulnerable")),), "dotnet not found - skipping security audit"),
+    ("java", "test"): Action(
+        (Command(("mvn", "test"), needs="has_pom"),
+         Command(("./gradlew", "test"), needs="has_gradle"),
+         Command(("./gradlew", "test"), needs="has_gradle_kts")),
+        "Java build tools not found - skipping tests",
+        unmatched="No build tool found (Maven/Gradle)", timeout=180),
+    ("java", "lint"): Action(
+        (Command(("mvn", "checkstyle:check")),), "checkstyle not found - skipping lint check", timeout=60),
+    ("java", "audit"): Action(
+        (Command(("mvn", "dependency:tree"), needs="has_pom"), Command(("./gradlew", "dependencies"))),
+        "Java build tools not found - skipping security audit",
+        inputs=("pom.xml", "build.gradle", "build.gradle.kts")),
+    ("go", "test"): Action((Command(("go", "test", "./...")),), "go not found - skipping tests", timeout=120),
+    ("go", "lint"): Action(
+        (Command(("golint", "./...")), Command(("go", "vet", "./..."))), "go linter not found - skipping lint check",
+        timeout=60),
+    ("go", "audit"): Action(
+        (Command(("go", "list", "-m", "all")),), "go not found - skipping security audit", inputs=("go.mod", "go.sum")),
+    ("rust", "test"): Action((Command(("cargo", "test")),), "cargo not found - skipping tests", timeout=180),
+    ("rust", "lint"): Action((Command(("cargo", "clippy")),), "cargo not found - skipping lint check", timeout=60),
+    ("rust", "audit"): Action(
+        (Command(("cargo", "audit")),), "cargo-audit not found - skipping security audit",
+        inputs=("Cargo.toml", "Cargo.lock")),
+}
 
 
 # Python runners
-def run_python_tests(repo_path: str):
-    try:
-        # Try to use project's virtual environment first
-        venv_path = os.path.join(repo_path, "venv")
-        if os.path.exists(venv_path):
-            if os.name == 'nt':  # Windows
-                pytest_path = os.path.join(venv_path, "Scripts", "pytest")
-            else:  # Unix/Linux/macOS
-                pytest_path = os.path.join(venv_path, "bin", "pytest")
-            
-            if os.path.exists(pytest_path):
-                return run([pytest_path, "-q"], cwd=repo_path)
-        
-        # Fallback to system pytest
-        return run(["pytest", "-q"], cwd=repo_path)
-    except FileNotFoundError:
-        return 1, "pytest not found - skipping tests"
-
-
-def run_python_linter(repo_path: str):
-    try:
-        return run(["ruff", "check", "."], cwd=repo_path)
-    except FileNotFoundError:
-        return 1, "ruff not found - skipping lint check"
-
-
-def run_python_audit(repo_path: str):
-    try:
-        # Check if requirements.txt exists
-        req_file = os.path.join(repo_path, "requirements.txt")
-        if os.path.exists(req_file):
-            return run(["pip-audit", "-r", "requirements.txt"], cwd=repo_path)
-        else:
-            # Run on current environment if no requirements.txt
-            return run(["pip-audit"], cwd=repo_path)
-    except FileNotFoundError:
-        return 1, "pip-audit not found - skipping security check"
+def run_python_tests(repo_path: str, markers: Optional[Dict[str, bool]] = None):
+    return run_action(ACTIONS["python", "test"], repo_path, markers)
+
+
+def run_python_linter(repo_path: str, markers: Optional[Dict[str, bool]] = None):
+    return run_action(ACTIONS["python", "lint"], repo_path, markers)
+
+
+def run_python_audit(repo_path: str, markers: Optional[Dict[str, bool]] = None):
+    return run_action(ACTIONS["python", "audit"], repo_path, markers)
 
 
 # Node.js runners
-def run_node_tests(repo_path: str):
-    try:
-        # Check if npm test script exists
-        package_json = os.path.join(repo_path, "package.json")
-        if os.path.exists(package_json):
-            return run(["npm", "test"], cwd=repo_path)
-        else:
-            return run(["jest"], cwd=repo_path)
-    except FileNotFoundError:
-        return 1, "npm/jest not found - skipping tests"
+def run_node_tests(repo_path: str, markers: Optional[Dict[str, bool]] = None):
+    return run_action(_NODE_TESTS, repo_path, markers)
 
 
-def run_node_linter(repo_path: str):
-    try:
-        # Try ESLint first
-        return run(["npx", "eslint", "."], cwd=repo_path)
-    except FileNotFoundError:
-        return 1, "eslint not found - skipping lint check"
+def run_node_linter(repo_path: str, markers: Optional[Dict[str, bool]] = None):
+    return run_action(_NODE_LINT, repo_path, markers)
 
 
-def run_node_audit(repo_path: str):
-    try:
-        return run(["npm", "audit"], cwd=repo_path)
-    except FileNotFoundError:
-        return 1, "npm not found - skipping security audit"
+def run_node_audit(repo_path: str, markers: Optional[Dict[str, bool]] = None):
+    return run_action(_NODE_AUDIT, repo_path, markers)
 
 
 # .NET runners
-def run_dotnet_tests(repo_path: str):
-    try:
-        return run(["dotnet", "test"], cwd=repo_path)
-    except FileNotFoundError:
-        return 1, "dotnet not found - skipping tests"
+def run_dotnet_tests(repo_path: str, markers: Optional[Dict[str, bool]] = None):
+    return run_action(ACTIONS["csharp", "test"], repo_path, markers)
 
 
-def run_dotnet_linter(repo_path: str):
-    try:
-        return run(["dotnet", "format", "--verify-no-changes"], cwd=repo_path)
-    except FileNotFoundError:
-        return 1, "dotnet not found - skipping lint check"
+def run_dotnet_linter(repo_path: str, markers: Optional[Dict[str, bool]] = None):
+    return run_action(ACTIONS["csharp", "lint"], repo_path, markers)
 
 
-def run_dotnet_audit(repo_path: str):
-    try:
-        return run(["dotnet", "list", "package", "--vulnerable"], cwd=repo_path)
-    except FileNotFoundError:
-        return 1, "dotnet not found - skipping security audit"
+def run_dotnet_audit(repo_path: str, markers: Optional[Dict[str, bool]] = None):
+    return run_action(ACTIONS["csharp", "audit"], repo_path, markers)
 
 
 # Java runners
-def run_java_tests(repo_path: str):
-    try:
-        # Check for Maven first
-        if os.path.exists(os.path.join(repo_path, "pom.xml")):
-            return run(["mvn", "test"], cwd=repo_path)
-        # Check for Gradle
-        elif os.path.exists(os.path.join(repo_path, "build.gradle")) or os.path.exists(os.path.join(repo_path, "build.gradle.kts")):
-            return run(["./gradlew", "test"], cwd=repo_path)
-        else:
-            return 1, "No build tool found (Maven/Gradle)"
-    except FileNotFoundError:
-        return 1, "Java build tools not found - skipping tests"
-
-
-def run_java_linter(repo_path: str):
-    try:
-        # Try Checkstyle
-        return run(["mvn", "checkstyle:check"], cwd=repo_path)
-    except FileNotFoundError:
-        return 1, "checkstyle not found - skipping lint check"
-
-
-def run_java_audit(repo_path: str):
-    try:
-        if os.path.exists(os.path.join(repo_path, "pom.xml")):
-            return run(["mvn", "dependency:tree"], cwd=repo_path)
-        else:
-            return run(["./gradlew", "dependencies"], cwd=repo_path)
-    except FileNotFoundError:
-        return 1, "Java build tools not found - skipping security audit"
+def run_java_tests(repo_path: str, markers: Optional[Dict[str, bool]] = None):
+    return run_action(ACTIONS["java", "test"], repo_path, markers)
 
 
-# Go runners
-def run_go_tests(repo_path: str):
-    try:
-        return run(["go", "test", "./..."], cwd=repo_path)
-    except FileNotFoundError:
-        return 1, "go not found - skipping tests"
+def run_java_linter(repo_path: str, markers: Optional[Dict[str, bool]] = None):
+    return run_action(ACTIONS["java", "lint"], repo_path, markers)
 
 
-def run_go_linter(repo_path: str):
-    try:
-        return run(["golint", "./..."], cwd=repo_path)
-    except FileNotFoundError:
-        try:
-            return run(["go", "vet", "./..."], cwd=repo_path)
-        except FileNotFoundError:
-            return 1, "go linter not found - skipping lint check"
+def run_java_audit(repo_path: str, markers: Optional[Dict[str, bool]] = None):
+    return run_action(ACTIONS["java", "audit"], repo_path, markers)
 
 
-def run_go_audit(repo_path: str):
-    try:
-        return run(["go", "list", "-m", "all"], cwd=repo_path)
-    except FileNotFoundError:
-        return 1, "go not found - skipping security audit"
+# Go runners
+def run_go_tests(repo_path: str, markers: Optional[Dict[str, bool]] = None):
+    return run_action(ACTIONS["go", "test"], repo_path, markers)
 
 
-# Rust runners
-def run_rust_tests(repo_path: str):
-    try:
-        return run(["cargo", "test"], cwd=repo_path)
-    except FileNotFoundError:
-        return 1, "cargo not found - skipping tests"
+def run_go_linter(repo_path: str, markers: Optional[Dict[str, bool]] = None):
+    return run_action(ACTIONS["go", "lint"], repo_path, markers)
 
 
-def run_rust_linter(repo_path: str):
-    try:
-        return run(["cargo", "clippy"], cwd=repo_path)
-    except FileNotFoundError:
-        return 1, "cargo not found - skipping lint check"
+def run_go_audit(repo_path: str, markers: Optional[Dict[str, bool]] = None):
+    return run_action(ACTIONS["go", "audit"], repo_path, markers)
 
 
-def run_rust_audit(repo_path: str):
-    try:
-        return run(["cargo", "audit"], cwd=repo_path)
-    except FileNotFoundError:
-        return 1, "cargo-audit not found - skipping security audit"
+# Rust runners
+def run_rust_tests(repo_path: str, markers: Optional[Dict[str, bool]] = None):
+    return run_action(ACTIONS["rust", "test"], repo_path, markers)
+
+
+def run_rust_linter(repo_path: str, markers: Optional[Dict[str, bool]] = None):
+    return run_action(ACTIONS["rust", "lint"], repo_path, markers)
+
+
+def run_rust_audit(repo_path: str, markers: Optional[Dict[str, bool]] = None):
+    return run_action(ACTIONS["rust", "audit"], repo_path, markers)
+
+
+# Language -> runner used by run_tests / run_linter / run_security_audit
+TEST_RUNNERS = {
+    "python": run_python_tests,
+    "javascript": run_node_tests,
+    "typescript": run_node_tests,
+    "csharp": run_dotnet_tests,
+    "java": run_java_tests,
+    "go": run_go_tests,
+    "rust": run_rust_tests,
+}
+
+LINTERS = {
+    "python": run_python_linter,
+    "javascript": run_node_linter,
+    "typescript": run_node_linter,
+    "csharp": run_dotnet_linter,
+    "java": run_java_linter,
+    "go": run_go_linter,
+    "rust": run_rust_linter,
+}
+
+SECURITY_AUDITS = {
+    "python": run_python_audit,
+    "javascript": run_node_audit,
+    "typescript": run_node_audit,
+    "csharp": run_dotnet_audit,
+    "java": run_java_audit,
+    "go": run_go_audit,
+    "rust": run_rust_audit,
+}
 
 
 # Legacy functions for backward compatibility
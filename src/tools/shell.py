@@ -1,6 +1,150 @@
+import os
+import shutil
+import signal
 import subprocess
+import tempfile
+from collections import OrderedDict
 
 
-def run(cmd, cwd: str | None = None):
-    p = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
-    return p.returncode, (p.stdout + p.stderr)
+# Bytes kept from the end of each output stream; failure summaries are printed last
+TAIL_BYTES = 64 * 1024
+
+# Seconds a command may run before it and its children are killed (AGENT_RUN_TIMEOUT overrides)
+DEFAULT_TIMEOUT = float(os.environ.get("AGENT_RUN_TIMEOUT", 600))
+
+# Exit code reported for a timed-out command, as timeout(1) does
+TIMEOUT_EXIT_CODE = 124
+
+# Results of runs made with a cache_key: (argv, cwd, cache_key) -> (returncode, output)
+RESULT_CACHE_SIZE = 64
+_results: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+
+# Tools found on PATH: (name, PATH) -> absolute path. Misses are not kept, so a
+# tool installed during the session is found on the next lookup.
+_tools: dict = {}
+
+
+def which(program: str) -> str | None:
+    """Absolute path of a bare command name on the current PATH, or None"""
+    path = os.environ.get("PATH")
+    key = (program, path)
+    found = _tools.get(key)
+    if found is None:
+        found = shutil.which(program, path=path)
+        if found is not None:
+            _tools[key] = found
+    return found
+
+
+def run(cmd, cwd: str | None = None, cache_key=None, timeout: float | None = DEFAULT_TIMEOUT):
+    """
+    Run cmd and return (returncode, output), stderr merged into stdout.
+    
+    With a cache_key (any hashable that changes whenever the command's inputs
+    do), the result of an earlier identical successful run is returned without
+    running again; failures are always re-run.
+    A command still running after timeout seconds is killed with everything it
+    started and reported as TIMEOUT_EXIT_CODE with its output so far.
+    """
+    if cache_key is not None:
+        key = (tuple(cmd), cwd, cache_key)
+        cached = _results.get(key)
+        if cached is not None:
+            _results.move_to_end(key)
+            return cached
+    result = _run_merged(cmd, cwd, timeout)
+    # A failure may be transient (missing tool, network), so only passes are kept
+    if cache_key is not None and result[0] == 0:
+        _results[key] = result
+        while len(_results) > RESULT_CACHE_SIZE:
+            _results.popitem(last=False)
+    return result
+
+
+def _kill_tree(p: subprocess.Popen):
+    """Kill p and, on POSIX, the rest of the session it leads, then reap p"""
+    try:
+        if os.name == "posix":
+            os.killpg(p.pid, signal.SIGKILL)
+        else:
+            p.kill()
+    except OSError:
+        pass  # already gone
+    p.wait()
+
+
+def _read_tail(f, tail_bytes: int) -> bytes:
+    size = f.seek(0, os.SEEK_END)
+    f.seek(max(0, size - tail_bytes))
+    data = f.read()
+    if size > tail_bytes:
+        data = f"[... {size - tail_bytes} bytes truncated ...]\n".encode("ascii") + data
+    return data
+
+
+def capture_bytes(cmd, cwd: str | None, timeout: float | None, tail_bytes: int = TAIL_BYTES, merge_stderr: bool = False):
+    """
+    Run cmd and return (returncode, stdout tail, stderr tail) as bytes.
+    
+    Output is spooled to temp files and only the last tail_bytes of each stream
+    are read back. With merge_stderr both streams share stdout (stderr is b"").
+    A command still running after timeout seconds is killed with everything it
+    started and subprocess.TimeoutExpired is raised carrying the tails so far.
+    """
+    # Plain file redirections and no preexec_fn/user/group/umask keep CPython on its
+    # vfork() + exec path, so launching doesn't copy the agent's page tables.
+    # Each run gets its own session so a timeout can kill the whole process tree
+    # (mvn/npm/cargo spawn children that would otherwise keep running).
+    with tempfile.TemporaryFile() as out_f, tempfile.TemporaryFile() as err_f:
+        with subprocess.Popen(cmd, cwd=cwd, stdout=out_f, stderr=out_f if merge_stderr else err_f,
+                              start_new_session=True) as p:
+            try:
+                returncode = p.wait(timeout=timeout)
+            except subprocess.TimeoutExpired as e:
+                _kill_tree(p)
+                e.output = _read_tail(out_f, tail_bytes)
+                e.stderr = _read_tail(err_f, tail_bytes)
+                raise
+            except BaseException:
+                _kill_tree(p)
+                raise
+        return returncode, _read_tail(out_f, tail_bytes), _read_tail(err_f, tail_bytes)
+
+
+def capture(cmd, cwd: str | None, timeout: float | None, tail_bytes: int = TAIL_BYTES, merge_stderr: bool = False) -> subprocess.CompletedProcess:
+    """capture_bytes with the tails decoded (bad bytes replaced) into a CompletedProcess"""
+    returncode, out, err = capture_bytes(cmd, cwd, timeout, tail_bytes, merge_stderr)
+    return subprocess.CompletedProcess(cmd, returncode, out.decode("utf-8", "replace"), err.decode("utf-8", "replace"))
+
+
+def run_bytes(cmd, cwd: str | None = None, timeout: float | None = DEFAULT_TIMEOUT):
+    """
+    Run cmd and return (returncode, raw output bytes), stderr merged into stdout.
+    
+    For callers that mostly look at the exit code: nothing is decoded or cached,
+    and only the last TAIL_BYTES are kept. Use text() to read the output.
+    """
+    try:
+        returncode, out, _ = capture_bytes(cmd, cwd, timeout, merge_stderr=True)
+    except subprocess.TimeoutExpired as e:
+        return TIMEOUT_EXIT_CODE, e.output
+    return returncode, out
+
+
+def text(out: bytes) -> str:
+    """Decode command output like text=True did: universal newlines, never failing on bad bytes"""
+    return out.decode("utf-8", "replace").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _run_merged(cmd, cwd, timeout):
+    try:
+        returncode, out, _ = capture_bytes(cmd, cwd, timeout, merge_stderr=True)
+    except subprocess.TimeoutExpired as e:
+        return TIMEOUT_EXIT_CODE, text(e.output) + f"\n... [timed out after {timeout:g}s]"
+    return returncode, text(out)
+
+
+def clear_result_cache():
+    """Forget all cached run results."""
+    _results.clear()
@@ -0,0 +1,32 @@
+using System;
+
+namespace ConsoleApp
+{
+    class Program
+    {
+        static void Main(string[] args)
+        {
+            Console.WriteLine("Hello, C# World!");
+            
+            var person = new Person("Alice", 30);
+            Console.WriteLine(person.Greet());
+        }
+    }
+
+    public class Person
+    {
+        public string Name { get; }
+        public int Age { get; }
+
+        public Person(string name, int age)
+        {
+            Name = name;
+            Age = age;
+        }
+
+        public string Greet()
+        {
+            return $"Hello, my name is {Name} and I am {Age} years old.";
+        }
+    }
+}
@@ -0,0 +1,57 @@
+using Microsoft.AspNetCore.Mvc;
+using System.Collections.Generic;
+using System.Linq;
+
+namespace WebApiProject.Controllers
+{
+    [ApiController]
+    [Route("api/[controller]")]
+    public class ItemsController : ControllerBase
+    {
+        private static List<Item> _items = new List<Item>();
+
+        [HttpGet]
+        public ActionResult<IEnumerable<Item>> GetItems()
+        {
+            return Ok(_items);
+        }
+
+        [HttpGet("{id}")]
+        public ActionResult<Item> GetItem(int id)
+        {
+            var item = _items.FirstOrDefault(x => x.Id == id);
+            if (item == null)
+            {
+                return NotFound();
+            }
+            return Ok(item);
+        }
+
+        [HttpPost]
+        public ActionResult<Item> CreateItem(CreateItemRequest request)
+        {
+            var item = new Item
+            {
+                Id = _items.Count + 1,
+                Name = request.Name,
+                Description = request.Description
+            };
+            
+            _items.Add(item);
+            return CreatedAtAction(nameof(GetItem), new { id = item.Id }, item);
+        }
+    }
+
+    public class Item
+    {
+        public int Id { get; set; }
+        public string Name { get; set; }
+        public string Description { get; set; }
+    }
+
+    public class CreateItemRequest
+    {
+        public string Name { get; set; }
+        public string Description { get; set; }
+    }
+}
@@ -0,0 +1,54 @@
+package main
+
+import (
+    "encoding/json"
+    "fmt"
+    "log"
+    "net/http"
+)
+
+type Response struct {
+    Message string `json:"message"`
+    Status  string `json:"status"`
+}
+
+func main() {
+    // Set up routes
+    http.HandleFunc("/", homeHandler)
+    http.HandleFunc("/health", healthHandler)
+    http.HandleFunc("/api/hello", helloHandler)
+    
+    fmt.Println("Go server starting on :8080")
+    fmt.Println("Routes available:")
+    fmt.Println("  GET  /          - Home page")
+    fmt.Println("  GET  /health    - Health check")  
+    fmt.Println("  GET  /api/hello - Hello API")
+    
+    log.Fatal(http.ListenAndServe(":8080", nil))
+}
+
+func homeHandler(w http.ResponseWriter, r *http.Request) {
+    w.Header().Set("Content-Type", "application/json")
+    response := Response{
+        Message: "Welcome to Go Web Server",
+        Status:  "running",
+    }
+    json.NewEncoder(w).Encode(response)
+}
+
+func healthHandler(w http.ResponseWriter, r *http.Request) {
+    w.Header().Set("Content-Type", "application/json")
+    response := Response{
+        Status: "healthy",
+    }
+    json.NewEncoder(w).Encode(response)
+}
+
+func helloHandler(w http.ResponseWriter, r *http.Request) {
+    w.Header().Set("Content-Type", "application/json")
+    response := Response{
+        Message: "Hello from Go API!",
+        Status:  "success",
+    }
+    json.NewEncoder(w).Encode(response)
+}
@@ -0,0 +1,48 @@
+package main
+
+import (
+    "encoding/json"
+    "net/http"
+    "net/http/httptest"
+    "testing"
+)
+
+func TestHomeHandler(t *testing.T) {
+    req, err := http.NewRequest("GET", "/", nil)
+    if err != nil {
+        t.Fatal(err)
+    }
+
+    rr := httptest.NewRecorder()
+    handler := http.HandlerFunc(homeHandler)
+    handler.ServeHTTP(rr, req)
+
+    if status := rr.Code; status != http.StatusOK {
+        t.Errorf("handler returned wrong status code: got %v want %v", status, http.StatusOK)
+    }
+
+    var response Response
+    err = json.Unmarshal(rr.Body.Bytes(), &response)
+    if err != nil {
+        t.Fatal(err)
+    }
+    
+    if response.Message != "Welcome to Go Web Server" {
+        t.Errorf("handler returned unexpected message: got %v", response.Message)
+    }
+}
+
+func TestHealthHandler(t *testing.T) {
+    req, err := http.NewRequest("GET", "/health", nil)
+    if err != nil {
+        t.Fatal(err)
+    }
+
+    rr := httptest.NewRecorder()
+    handler := http.HandlerFunc(healthHandler)
+    handler.ServeHTTP(rr, req)
+
+    if status := rr.Code; status != http.StatusOK {
+        t.Errorf("handler returned wrong status code: got %v want %v", status, http.StatusOK)
+    }
+}
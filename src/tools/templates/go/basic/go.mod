@@ -0,0 +1,3 @@
+module basic-go-app
+
+go 1.21
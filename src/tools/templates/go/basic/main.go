@@ -0,0 +1,19 @@
+package main
+
+import "fmt"
+
+func main() {
+    fmt.Println("Hello, Go World!")
+    
+    person := Person{Name: "Alice", Age: 30}
+    fmt.Println(person.Greet())
+}
+
+type Person struct {
+    Name string
+    Age  int
+}
+
+func (p Person) Greet() string {
+    return fmt.Sprintf("Hello, my name is %s and I am %d years old.", p.Name, p.Age)
+}
@@ -0,0 +1,12 @@
+package main
+
+import "testing"
+
+func TestPersonGreet(t *testing.T) {
+    person := Person{Name: "Bob", Age: 25}
+    expected := "Hello, my name is Bob and I am 25 years old."
+    
+    if got := person.Greet(); got != expected {
+        t.Errorf("Person.Greet() = %v, want %v", got, expected)
+    }
+}
@@ -0,0 +1,7 @@
+module go-web-app
+
+go 1.21
+
+require (
+    github.com/gorilla/mux v1.8.1
+)
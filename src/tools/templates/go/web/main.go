@@ -0,0 +1,112 @@
+package main
+
+import (
+    "encoding/json"
+    "fmt"
+    "log"
+    "net/http"
+    "strconv"
+
+    "github.com/gorilla/mux"
+)
+
+type Item struct {
+    ID          int    `json:"id"`
+    Name        string `json:"name"`
+    Description string `json:"description"`
+}
+
+type CreateItemRequest struct {
+    Name        string `json:"name"`
+    Description string `json:"description"`
+}
+
+var items []Item
+var nextID = 1
+
+func main() {
+    r := mux.NewRouter()
+
+    // Enable CORS
+    r.Use(func(next http.Handler) http.Handler {
+        return http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+            w.Header().Set("Access-Control-Allow-Origin", "*")
+            w.Header().Set("Access-Control-Allow-Methods", "GET, POST, PUT, DELETE, OPTIONS")
+            w.Header().Set("Access-Control-Allow-Headers", "Content-Type")
+            
+            if r.Method == "OPTIONS" {
+                return
+            }
+            
+            next.ServeHTTP(w, r)
+        })
+    })
+
+    r.HandleFunc("/", homeHandler).Methods("GET")
+    r.HandleFunc("/health", healthHandler).Methods("GET")
+    r.HandleFunc("/items", getItemsHandler).Methods("GET")
+    r.HandleFunc("/items", createItemHandler).Methods("POST")
+    r.HandleFunc("/items/{id}", getItemHandler).Methods("GET")
+
+    fmt.Println("Server starting on :8080")
+    log.Fatal(http.ListenAndServe(":8080", r))
+}
+
+func homeHandler(w http.ResponseWriter, r *http.Request) {
+    w.Header().Set("Content-Type", "application/json")
+    json.NewEncoder(w).Encode(map[string]string{"message": "Welcome to the Go API"})
+}
+
+func healthHandler(w http.ResponseWriter, r *http.Request) {
+    w.Header().Set("Content-Type", "application/json")
+    json.NewEncoder(w).Encode(map[string]string{"status": "healthy"})
+}
+
+func getItemsHandler(w http.ResponseWriter, r *http.Request) {
+    w.Header().Set("Content-Type", "application/json")
+    json.NewEncoder(w).Encode(items)
+}
+
+func createItemHandler(w http.ResponseWriter, r *http.Request) {
+    var req CreateItemRequest
+    if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+        http.Error(w, "Invalid JSON", http.StatusBadRequest)
+        return
+    }
+
+    if req.Name == "" {
+        http.Error(w, "Name is required", http.StatusBadRequest)
+        return
+    }
+
+    item := Item{
+        ID:          nextID,
+        Name:        req.Name,
+        Description: req.Description,
+    }
+    nextID++
+    items = append(items, item)
+
+    w.Header().Set("Content-Type", "application/json")
+    w.WriteHeader(http.StatusCreated)
+    json.NewEncoder(w).Encode(item)
+}
+
+func getItemHandler(w http.ResponseWriter, r *http.Request) {
+    vars := mux.Vars(r)
+    id, err := strconv.Atoi(vars["id"])
+    if err != nil {
+        http.Error(w, "Invalid ID", http.StatusBadRequest)
+        return
+    }
+
+    for _, item := range items {
+        if item.ID == id {
+            w.Header().Set("Content-Type", "application/json")
+            json.NewEncoder(w).Encode(item)
+            return
+        }
+    }
+
+    http.Error(w, "Item not found", http.StatusNotFound)
+}
@@ -0,0 +1,26 @@
+public class Main {
+    public static void main(String[] args) {
+        System.out.println("Hello, Java World!");
+        
+        Person person = new Person("Alice", 30);
+        System.out.println(person.greet());
+    }
+}
+
+class Person {
+    private String name;
+    private int age;
+
+    public Person(String name, int age) {
+        this.name = name;
+        this.age = age;
+    }
+
+    public String greet() {
+        return "Hello, my name is " + name + " and I am " + age + " years old.";
+    }
+
+    // Getters
+    public String getName() { return name; }
+    public int getAge() { return age; }
+}
@@ -0,0 +1,64 @@
+package com.example.controller;
+
+import org.springframework.web.bind.annotation.*;
+import java.util.*;
+
+@RestController
+@RequestMapping("/api/items")
+@CrossOrigin(origins = "*")
+public class ItemController {
+    
+    private List<Item> items = new ArrayList<>();
+    private int nextId = 1;
+
+    @GetMapping
+    public List<Item> getAllItems() {
+        return items;
+    }
+
+    @GetMapping("/{id}")
+    public Item getItem(@PathVariable int id) {
+        return items.stream()
+                .filter(item -> item.getId() == id)
+                .findFirst()
+                .orElse(null);
+    }
+
+    @PostMapping
+    public Item createItem(@RequestBody CreateItemRequest request) {
+        Item item = new Item(nextId++, request.getName(), request.getDescription());
+        items.add(item);
+        return item;
+    }
+}
+
+class Item {
+    private int id;
+    private String name;
+    private String description;
+
+    public Item(int id, String name, String description) {
+        this.id = id;
+        this.name = name;
+        this.description = description;
+    }
+
+    // Getters and setters
+    public int getId() { return id; }
+    public void setId(int id) { this.id = id; }
+    public String getName() { return name; }
+    public void setName(String name) { this.name = name; }
+    public String getDescription() { return description; }
+    public void setDescription(String description) { this.description = description; }
+}
+
+class CreateItemRequest {
+    private String name;
+    private String description;
+
+    // Getters and setters
+    public String getName() { return name; }
+    public void setName(String name) { this.name = name; }
+    public String getDescription() { return description; }
+    public void setDescription(String description) { this.description = description; }
+}
@@ -0,0 +1,12 @@
+#!/usr/bin/env node
+
+console.log('Hello, World!');
+console.log('This is a basic Node.js project.');
+
+// Example function
+function greet(name) {
+    return `Hello, ${name}!`;
+}
+
+// Export for testing
+module.exports = { greet };
@@ -0,0 +1,13 @@
+const { greet } = require('./index');
+
+describe('Basic functionality', () => {
+    test('greet function should return greeting', () => {
+        const result = greet('World');
+        expect(result).toBe('Hello, World!');
+    });
+
+    test('greet function should handle different names', () => {
+        const result = greet('Alice');
+        expect(result).toBe('Hello, Alice!');
+    });
+});
@@ -0,0 +1,58 @@
+const express = require('express');
+const cors = require('cors');
+const app = express();
+const PORT = process.env.PORT || 3000;
+
+// Middleware
+app.use(cors());
+app.use(express.json());
+
+// In-memory storage (replace with database)
+let items = [];
+
+// Routes
+app.get('/', (req, res) => {
+    res.json({ message: 'Welcome to the Express API' });
+});
+
+app.get('/health', (req, res) => {
+    res.json({ status: 'healthy' });
+});
+
+app.get('/items', (req, res) => {
+    res.json(items);
+});
+
+app.post('/items', (req, res) => {
+    const { name, description } = req.body;
+    
+    if (!name) {
+        return res.status(400).json({ error: 'Name is required' });
+    }
+    
+    const item = {
+        id: items.length + 1,
+        name,
+        description: description || ''
+    };
+    
+    items.push(item);
+    res.status(201).json(item);
+});
+
+app.get('/items/:id', (req, res) => {
+    const id = parseInt(req.params.id);
+    const item = items.find(item => item.id === id);
+    
+    if (!item) {
+        return res.status(404).json({ error: 'Item not found' });
+    }
+    
+    res.json(item);
+});
+
+app.listen(PORT, () => {
+    console.log(`Server running on port ${PORT}`);
+});
+
+module.exports = app;
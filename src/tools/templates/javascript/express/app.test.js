@@ -0,0 +1,40 @@
+const request = require('supertest');
+const app = require('./app');
+
+describe('Express API', () => {
+    test('GET / should return welcome message', async () => {
+        const response = await request(app)
+            .get('/')
+            .expect(200);
+        
+        expect(response.body.message).toBe('Welcome to the Express API');
+    });
+
+    test('GET /health should return healthy status', async () => {
+        const response = await request(app)
+            .get('/health')
+            .expect(200);
+        
+        expect(response.body.status).toBe('healthy');
+    });
+
+    test('POST /items should create a new item', async () => {
+        const itemData = { name: 'Test Item', description: 'Test Description' };
+        
+        const response = await request(app)
+            .post('/items')
+            .send(itemData)
+            .expect(201);
+        
+        expect(response.body.name).toBe('Test Item');
+        expect(response.body.id).toBe(1);
+    });
+
+    test('GET /items should return all items', async () => {
+        const response = await request(app)
+            .get('/items')
+            .expect(200);
+        
+        expect(Array.isArray(response.body)).toBe(true);
+    });
+});
@@ -0,0 +1,22 @@
+<?php
+
+class Person {
+    private $name;
+    private $age;
+    
+    public function __construct($name, $age) {
+        $this->name = $name;
+        $this->age = $age;
+    }
+    
+    public function greet() {
+        return "Hello, my name is {$this->name} and I am {$this->age} years old.";
+    }
+}
+
+echo "Hello, PHP World!\n";
+
+$person = new Person("Alice", 30);
+echo $person->greet() . "\n";
+
+?>
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Main application module.
+"""
+
+def main():
+    """Main function"""
+    print("Hello, World!")
+    print("This is a basic Python project.")
+
+if __name__ == "__main__":
+    main()
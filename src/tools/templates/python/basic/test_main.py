@@ -0,0 +1,12 @@
+import pytest
+from main import main
+
+def test_main():
+    """Test the main function"""
+    # This is a basic test - modify as needed
+    assert main is not None
+
+def test_basic_functionality():
+    """Test basic functionality"""
+    result = main()
+    assert result is None  # main() doesn't return anything by default
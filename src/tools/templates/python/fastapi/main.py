@@ -0,0 +1,52 @@
+from fastapi import FastAPI, HTTPException
+from fastapi.middleware.cors import CORSMiddleware
+from pydantic import BaseModel
+from typing import List, Optional
+import uvicorn
+
+app = FastAPI(title="API", version="1.0.0")
+
+# CORS middleware
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+class Item(BaseModel):
+    id: Optional[int] = None
+    name: str
+    description: Optional[str] = None
+
+# In-memory storage (replace with database)
+items: List[Item] = []
+
+@app.get("/")
+async def root():
+    return {"message": "Welcome to the API"}
+
+@app.get("/health")
+async def health_check():
+    return {"status": "healthy"}
+
+@app.get("/items", response_model=List[Item])
+async def get_items():
+    return items
+
+@app.post("/items", response_model=Item)
+async def create_item(item: Item):
+    item.id = len(items) + 1
+    items.append(item)
+    return item
+
+@app.get("/items/{item_id}", response_model=Item)
+async def get_item(item_id: int):
+    for item in items:
+        if item.id == item_id:
+            return item
+    raise HTTPException(status_code=404, detail="Item not found")
+
+if __name__ == "__main__":
+    uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,34 @@
+import pytest
+from fastapi.testclient import TestClient
+from main import app
+
+client = TestClient(app)
+
+def test_root():
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.json() == {"message": "Welcome to the API"}
+
+def test_health_check():
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.json() == {"status": "healthy"}
+
+def test_create_and_get_item():
+    # Create item
+    item_data = {"name": "Test Item", "description": "Test Description"}
+    response = client.post("/items", json=item_data)
+    assert response.status_code == 200
+    created_item = response.json()
+    assert created_item["name"] == "Test Item"
+    assert created_item["id"] == 1
+    
+    # Get item
+    response = client.get(f"/items/{created_item['id']}")
+    assert response.status_code == 200
+    assert response.json() == created_item
+
+def test_get_items():
+    response = client.get("/items")
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
@@ -0,0 +1,46 @@
+from flask import Flask, request, jsonify
+from flask_cors import CORS
+import json
+from typing import List, Dict, Any
+
+app = Flask(__name__)
+CORS(app)
+
+# In-memory storage (replace with database)
+items: List[Dict[str, Any]] = []
+
+@app.route('/')
+def root():
+    return jsonify({"message": "Welcome to the Flask API"})
+
+@app.route('/health')
+def health_check():
+    return jsonify({"status": "healthy"})
+
+@app.route('/items', methods=['GET'])
+def get_items():
+    return jsonify(items)
+
+@app.route('/items', methods=['POST'])
+def create_item():
+    data = request.get_json()
+    if not data or 'name' not in data:
+        return jsonify({"error": "Name is required"}), 400
+    
+    item = {
+        "id": len(items) + 1,
+        "name": data['name'],
+        "description": data.get('description', '')
+    }
+    items.append(item)
+    return jsonify(item), 201
+
+@app.route('/items/<int:item_id>', methods=['GET'])
+def get_item(item_id: int):
+    for item in items:
+        if item['id'] == item_id:
+            return jsonify(item)
+    return jsonify({"error": "Item not found"}), 404
+
+if __name__ == '__main__':
+    app.run(debug=True, host='0.0.0.0', port=5000)
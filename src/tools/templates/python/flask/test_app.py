@@ -0,0 +1,37 @@
+import pytest
+import json
+from app import app
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+def test_root(client):
+    response = client.get('/')
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['message'] == "Welcome to the Flask API"
+
+def test_health_check(client):
+    response = client.get('/health')
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['status'] == "healthy"
+
+def test_create_and_get_item(client):
+    # Create item
+    item_data = {"name": "Test Item", "description": "Test Description"}
+    response = client.post('/items', 
+                          data=json.dumps(item_data),
+                          content_type='application/json')
+    assert response.status_code == 201
+    created_item = json.loads(response.data)
+    assert created_item['name'] == "Test Item"
+    
+    # Get item
+    response = client.get(f"/items/{created_item['id']}")
+    assert response.status_code == 200
+    item = json.loads(response.data)
+    assert item == created_item
@@ -0,0 +1,19 @@
+#!/usr/bin/env ruby
+
+class Person
+  attr_reader :name, :age
+  
+  def initialize(name, age)
+    @name = name
+    @age = age
+  end
+  
+  def greet
+    "Hello, my name is #{@name} and I am #{@age} years old."
+  end
+end
+
+puts "Hello, Ruby World!"
+
+person = Person.new("Alice", 30)
+puts person.greet
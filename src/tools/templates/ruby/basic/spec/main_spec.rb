@@ -0,0 +1,10 @@
+require_relative '../main'
+
+RSpec.describe Person do
+  describe '#greet' do
+    it 'returns a proper greeting' do
+      person = Person.new('Bob', 25)
+      expect(person.greet).to eq('Hello, my name is Bob and I am 25 years old.')
+    end
+  end
+end
@@ -0,0 +1,33 @@
+fn main() {
+    println!("Hello, Rust World!");
+    
+    let person = Person::new("Alice".to_string(), 30);
+    println!("{}", person.greet());
+}
+
+struct Person {
+    name: String,
+    age: u32,
+}
+
+impl Person {
+    fn new(name: String, age: u32) -> Self {
+        Person { name, age }
+    }
+    
+    fn greet(&self) -> String {
+        format!("Hello, my name is {} and I am {} years old.", self.name, self.age)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_person_greet() {
+        let person = Person::new("Bob".to_string(), 25);
+        let expected = "Hello, my name is Bob and I am 25 years old.";
+        assert_eq!(person.greet(), expected);
+    }
+}
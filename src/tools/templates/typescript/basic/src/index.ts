@@ -0,0 +1,25 @@
+#!/usr/bin/env node
+
+interface Person {
+    name: string;
+    age: number;
+}
+
+function greet(person: Person): string {
+    return `Hello, ${person.name}! You are ${person.age} years old.`;
+}
+
+function main(): void {
+    console.log('Hello, TypeScript World!');
+    
+    const person: Person = { name: 'Alice', age: 30 };
+    console.log(greet(person));
+}
+
+// Export for testing
+export { greet, Person };
+
+// Run if this is the main module
+if (require.main === module) {
+    main();
+}
@@ -0,0 +1,15 @@
+import { greet, Person } from '../src/index';
+
+describe('TypeScript functionality', () => {
+    test('greet function should return proper greeting', () => {
+        const person: Person = { name: 'Bob', age: 25 };
+        const result = greet(person);
+        expect(result).toBe('Hello, Bob! You are 25 years old.');
+    });
+
+    test('greet function should handle different persons', () => {
+        const person: Person = { name: 'Alice', age: 30 };
+        const result = greet(person);
+        expect(result).toBe('Hello, Alice! You are 30 years old.');
+    });
+});
@@ -0,0 +1,45 @@
+import React, { useState, useEffect } from 'react';
+import './App.css';
+import UserDashboard from './components/UserDashboard';
+
+interface User {
+  id: number;
+  name: string;
+  email: string;
+  role: string;
+}
+
+const App: React.FC = () => {
+  const [user, setUser] = useState<User | null>(null);
+  const [loading, setLoading] = useState(true);
+
+  useEffect(() => {
+    // Simulate API call
+    setTimeout(() => {
+      setUser({
+        id: 1,
+        name: 'John Doe',
+        email: 'john.doe@example.com',
+        role: 'Admin'
+      });
+      setLoading(false);
+    }, 1000);
+  }, []);
+
+  if (loading) {
+    return <div className="loading">Loading...</div>;
+  }
+
+  return (
+    <div className="App">
+      <header className="App-header">
+        <h1>User Dashboard</h1>
+      </header>
+      <main>
+        {user && <UserDashboard user={user} />}
+      </main>
+    </div>
+  );
+};
+
+export default App;
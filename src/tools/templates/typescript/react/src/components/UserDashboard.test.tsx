@@ -0,0 +1,37 @@
+import React from 'react';
+import { render, screen } from '@testing-library/react';
+import '@testing-library/jest-dom';
+import UserDashboard from './UserDashboard';
+
+const mockUser = {
+  id: 1,
+  name: 'John Doe',
+  email: 'john.doe@example.com',
+  role: 'Admin'
+};
+
+describe('UserDashboard', () => {
+  test('renders user information correctly', () => {
+    render(<UserDashboard user={mockUser} />);
+    
+    expect(screen.getByText('Welcome, John Doe!')).toBeInTheDocument();
+    expect(screen.getByText('john.doe@example.com')).toBeInTheDocument();
+    expect(screen.getByText('Admin')).toBeInTheDocument();
+  });
+
+  test('renders dashboard actions', () => {
+    render(<UserDashboard user={mockUser} />);
+    
+    expect(screen.getByText('Edit Profile')).toBeInTheDocument();
+    expect(screen.getByText('View Settings')).toBeInTheDocument();
+    expect(screen.getByText('Help & Support')).toBeInTheDocument();
+  });
+
+  test('renders dashboard stats', () => {
+    render(<UserDashboard user={mockUser} />);
+    
+    expect(screen.getByText('Active Sessions')).toBeInTheDocument();
+    expect(screen.getByText('Last Login')).toBeInTheDocument();
+    expect(screen.getByText('Account Status')).toBeInTheDocument();
+  });
+});
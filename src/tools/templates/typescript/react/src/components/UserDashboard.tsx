@@ -0,0 +1,50 @@
+import React from 'react';
+
+interface User {
+  id: number;
+  name: string;
+  email: string;
+  role: string;
+}
+
+interface UserDashboardProps {
+  user: User;
+}
+
+const UserDashboard: React.FC<UserDashboardProps> = ({ user }) => {
+  return (
+    <div className="user-dashboard">
+      <div className="user-card">
+        <h2>Welcome, {user.name}!</h2>
+        <div className="user-info">
+          <p><strong>ID:</strong> {user.id}</p>
+          <p><strong>Email:</strong> {user.email}</p>
+          <p><strong>Role:</strong> {user.role}</p>
+        </div>
+      </div>
+      
+      <div className="dashboard-actions">
+        <button className="btn btn-primary">Edit Profile</button>
+        <button className="btn btn-secondary">View Settings</button>
+        <button className="btn btn-info">Help & Support</button>
+      </div>
+      
+      <div className="dashboard-stats">
+        <div className="stat-card">
+          <h3>Active Sessions</h3>
+          <p>2</p>
+        </div>
+        <div className="stat-card">
+          <h3>Last Login</h3>
+          <p>Today, 2:30 PM</p>
+        </div>
+        <div className="stat-card">
+          <h3>Account Status</h3>
+          <p>Active</p>
+        </div>
+      </div>
+    </div>
+  );
+};
+
+export default UserDashboard;